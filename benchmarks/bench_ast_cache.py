@@ -0,0 +1,81 @@
+"""Measures the on-disk AST cache.
+
+Compares a cold parse with a cache hit on a generated program, reports the
+entry size against pickle, and hammers one cache directory from several
+processes with a small size cap to exercise concurrent puts and eviction.
+
+    python -m benchmarks.bench_ast_cache [--functions N] [--workers W]
+"""
+
+import argparse
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+
+from obfuscator.ast_cache import ASTCache
+from obfuscator.fast_parser import parse
+from obfuscator.frontend import parse_file
+from benchmarks.common import generate_program, generated_file, timed
+
+
+def hammer(args):
+    directory, worker, rounds = args
+    cache = ASTCache(directory, max_bytes=4096)
+    sources = [generate_program(n).encode() for n in range(1, 9)]
+    for i in range(rounds):
+        source = sources[(worker + i) % len(sources)]
+        key = cache.key(source, "fast")
+        program = cache.get(key)
+        if program is None:
+            cache.put(key, parse(source.decode()))
+    return cache.hits, cache.misses, cache.evictions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        generated_file(args.functions) as path,
+    ):
+        cache = ASTCache(directory)
+        cold_antlr, program = timed(parse_file, path, "antlr")
+        cold_fast, _ = timed(parse_file, path, "fast")
+        miss_time, _ = timed(parse_file, path, "antlr", "antlr", cache)
+        hit_time, cached = timed(parse_file, path, "antlr", "antlr", cache, repeat=5)
+        if repr(cached) != repr(program):
+            print("[✗] cached AST differs from parsed AST")
+            sys.exit(1)
+
+        (entry,) = os.listdir(directory)
+        entry_size = os.path.getsize(os.path.join(directory, entry))
+        pickle_size = len(pickle.dumps(program, pickle.HIGHEST_PROTOCOL))
+        source_size = os.path.getsize(path)
+        print(f"{args.functions} functions, {source_size:,} source bytes")
+        print(f"  antlr parse          {cold_antlr * 1000:10.1f} ms")
+        print(f"  fast parse           {cold_fast * 1000:10.1f} ms")
+        print(f"  antlr parse + put    {miss_time * 1000:10.1f} ms")
+        print(f"  cache hit            {hit_time * 1000:10.1f} ms")
+        print(f"  entry size           {entry_size:10,} bytes")
+        print(f"  pickle size          {pickle_size:10,} bytes")
+        print(f"  {cache.report()}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        jobs = [(directory, w, args.rounds) for w in range(args.workers)]
+        with multiprocessing.Pool(args.workers) as pool:
+            results = pool.map(hammer, jobs)
+        hits, misses, evictions = (sum(r[i] for r in results) for i in range(3))
+        print(
+            f"\n{args.workers} processes x {args.rounds} lookups, 4 KiB cap: "
+            f"{hits} hit(s), {misses} miss(es), {evictions} eviction(s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
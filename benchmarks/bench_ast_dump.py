@@ -0,0 +1,136 @@
+"""AST dump time: string-concatenating __repr__ against the streaming dump.
+
+Checks that dump() writes exactly what the old recursive _repr returned,
+on the sample inputs after every pass and on a generated program, then
+times both for growing programs, along with depth-limited, per-function
+and compact dumps written straight to a file. The old _repr copies each
+subtree's text once per enclosing node, so the last table uses deeply
+nested expressions, where that copying is quadratic.
+
+    python -m benchmarks.bench_ast_dump [--sizes 100,400,1600]
+"""
+
+import argparse
+import io
+import itertools
+import os
+import random
+import sys
+
+from obfuscator.ast import is_node, iter_fields
+from obfuscator.ast_dump import dump
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.inliner import FunctionInliner
+from obfuscator.name_obfuscator import NameObfuscator
+from benchmarks.common import (
+    generate_expression_program,
+    generate_program,
+    input_files,
+    timed,
+)
+
+
+def concat_repr(node, indent=0):
+    """ASTNode._repr as it was before the streaming dump, but expanding
+    every node as dump does now (it printed Labels and Switches by address)."""
+    pad = "  " * indent
+    result = f"{pad}{node.__class__.__name__}:\n"
+    for k, v in iter_fields(node):
+        result += f"{pad}  {k}: "
+        if is_node(v):
+            result += "\n" + concat_repr(v, indent + 2)
+        elif isinstance(v, list):
+            result += "[\n"
+            for item in v:
+                if is_node(item):
+                    result += concat_repr(item, indent + 3) + "\n"
+                else:
+                    result += "  " * (indent + 3) + repr(item) + "\n"
+            result += pad + "  ]\n"
+        else:
+            result += repr(v) + "\n"
+    return result
+
+
+def transformed(text):
+    random.seed(0)
+    ControlFlowFlattener.id_counter = itertools.count()
+    program = FastParser(text).parse()
+    NameObfuscator().obfuscate(program)
+    DeadCodeInserter().insert(program)
+    ExpressionTransformer().transform(program)
+    ControlFlowFlattener().flatten(program)
+    FunctionInliner(program).inline()
+    return program
+
+
+def streamed(program, **options):
+    out = io.StringIO()
+    dump(program, out, **options)
+    return out.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,400,1600")
+    parser.add_argument("--terms", default="500,1000,2000,4000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sources = [(path, open(path).read()) for path in input_files()]
+    sources.append(("generated", generate_program(50)))
+    failures = 0
+    for label, text in sources:
+        program = transformed(text)
+        ok = streamed(program) == concat_repr(program) == repr(program)
+        failures += not ok
+        print(f"[{'✓' if ok else '✗'}] {label}")
+    if failures:
+        sys.exit(1)
+
+    print(f"\nbest of {args.repeat}, after all passes:")
+    print(
+        f"  {'functions':>9} {'MiB':>6} {'concat':>8} {'dump':>8}"
+        f" {'depth 3':>8} {'1 func':>8} {'compact':>8}"
+    )
+    with open(os.devnull, "w") as devnull:
+        for n in map(int, args.sizes.split(",")):
+            program = transformed(generate_program(n))
+            size = len(streamed(program)) / 2**20
+            first = program.functions[0].name
+            row = [
+                timed(concat_repr, program, repeat=args.repeat)[0],
+                timed(dump, program, devnull, repeat=args.repeat)[0],
+            ]
+            for options in (
+                {"max_depth": 3},
+                {"functions": [first]},
+                {"compact": True},
+            ):
+                seconds, _ = timed(
+                    lambda: dump(program, devnull, **options), repeat=args.repeat
+                )
+                row.append(seconds)
+            print(f"  {n:9} {size:6.1f} " + " ".join(f"{s:7.3f}s" for s in row))
+
+    # concat_repr recurses once per level
+    sys.setrecursionlimit(100_000)
+    print(f"\nbest of {args.repeat}, one expression of N terms per function:")
+    print(f"  {'terms':>9} {'MiB':>6} {'concat':>8} {'dump':>8}  speedup")
+    with open(os.devnull, "w") as devnull:
+        for terms in map(int, args.terms.split(",")):
+            program = FastParser(generate_expression_program(2, terms)).parse()
+            size = len(streamed(program)) / 2**20
+            before, _ = timed(concat_repr, program, repeat=args.repeat)
+            after, _ = timed(dump, program, devnull, repeat=args.repeat)
+            print(
+                f"  {terms:9} {size:6.1f} {before:7.3f}s {after:7.3f}s"
+                f"  {before / after:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compares peak memory of the visitor and listener AST builders.
+
+Checks that building the AST with an ASTListener during the parse gives
+the same AST as ASTBuilder on the full parse tree, then parses a large
+generated program in child processes with each builder and reports wall
+time and peak RSS.
+
+    python -m benchmarks.bench_ast_listener [--megabytes M]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from obfuscator.frontend import parse_antlr
+from benchmarks.common import generate_function, generated_file, input_files
+
+BUILDERS = ["visitor", "listener"]
+
+
+def peak_rss():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(*args):
+    cmd = [sys.executable, "-m", "benchmarks.bench_ast_listener", "--child", *args]
+    return [float(v) for v in subprocess.check_output(cmd).split()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=2.0)
+    parser.add_argument("--child", choices=[*BUILDERS, "none"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == "none":
+        print(0.0, peak_rss())
+        return
+    if args.child:
+        start = time.perf_counter()
+        parse_antlr(args.path, builder=args.child)
+        print(time.perf_counter() - start, peak_rss())
+        return
+
+    n_functions = int(args.megabytes * 2**20 / len(generate_function(1)))
+    with generated_file(50) as path:
+        paths = input_files() + [path]
+        for p in paths:
+            if repr(parse_antlr(p)) != repr(parse_antlr(p, builder="listener")):
+                print(f"[✗] listener AST differs on {p}")
+                sys.exit(1)
+    print("[✓] listener and visitor build identical ASTs")
+
+    with generated_file(n_functions) as path:
+        size = os.path.getsize(path) / 2**20
+        # Children inherit the parent's resident pages in ru_maxrss
+        _, base = run_child("none")
+        print(f"input {size:.1f} MiB, interpreter baseline {base:.1f} MiB")
+        print(f"{'builder':>10} {'time':>9} {'peak RSS':>11}")
+        for builder in BUILDERS:
+            elapsed, rss = run_child(builder, "--path", path)
+            print(f"{builder:>10} {elapsed:>8.2f}s {rss:>8.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measures AST memory with slotted node classes against per-instance dicts.
+
+Builds the AST of a generated program, grows it with ExpressionTransformer
+and FunctionInliner, and reports node count, total size and bytes per
+node. The same tree is rebuilt from classes with the same constructors but
+no __slots__, which is the layout the nodes had before.
+
+    python -m benchmarks.bench_ast_memory [--functions N]
+"""
+
+import argparse
+import random
+import tracemalloc
+
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.inliner import FunctionInliner
+from benchmarks.common import NODE_CLASSES, encode_tuples, generate_program
+
+# Same constructors, but instances carry a __dict__
+_DICT_CLASSES = [
+    type(cls.__name__, (), {"__init__": cls.__init__}) for cls in NODE_CLASSES
+]
+
+
+def build(data, classes):
+    if isinstance(data, tuple):
+        return classes[data[0]](*[build(v, classes) for v in data[1:]])
+    if isinstance(data, list):
+        return [build(item, classes) for item in data]
+    return data
+
+
+def count_nodes(data) -> int:
+    if isinstance(data, tuple):
+        return 1 + sum(count_nodes(v) for v in data[1:])
+    if isinstance(data, list):
+        return sum(count_nodes(item) for item in data)
+    return 0
+
+
+def traced_size(data, classes) -> int:
+    """Bytes allocated for the nodes and their lists; leaf values are shared."""
+    tracemalloc.start()
+    try:
+        tree = build(data, classes)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del tree
+    return size
+
+
+def report(label, program):
+    data = encode_tuples(program)
+    nodes = count_nodes(data)
+    print(f"{label}: {nodes:,} nodes")
+    sizes = {}
+    for name, classes in (("__dict__", _DICT_CLASSES), ("__slots__", NODE_CLASSES)):
+        sizes[name] = traced_size(data, classes)
+        print(
+            f"  {name:10} {sizes[name] / 2**20:8.1f} MiB"
+            f"  {sizes[name] / nodes:6.1f} bytes/node"
+        )
+    print(f"  saved      {1 - sizes['__slots__'] / sizes['__dict__']:8.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    program = FastParser(generate_program(args.functions)).parse()
+    report(f"parsed ({args.functions} functions)", program)
+    ExpressionTransformer().transform(program)
+    FunctionInliner(program).inline()
+    report("after expr + inline", program)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Generic walks over declared child fields against reflection on __slots__.
+
+Runs every pass over a generated program, so the tree has Switch, Label
+and Goto nodes too, then times NodeVisitor's generic walk as it was (all
+of __slots__, each value tested for a __slots__ attribute) and as it is
+(the child fields declared in obfuscator.ast), a plain iter_children
+walk and an identity NodeTransformer. Checks that both walks reach the
+same nodes on every input after each pass, that the declarations match
+what the fields hold, and that NodeTransformer rewrites children before
+parents and left to right, at any depth.
+
+    python -m benchmarks.bench_children [--functions N] [--repeat N]
+"""
+
+import argparse
+import gc
+import itertools
+import random
+import sys
+import time
+from collections import Counter
+
+from obfuscator import ast
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.inliner import FunctionInliner
+from obfuscator.name_obfuscator import NameObfuscator
+from obfuscator.visitor import NodeTransformer, NodeVisitor
+from benchmarks.bench_deep_nesting import chain_program
+from benchmarks.common import generate_program, input_files
+
+PASSES = [
+    lambda program: NameObfuscator().obfuscate(program),
+    lambda program: DeadCodeInserter().insert(program),
+    lambda program: ExpressionTransformer().transform(program),
+    lambda program: ControlFlowFlattener().flatten(program),
+    lambda program: FunctionInliner(program).inline(),
+]
+
+
+def best(fn, repeat):
+    """Least CPU time of fn() over repeat runs with gc disabled."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.disable()
+        start = time.process_time()
+        fn()
+        elapsed = min(elapsed, time.process_time() - start)
+        gc.enable()
+    return elapsed
+
+
+class Collector(NodeVisitor):
+    def __init__(self):
+        self.seen = []
+
+    def generic_visit(self, node):
+        self.seen.append(node)
+        return NodeVisitor.generic_visit(self, node)
+
+
+class ReflectiveCollector(Collector):
+    """Collector with NodeVisitor.generic_visit as it was."""
+
+    def generic_visit(self, node):
+        self.seen.append(node)
+        if not hasattr(node, "__slots__"):
+            return None
+        children = []
+        for _, value in iter_fields(node):
+            if isinstance(value, list):
+                children.extend(v for v in value if hasattr(v, "__slots__"))
+            elif hasattr(value, "__slots__"):
+                children.append(value)
+        return children
+
+
+def children_walk(program):
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        stack.extend(iter_children(node))
+
+
+class Recorder(NodeTransformer):
+    def __init__(self):
+        self.order = []
+
+    def generic_visit(self, node):
+        self.order.append(node)
+        return node
+
+
+class BinaryOpCopier(NodeTransformer):
+    def visit_BinaryOp(self, node):
+        return BinaryOp(node.op, node.left, node.right)
+
+
+def reached(program, collector_class):
+    collector = collector_class()
+    collector.visit(program)
+    return Counter(id(node) for node in collector.seen)
+
+
+def declarations_ok(programs) -> bool:
+    """Every node class declares child fields among its __slots__, and
+    the fields it leaves out never hold nodes."""
+    classes = [
+        cls
+        for cls in vars(ast).values()
+        if isinstance(cls, type) and "__init__" in vars(cls)
+    ]
+    if not all(set(cls._child_fields) <= set(cls.__slots__) for cls in classes):
+        return False
+    for program in programs:
+        stack = [program]
+        while stack:
+            node = stack.pop()
+            for name, value in iter_fields(node):
+                if name in type(node)._child_fields:
+                    continue
+                if is_node(value) or (type(value) is list and any(map(is_node, value))):
+                    return False
+            stack.extend(iter_children(node))
+    return True
+
+
+def postorder_ok(program) -> bool:
+    """A Recorder sees each node after its children, and the leaves in
+    the order a preorder walk finds them."""
+    recorder = Recorder()
+    recorder.visit(program)
+    position = {}
+    for i, node in enumerate(recorder.order):
+        position.setdefault(id(node), i)
+        if any(position.get(id(child), i) >= i for child in iter_children(node)):
+            return False
+    leaves = []
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        if type(node) is Variable or type(node) is Literal:
+            leaves.append(node)
+        stack.extend(reversed(list(iter_children(node))))
+    recorded = [n for n in recorder.order if type(n) in (Variable, Literal)]
+    return recorded == leaves
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    ControlFlowFlattener.id_counter = itertools.count()
+    program = FastParser(generate_program(args.functions)).parse()
+    for run in PASSES:
+        run(program)
+    print(f"{args.functions} functions after every pass")
+    rows = [
+        ("reflective walk", lambda: ReflectiveCollector().visit(program)),
+        ("child fields walk", lambda: Collector().visit(program)),
+        ("iter_children", lambda: children_walk(program)),
+        ("NodeTransformer", lambda: NodeTransformer().visit(program)),
+    ]
+    for label, fn in rows:
+        print(f"  {label:<20} {best(fn, args.repeat) * 1000:>8.1f}ms")
+
+    programs = []
+    for path in input_files():
+        with open(path) as f:
+            text = f.read()
+        ControlFlowFlattener.id_counter = itertools.count()
+        tree = FastParser(text).parse()
+        programs.append(tree.clone())
+        for run in PASSES:
+            run(tree)
+            programs.append(tree.clone())
+    programs.append(program)
+
+    print()
+    same_ok = all(
+        reached(p, Collector) == reached(p, ReflectiveCollector) for p in programs
+    )
+    kinds = Counter()
+    for p in programs:
+        collector = Collector()
+        collector.visit(p)
+        kinds.update(type(n).__name__ for n in collector.seen)
+    kinds_ok = all(kinds[name] for name in ("Switch", "SwitchCase", "Label", "Goto"))
+    print(
+        f"  [{'✓' if same_ok and kinds_ok else '✗'}] both walks reach the same"
+        f" nodes, Switch, SwitchCase, Label and Goto included ({len(programs)} trees)"
+    )
+    decl_ok = declarations_ok(programs)
+    print(f"  [{'✓' if decl_ok else '✗'}] undeclared fields never hold nodes")
+    order_ok = all(postorder_ok(p) for p in programs)
+    print(f"  [{'✓' if order_ok else '✗'}] rewrites go children first, left to right")
+
+    chain = FastParser(chain_program(100_000)).parse()
+    before = CodeGenerator().generate(chain)
+    collector = Collector()
+    collector.visit(chain)
+    # Kept alive, so no new node can reuse their ids
+    old_nodes = [n for n in collector.seen if type(n) is BinaryOp]
+    old = {id(n) for n in old_nodes}
+    rewritten = BinaryOpCopier().visit(chain)
+    collector = Collector()
+    collector.visit(rewritten)
+    chain_ok = CodeGenerator().generate(rewritten) == before and not any(
+        id(n) in old for n in collector.seen if type(n) is BinaryOp
+    )
+    print(
+        f"  [{'✓' if chain_ok else '✗'}] every BinaryOp of a 100,000-term chain replaced"
+    )
+
+    if not (same_ok and kinds_ok and decl_ok and order_ok and chain_ok):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Deeply nested programs through every pass, at the default recursion limit.
+
+The first table parses a function returning a+a+...+a, which both
+frontends nest one BinaryOp per term, then times each pass and the code
+generator over it. (Neither parser can read the C back: both still
+recurse once per parenthesis.) The second builds loops nested inside each
+other directly, since both parsers also recurse once per nested block,
+and times the passes over them. Code generation indents every line by
+its depth, so its output, and time, grow with the square of the depth;
+it is run on a shallower nest. tests/test_deep_nesting.py checks the
+results at smaller depths.
+
+    python -m benchmarks.bench_deep_nesting [--terms N] [--depth N]
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.frontend import parse_antlr
+from obfuscator.inliner import FunctionInliner
+from obfuscator.name_obfuscator import NameObfuscator
+from benchmarks.common import generated_file
+
+
+def chain_program(terms: int) -> str:
+    chain = " + ".join(["a"] * terms)
+    return f"""int f(int a) {{
+    return {chain};
+}}
+
+int main() {{
+    int r = f(1);
+    printf("%d\\n", r);
+    return 0;
+}}
+"""
+
+
+def nested_loops(depth: int) -> Program:
+    """main() with depth while loops, each inside the last one's Block."""
+    body = Block([Assignment(Variable("x"), BinaryOp("+", Variable("x"), Literal(1)))])
+    for i in range(depth):
+        condition = BinaryOp("<", Variable("x"), Literal(i))
+        body = WhileStmt(
+            condition, Block([body, IfStmt(Variable("x"), Block([]), None)])
+        )
+    main = Function(
+        "int",
+        "main",
+        [],
+        [VariableDecl("int", "x", Literal(0)), body, Return(Variable("x"))],
+    )
+    return Program([main])
+
+
+PASSES = [
+    ("rename", lambda program: NameObfuscator().obfuscate(program)),
+    ("dead code", lambda program: DeadCodeInserter().insert(program)),
+    ("expressions", lambda program: ExpressionTransformer().transform(program)),
+    ("flatten", lambda program: ControlFlowFlattener().flatten(program)),
+    ("inline", lambda program: FunctionInliner(program).inline()),
+]
+
+
+def seconds(fn, *args):
+    start = time.process_time()
+    result = fn(*args)
+    return time.process_time() - start, result
+
+
+def row(label, elapsed):
+    print(f"  {label:>12} {elapsed:8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=100_000)
+    parser.add_argument("--depth", type=int, default=100_000)
+    parser.add_argument("--codegen-depth", type=int, default=2_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    ControlFlowFlattener.id_counter = itertools.count()
+    print(f"recursion limit {sys.getrecursionlimit()}")
+
+    print(f"\na+a+...+a with {args.terms:,} terms:")
+    text = chain_program(args.terms)
+    elapsed, program = seconds(FastParser(text).parse)
+    row("fast parse", elapsed)
+    with generated_file(args.terms, chain_program) as path:
+        row("antlr parse", seconds(parse_antlr, path)[0])
+    row("codegen", seconds(CodeGenerator().generate, program)[0])
+    for label, run in PASSES:
+        row(label, seconds(run, program)[0])
+    row("codegen", seconds(CodeGenerator().generate, program)[0])
+
+    print(f"\nwhile loops nested {args.depth:,} deep:")
+    program = nested_loops(args.depth)
+    for label, run in PASSES:
+        row(label, seconds(run, program)[0])
+    program = nested_loops(args.codegen_depth)
+    for label, run in PASSES:
+        run(program)
+    elapsed, code = seconds(CodeGenerator().generate, program)
+    row(f"codegen {args.codegen_depth:,}", elapsed)
+    print(f"  {len(code) / 2**20:.1f} MiB of C at depth {args.codegen_depth:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Measures cold versus warm-start parse latency with a persisted DFA cache.
+
+Every file is parsed in a fresh process, once with empty DFAs and once
+after loading a DFA cache written by a training run over all inputs.
+Reports the load time, the ANTLR lex+parse time and the process wall time,
+and checks that both runs build the same AST.
+
+    python -m benchmarks.bench_dfa_cache [--repeat N]
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from obfuscator.dfa_cache import DFACache
+from obfuscator.frontend import parse_antlr
+from benchmarks.common import generated_file, input_files
+
+
+def child(paths, cache_path, save):
+    start = time.perf_counter()
+    cache = DFACache(cache_path) if cache_path else None
+    if cache is not None and not save and not cache.load():
+        sys.exit("DFA cache did not load")
+    load_time = time.perf_counter() - start
+    for path in paths:
+        start = time.perf_counter()
+        program = parse_antlr(path)
+        parse_time = time.perf_counter() - start
+        digest = hashlib.sha256(repr(program).encode()).hexdigest()[:16]
+        print(load_time, parse_time, digest)
+    if save:
+        cache.save()
+
+
+def run_child(paths, cache_path=None, save=False):
+    cmd = [sys.executable, "-m", "benchmarks.bench_dfa_cache", "--child", *paths]
+    if cache_path:
+        cmd += ["--cache", cache_path]
+    if save:
+        cmd.append("--save")
+    start = time.perf_counter()
+    out = subprocess.check_output(cmd, text=True)
+    wall = time.perf_counter() - start
+    load_time, parse_time, digest = out.split()
+    return float(load_time), float(parse_time), wall, digest
+
+
+def best(runs):
+    """Per-column minimum of run_child results."""
+    load_time, parse_time, wall, digests = zip(*runs)
+    return min(load_time), min(parse_time), min(wall), digests[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs="+", help=argparse.SUPPRESS)
+    parser.add_argument("--cache", help=argparse.SUPPRESS)
+    parser.add_argument("--save", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.cache, args.save)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp, generated_file(200) as generated:
+        paths = input_files() + [generated]
+        cache_path = os.path.join(tmp, "dfa.cache")
+        cmd = [sys.executable, "-m", "benchmarks.bench_dfa_cache", "--child"]
+        subprocess.check_output(cmd + paths + ["--cache", cache_path, "--save"])
+        print(f"DFA cache: {os.path.getsize(cache_path) / 1024:.1f} KiB")
+
+        print(
+            f"{'file':>16} {'cold parse':>11} {'warm parse':>11} {'load':>8} "
+            f"{'cold wall':>10} {'warm wall':>10}"
+        )
+        for path in paths:
+            cold = best([run_child([path]) for _ in range(args.repeat)])
+            warm = best([run_child([path], cache_path) for _ in range(args.repeat)])
+            if cold[3] != warm[3]:
+                print(f"[✗] AST differs with a warm DFA on {path}")
+                sys.exit(1)
+            name = "generated.mc" if path == generated else os.path.basename(path)
+            print(
+                f"{name:>16} {cold[1] * 1000:>9.1f}ms {warm[1] * 1000:>9.1f}ms "
+                f"{warm[0] * 1000:>6.1f}ms {cold[2] * 1000:>8.0f}ms "
+                f"{warm[2] * 1000:>8.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
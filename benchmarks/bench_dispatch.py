@@ -0,0 +1,148 @@
+"""Per-node dispatch cost: an isinstance chain against obfuscator.visitor.
+
+Both dispatchers route each statement class to a handler that does
+nothing, in the order CodeGenerator.visit used to test them, so the
+chain's cost grows with a class's position while the cached table's
+does not. Reported per class, then over every node of a generated
+program after all passes.
+
+    python -m benchmarks.bench_dispatch [--functions N] [--repeat R]
+"""
+
+import argparse
+import itertools
+import random
+
+from obfuscator.ast import *
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.function_filter import RawFunction
+from obfuscator.visitor import dispatch
+from benchmarks.common import generate_program, timed
+
+# CodeGenerator.visit's former isinstance order
+CHAIN = [
+    Program,
+    RawFunction,
+    Function,
+    VariableDecl,
+    Assignment,
+    Return,
+    IfStmt,
+    WhileStmt,
+    ForStmt,
+    Block,
+    ExpressionStmt,
+    Print,
+    Label,
+    Goto,
+    Switch,
+]
+
+
+def chain_visit(node):
+    if isinstance(node, Program):
+        return 0
+    elif isinstance(node, RawFunction):
+        return 1
+    elif isinstance(node, Function):
+        return 2
+    elif isinstance(node, VariableDecl):
+        return 3
+    elif isinstance(node, Assignment):
+        return 4
+    elif isinstance(node, Return):
+        return 5
+    elif isinstance(node, IfStmt):
+        return 6
+    elif isinstance(node, WhileStmt):
+        return 7
+    elif isinstance(node, ForStmt):
+        return 8
+    elif isinstance(node, Block):
+        return 9
+    elif isinstance(node, ExpressionStmt):
+        return 10
+    elif isinstance(node, Print):
+        return 11
+    elif isinstance(node, Label):
+        return 12
+    elif isinstance(node, Goto):
+        return 13
+    elif isinstance(node, Switch):
+        return 14
+    else:
+        return -1
+
+
+class TableVisitor:
+    visit = dispatch("visit_", "generic_visit")
+
+    def generic_visit(self, node):
+        return -1
+
+
+for _position, _cls in enumerate(CHAIN):
+    setattr(TableVisitor, f"visit_{_cls.__name__}", lambda self, node, p=_position: p)
+
+
+def sample(cls):
+    """An instance of cls; its fields are never read."""
+    return cls.__new__(cls)
+
+
+def all_nodes(program):
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(iter_children(node))
+
+
+def per_node(fn, nodes, repeat):
+    def run():
+        for node in nodes:
+            fn(node)
+
+    seconds, _ = timed(run, repeat=repeat)
+    return seconds / len(nodes) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    visitor = TableVisitor()
+    for cls in CHAIN:
+        node = sample(cls)
+        assert chain_visit(node) == visitor.visit(node), cls.__name__
+
+    print(f"ns per node, best of {args.repeat}:")
+    print(f"  {'class':>14} {'position':>8} {'isinstance':>10} {'dispatch':>9}")
+    for position, cls in enumerate(CHAIN):
+        nodes = [sample(cls)] * 100_000
+        chain = per_node(chain_visit, nodes, args.repeat)
+        table = per_node(visitor.visit, nodes, args.repeat)
+        print(f"  {cls.__name__:>14} {position:8} {chain:10.0f} {table:9.0f}")
+
+    random.seed(0)
+    ControlFlowFlattener.id_counter = itertools.count()
+    program = FastParser(generate_program(args.functions)).parse()
+    DeadCodeInserter().insert(program)
+    ExpressionTransformer().transform(program)
+    ControlFlowFlattener().flatten(program)
+    nodes = list(all_nodes(program))
+    chain = per_node(chain_visit, nodes, args.repeat)
+    table = per_node(visitor.visit, nodes, args.repeat)
+    print(
+        f"\nall {len(nodes):,} nodes of a {args.functions}-function program: "
+        f"{chain:.0f} ns isinstance, {table:.0f} ns dispatch"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Cost of structural fingerprints next to parsing the same program.
+
+Times fingerprinting every function of a generated program the first time
+(cold) and again from the memos (warm), against parsing it with either
+frontend. Then checks that both frontends' trees, a clone and another
+process with a different PYTHONHASHSEED agree on the fingerprints, and
+that after a pass each function's memo matches a fresh computation.
+
+    python -m benchmarks.bench_fingerprint [--functions N] [--repeat N]
+"""
+
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import time
+
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.fingerprint import fingerprint
+from obfuscator.frontend import parse_antlr
+from benchmarks.common import generate_program, generated_file
+
+
+def best(fn, repeat, setup=None):
+    """Least CPU time of fn(setup()) over repeat runs, with gc disabled."""
+    times = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        gc.disable()
+        start = time.process_time()
+        fn(arg)
+        times.append(time.process_time() - start)
+        gc.enable()
+    return min(times)
+
+
+def all_fingerprints(program):
+    return [fingerprint(func) for func in program.functions]
+
+
+def other_process(n: int):
+    """The fingerprints computed by a fresh interpreter."""
+    code = (
+        "from obfuscator.fast_parser import FastParser\n"
+        "from obfuscator.fingerprint import fingerprint\n"
+        "from benchmarks.common import generate_program\n"
+        f"program = FastParser(generate_program({n})).parse()\n"
+        "print(*(fingerprint(f) for f in program.functions))\n"
+    )
+    env = dict(os.environ, PYTHONHASHSEED="12345")
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    return [int(word) for word in out.stdout.split()]
+
+
+def check(label, ok):
+    print(f"  [{'✓' if ok else '✗'}] {label}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = generate_program(args.functions)
+    parse = lambda _: FastParser(text).parse()
+    fast_parse = best(parse, args.repeat)
+    with generated_file(args.functions) as path:
+        antlr_parse = best(lambda _: parse_antlr(path), 1)
+        reference = parse_antlr(path)
+    cold = best(all_fingerprints, args.repeat, lambda: parse(None))
+    program = parse(None)
+    fingerprints = all_fingerprints(program)
+    warm = best(lambda _: all_fingerprints(program), args.repeat)
+
+    print(f"{args.functions} functions, {len(text) / 1024:.0f} KiB of source")
+    print(f"  fast parse        {fast_parse * 1000:9.1f} ms")
+    print(f"  antlr parse       {antlr_parse * 1000:9.1f} ms")
+    print(
+        f"  fingerprint, cold {cold * 1000:9.1f} ms"
+        f"  ({cold / fast_parse:.0%} of fast parse,"
+        f" {cold / antlr_parse:.1%} of antlr parse)"
+    )
+    print(f"  fingerprint, warm {warm * 1000:9.1f} ms")
+
+    ok = check(
+        "both frontends give the same fingerprints",
+        all_fingerprints(reference) == fingerprints,
+    )
+    ok &= check(
+        "a clone has the same fingerprints",
+        all_fingerprints(program.clone()) == fingerprints,
+    )
+    ok &= check(
+        "another process gives the same fingerprints",
+        other_process(args.functions) == fingerprints,
+    )
+    ExpressionTransformer().transform(program)
+    memoized = all_fingerprints(program)
+    fresh = all_fingerprints(program.clone())
+    ok &= check("memos are invalidated by passes", memoized == fresh)
+    ok &= check(
+        "transformed functions change fingerprint",
+        sum(a != b for a, b in zip(memoized, fingerprints)) > 0,
+    )
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
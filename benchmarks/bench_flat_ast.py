@@ -0,0 +1,203 @@
+"""Compares the flat struct-of-arrays AST with the object tree.
+
+Checks that FlatAST round-trips the AST of every input and of a generated
+program (also after all passes), and that expressions printed from the
+flat store match CodeGenerator. Then reports memory and the time of a
+full preorder walk, collecting variable names and renaming them.
+
+    python -m benchmarks.bench_flat_ast [--functions N] [--repeat R]
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import tracemalloc
+
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.flat_ast import KINDS, OPERATORS, FlatAST
+from obfuscator.inliner import FunctionInliner
+from benchmarks.common import encode_tuples, generate_program, input_files, timed
+
+VARIABLE = KINDS[Variable]
+
+
+def all_passes(program):
+    random.seed(0)
+    ControlFlowFlattener.id_counter = itertools.count()
+    DeadCodeInserter().insert(program)
+    ExpressionTransformer().transform(program)
+    ControlFlowFlattener().flatten(program)
+    FunctionInliner(program).inline()
+    return program
+
+
+def flat_expr(flat, index):
+    """CodeGenerator.visit_expr ported to the flat store."""
+    cls = flat.node_class(index)
+    if cls is Literal:
+        value = flat.scalar(index, "value")
+        if isinstance(value, str):
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+            return '"' + escaped.replace("\n", "\\n") + '"'
+        return str(value)
+    if cls is Variable:
+        return flat.scalar(index, "name")
+    if cls is BinaryOp:
+        left = flat_expr(flat, flat.child(index, "left"))
+        right = flat_expr(flat, flat.child(index, "right"))
+        return f"({left} {OPERATORS[flat.op_code(index)]} {right})"
+    if cls is UnaryOp:
+        operand = flat_expr(flat, flat.child(index, "operand"))
+        return f"({OPERATORS[flat.op_code(index)]}{operand})"
+    if cls is FuncCall:
+        args = ", ".join(flat_expr(flat, arg) for arg in flat.children(index, "args"))
+        return f"{flat.scalar(index, 'name')}({args})"
+    if cls is Assignment:
+        value = flat_expr(flat, flat.child(index, "value"))
+        return f"{flat.scalar(index, 'target')} = {value}"
+    return f"/* Unknown expr: {cls.__name__} */"
+
+
+def check(program) -> bool:
+    flat = FlatAST.from_tree(program)
+    if encode_tuples(flat.to_tree()) != encode_tuples(program):
+        return False
+    generator = CodeGenerator()
+    # Assignment targets may be Variables after flattening; skip those
+    for index in flat.walk():
+        cls = flat.node_class(index)
+        if cls in (BinaryOp, UnaryOp, FuncCall):
+            expected = generator.visit_expr(flat.to_tree(index))
+            if "=" not in expected and flat_expr(flat, index) != expected:
+                return False
+    return True
+
+
+def tree_walk(program):
+    count = 0
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(iter_children(node))
+    return count
+
+
+def tree_nodes(program):
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(iter_children(node))
+
+
+def tree_names(program):
+    return {node.name for node in tree_nodes(program) if type(node) is Variable}
+
+
+def flat_names(flat):
+    name_ids = flat.fields
+    offsets = flat.offsets
+    ids = {
+        name_ids[offsets[i]] for i, kind in enumerate(flat.kinds) if kind == VARIABLE
+    }
+    return {flat.decode(value) for value in ids}
+
+
+def tree_rename(program, name_map):
+    for node in tree_nodes(program):
+        if type(node) is Variable:
+            node.name = name_map.get(node.name, node.name)
+
+
+def flat_rename(flat, name_map):
+    # Names are interned: map each old string ID to its replacement once
+    new_ids = {}
+    for name, new_name in name_map.items():
+        if name in flat.string_ids:
+            new_ids[flat.encode_scalar(name)] = flat.encode_scalar(new_name)
+    fields = flat.fields
+    offsets = flat.offsets
+    for i, kind in enumerate(flat.kinds):
+        if kind == VARIABLE:
+            k = offsets[i]
+            fields[k] = new_ids.get(fields[k], fields[k])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    failures = 0
+    for path in input_files():
+        with open(path) as f:
+            text = f.read()
+        for label, program in (
+            ("parsed", FastParser(text).parse()),
+            ("all passes", all_passes(FastParser(text).parse())),
+        ):
+            ok = check(program)
+            failures += not ok
+            print(f"[{'✓' if ok else '✗'}] {path} ({label})")
+    ok = check(all_passes(FastParser(generate_program(100)).parse()))
+    failures += not ok
+    print(f"[{'✓' if ok else '✗'}] generated program (all passes)")
+    if failures:
+        sys.exit(1)
+
+    text = generate_program(args.functions)
+    tracemalloc.start()
+    program = FastParser(text).parse()
+    tree_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    flat = FlatAST.from_tree(program)
+    flat_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # The table shares the tree's string objects; count one copy of each
+    flat_bytes += sum(sys.getsizeof(s) for s in flat.strings)
+    nodes = len(flat)
+    print(f"\n{args.functions} functions, {nodes:,} nodes")
+    print(
+        f"  object tree {tree_bytes / 2**20:8.1f} MiB  {tree_bytes / nodes:6.1f} B/node"
+    )
+    print(
+        f"  flat store  {flat_bytes / 2**20:8.1f} MiB  {flat_bytes / nodes:6.1f} B/node"
+    )
+    print(f"  (arrays alone {flat.nbytes() / nodes:.1f} B/node)")
+
+    name_map = {name: name + "_r" for name in tree_names(program)}
+    print(f"\nbest of {args.repeat}:")
+    runs = [
+        ("preorder walk", tree_walk, (program,), lambda: sum(1 for _ in flat.walk())),
+        ("index scan", None, None, lambda: sum(1 for _ in range(len(flat.kinds)))),
+        ("variable names", tree_names, (program,), lambda: flat_names(flat)),
+        (
+            "rename",
+            tree_rename,
+            (program, name_map),
+            lambda: flat_rename(flat, name_map),
+        ),
+    ]
+    for label, tree_fn, tree_args, flat_fn in runs:
+        line = f"  {label:15}"
+        if tree_fn is not None:
+            seconds, _ = timed(tree_fn, *tree_args, repeat=args.repeat)
+            line += f"  tree {seconds * 1000:8.1f} ms"
+        else:
+            line += " " * 19
+        seconds, _ = timed(flat_fn, repeat=args.repeat)
+        line += f"  flat {seconds * 1000:8.1f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measures incremental reparsing after a one-function edit.
+
+For growing generated programs, times a full fast parse, the first
+(cold) incremental parse and an incremental parse after editing a single
+function, and checks the incremental AST matches a full parse.
+
+    python -m benchmarks.bench_incremental [--sizes N,N,...]
+"""
+
+import argparse
+import sys
+
+from obfuscator.fast_parser import parse
+from obfuscator.incremental import IncrementalParser
+from benchmarks.common import generate_program, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000")
+    args = parser.parse_args()
+
+    print(
+        f"{'functions':>10} {'full':>10} {'cold':>10} {'edit':>10} "
+        f"{'edit/copy':>10} {'reparsed':>9}"
+    )
+    for n in (int(s) for s in args.sizes.split(",")):
+        text = generate_program(n)
+        middle = f"int f{n // 2}("
+        edited = text.replace(
+            middle + "int a, int b) {", middle + "int a, int b) {\n    a = a + 1;", 1
+        )
+
+        full_time, full = timed(parse, edited)
+        incremental = IncrementalParser(copy=False)
+        cold_time, _ = timed(incremental.parse, text)
+        edit_time, program = timed(incremental.parse, edited)
+        copying = IncrementalParser()
+        copying.parse(text)
+        copy_time, copied = timed(copying.parse, edited)
+        if repr(program) != repr(full) or repr(copied) != repr(full):
+            print(f"[✗] incremental AST differs from full parse ({n} functions)")
+            sys.exit(1)
+        print(
+            f"{n:>10} {full_time * 1000:>8.1f}ms {cold_time * 1000:>8.1f}ms "
+            f"{edit_time * 1000:>8.1f}ms {copy_time * 1000:>8.1f}ms "
+            f"{incremental.parsed:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Inliner throughput with node.clone() against copy.deepcopy.
+
+FunctionInliner copies the callee body at every call site. This checks
+that copying with the clone protocol gives the same output as deepcopy on
+the sample inputs (after all other passes) and on a generated program,
+then reports inlined call sites per second for growing callee sizes.
+
+    python -m benchmarks.bench_inliner_clone [--callers N] [--calls K]
+"""
+
+import argparse
+import copy
+import itertools
+import random
+import sys
+
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.inliner import FunctionInliner
+from benchmarks.common import generate_inline_program, input_files, timed
+
+
+class DeepcopyInliner(FunctionInliner):
+    """The inliner as it copied callee bodies before the clone protocol."""
+
+    def _copy_body(self, func):
+        return copy.deepcopy(func.body)
+
+
+def prepare(text, passes):
+    random.seed(0)
+    ControlFlowFlattener.id_counter = itertools.count()
+    program = FastParser(text).parse()
+    if passes:
+        DeadCodeInserter().insert(program)
+        ExpressionTransformer().transform(program)
+        ControlFlowFlattener().flatten(program)
+    return program
+
+
+def inline(inliner_class, program):
+    inliner = inliner_class(program)
+    inliner.inline()
+    return CodeGenerator().generate(program)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sources = [(path, open(path).read(), True) for path in input_files()]
+    sources.append(("generated", generate_inline_program(20, 5, 4), False))
+    failures = 0
+    for label, text, passes in sources:
+        expected = inline(DeepcopyInliner, prepare(text, passes))
+        ok = inline(FunctionInliner, prepare(text, passes)) == expected
+        failures += not ok
+        print(f"[{'✓' if ok else '✗'}] {label}")
+    if failures:
+        sys.exit(1)
+
+    sites = args.callers * args.calls
+    print(f"\n{sites:,} call sites, best of {args.repeat}:")
+    print(f"  {'callee stmts':>12} {'deepcopy':>14} {'clone':>14}  speedup")
+    for callee_size in (1, 4, 16, 64):
+        text = generate_inline_program(args.callers, args.calls, callee_size)
+        rates = []
+        for inliner_class in (DeepcopyInliner, FunctionInliner):
+            best = float("inf")
+            for _ in range(args.repeat):
+                program = FastParser(text).parse()
+                seconds, _ = timed(inliner_class(program).inline)
+                best = min(best, seconds)
+            rates.append(sites / best)
+        print(
+            f"  {callee_size + 2:12} {rates[0]:10,.0f}/s {rates[1]:10,.0f}/s"
+            f"  {rates[1] / rates[0]:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
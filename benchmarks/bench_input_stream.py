@@ -0,0 +1,102 @@
+"""Compares peak RSS of antlr4.FileStream and MappedFileStream.
+
+Each stream is opened in a fresh child process on the same generated input
+and every character is read through LA()/consume(), the interface the
+lexer uses; with --lex the generated ANTLR lexer is run over the whole
+stream instead (tokens are discarded, so only the stream stays resident).
+Also checks that both streams yield the same tokens on the bundled inputs.
+
+    python -m benchmarks.bench_input_stream [--megabytes M] [--lex]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from antlr4 import CommonTokenStream, FileStream, Token
+
+from obfuscator.input_stream import MappedFileStream
+from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
+from benchmarks.common import generate_function, generate_program, input_files
+
+STREAMS = {"file": FileStream, "mapped": MappedFileStream}
+
+
+def token_keys(stream):
+    tokens = CommonTokenStream(ObfuMiniCLexer(stream))
+    tokens.fill()
+    return [(t.type, t.text, t.line, t.column, t.start, t.stop) for t in tokens.tokens]
+
+
+def child(kind, path, lex):
+    start = time.perf_counter()
+    stream = STREAMS[kind](path)
+    if lex:
+        lexer = ObfuMiniCLexer(stream)
+        while lexer.nextToken().type != Token.EOF:
+            pass
+    else:
+        while stream.LA(1) != Token.EOF:
+            stream.consume()
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{elapsed} {rss}")
+
+
+def run_child(*args):
+    cmd = [sys.executable, "-m", "benchmarks.bench_input_stream", "--child", *args]
+    return subprocess.check_output(cmd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=50.0)
+    parser.add_argument("--lex", action="store_true")
+    parser.add_argument(
+        "--child", choices=[*STREAMS, "generate", "none"], help=argparse.SUPPRESS
+    )
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == "generate":
+        n_functions = int(args.megabytes * 2**20 / len(generate_function(1)))
+        with open(args.path, "w") as f:
+            f.write(generate_program(n_functions))
+        return
+    if args.child == "none":
+        print(0.0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+        return
+    if args.child:
+        child(args.child, args.path, args.lex)
+        return
+
+    for path in input_files():
+        with MappedFileStream(path) as mapped:
+            if token_keys(mapped) != token_keys(FileStream(path)):
+                print(f"[✗] token mismatch on {path}")
+                sys.exit(1)
+    print("[✓] FileStream and MappedFileStream yield identical tokens")
+
+    # The input is generated in a child too: ru_maxrss counts the pages a
+    # child inherits from its parent at fork time.
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "input.mc")
+        run_child("generate", "--path", path, "--megabytes", str(args.megabytes))
+        size = os.path.getsize(path)
+        base = float(run_child("none").split()[1])
+        print(f"input {size / 2**20:.1f} MiB, interpreter baseline {base:.1f} MiB")
+        print(f"{'stream':>8} {'time':>9} {'peak RSS':>11} {'bytes/char':>11}")
+        for kind in STREAMS:
+            extra = ["--lex"] if args.lex else []
+            elapsed, rss = map(float, run_child(kind, "--path", path, *extra).split())
+            per_char = (rss - base) * 2**20 / size
+            print(f"{kind:>8} {elapsed:>8.2f}s {rss:>8.1f}MiB {per_char:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
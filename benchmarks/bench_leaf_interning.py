@@ -0,0 +1,110 @@
+"""Measures the effect of hash-consed Variable/Literal leaves.
+
+Runs the frontend, ExpressionTransformer and FunctionInliner on a
+generated program dominated by inlinable calls, then compares the leaf
+objects actually allocated with the leaf occurrences in the final tree
+(one object each without interning). The final tree is then rebuilt twice
+from the same data, with and without hash-consing, to compare sizes.
+
+    python -m benchmarks.bench_leaf_interning [--callers N] [--calls K]
+"""
+
+import argparse
+import tracemalloc
+
+from obfuscator.ast import Literal, Variable, iter_children
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.inliner import FunctionInliner
+from obfuscator.leaves import LeafInterner
+from benchmarks.common import NODE_CLASSES, encode_tuples, generate_inline_program
+
+
+def leaf_stats(program):
+    """(leaf occurrences, distinct leaf objects) in the tree."""
+    occurrences = 0
+    distinct = set()
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        if type(node) is Variable or type(node) is Literal:
+            occurrences += 1
+            distinct.add(id(node))
+            continue
+        stack.extend(iter_children(node))
+    return occurrences, len(distinct)
+
+
+def count_constructions():
+    """Wraps the leaf constructors; returns the dict they count into."""
+    counts = {Variable: 0, Literal: 0}
+    for cls in counts:
+        original = cls.__init__
+
+        def counting_init(self, value, cls=cls, original=original):
+            counts[cls] += 1
+            original(self, value)
+
+        cls.__init__ = counting_init
+    return counts
+
+
+def rebuild(data, leaves=None):
+    if isinstance(data, tuple):
+        cls = NODE_CLASSES[data[0]]
+        values = [rebuild(v, leaves) for v in data[1:]]
+        if leaves is not None and cls is Variable:
+            return leaves.variable(*values)
+        if leaves is not None and cls is Literal:
+            return leaves.literal(*values)
+        return cls(*values)
+    if isinstance(data, list):
+        return [rebuild(item, leaves) for item in data]
+    return data
+
+
+def traced(fn, *args):
+    tracemalloc.start()
+    try:
+        result = fn(*args)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, result
+
+
+def build(text):
+    program = FastParser(text).parse()
+    ExpressionTransformer().transform(program)
+    FunctionInliner(program).inline()
+    return program
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=500)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    text = generate_inline_program(args.callers, args.calls)
+    counts = count_constructions()
+    program = build(text)
+    occurrences, distinct = leaf_stats(program)
+    allocated = counts[Variable] + counts[Literal]
+
+    data = encode_tuples(program)
+    del program
+    shared_size, _ = traced(rebuild, data, LeafInterner())
+    unshared_size, _ = traced(rebuild, data)
+
+    print(f"{args.callers} callers x {args.calls} inlined calls")
+    print(f"  leaf occurrences in the tree   {occurrences:12,}")
+    print(f"  leaf objects allocated         {allocated:12,}")
+    print(f"  distinct leaf objects in tree  {distinct:12,}")
+    print(f"  tree, shared leaves            {shared_size / 2**20:9.1f} MiB")
+    print(f"  tree, one object per leaf      {unshared_size / 2**20:9.1f} MiB")
+    print(f"  saved                          {1 - shared_size / unshared_size:12.0%}")
+
+
+if __name__ == "__main__":
+    main()
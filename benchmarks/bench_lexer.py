@@ -0,0 +1,82 @@
+"""Compares the generated ANTLR lexer with the regex-based FastLexer.
+
+Checks that both emit identical tokens (type, text, line, column, start,
+stop) and that ObfuMiniCParser builds the same AST from either stream, then
+times CommonTokenStream.fill() on a multi-megabyte generated input.
+
+    python -m benchmarks.bench_lexer [--megabytes M]
+"""
+
+import argparse
+import os
+import sys
+
+from antlr4 import CommonTokenStream, FileStream
+
+from obfuscator.fast_lexer import FastLexer, tokenize
+from obfuscator.frontend import parse_antlr
+from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
+from benchmarks.common import generate_function, generated_file, input_files, timed
+
+
+def token_stream(lexer_class, path):
+    stream = CommonTokenStream(lexer_class(FileStream(path)))
+    stream.fill()
+    return stream
+
+
+def token_keys(stream):
+    return [(t.type, t.text, t.line, t.column, t.start, t.stop) for t in stream.tokens]
+
+
+def check(path) -> bool:
+    same_tokens = token_keys(token_stream(ObfuMiniCLexer, path)) == token_keys(
+        token_stream(FastLexer, path)
+    )
+    same_ast = repr(parse_antlr(path, lexer="antlr")) == repr(
+        parse_antlr(path, lexer="fast")
+    )
+    return same_tokens and same_ast
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, default=2.0)
+    args = parser.parse_args()
+
+    n_functions = int(args.megabytes * 2**20 / len(generate_function(1)))
+    failures = 0
+    for path in input_files():
+        ok = check(path)
+        failures += not ok
+        print(f"[{'✓' if ok else '✗'}] {path}")
+    if failures:
+        sys.exit(1)
+
+    with generated_file(n_functions) as path:
+        size = os.path.getsize(path) / 2**20
+        antlr_time, stream = timed(token_stream, ObfuMiniCLexer, path)
+        fast_time, fast_stream = timed(token_stream, FastLexer, path)
+        with open(path) as f:
+            text = f.read()
+        raw_time, _ = timed(tokenize, text)
+        if token_keys(stream) != token_keys(fast_stream):
+            print("[✗] token streams differ on generated input")
+            sys.exit(1)
+
+        tokens = len(stream.tokens)
+        print(f"\n{size:.1f} MiB, {tokens:,} tokens:")
+        for name, seconds in (
+            ("ObfuMiniCLexer", antlr_time),
+            ("FastLexer", fast_time),
+            ("tokenize()", raw_time),
+        ):
+            print(
+                f"  {name:15} {seconds:8.3f}s  {size / seconds:8.2f} MiB/s"
+                f"  {tokens / seconds:12,.0f} tokens/s"
+            )
+        print(f"  speedup {antlr_time / fast_time:.1f}x (CommonTokenStream)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Scaling of parallel top-level definition parsing from 1 to N processes.
+
+Parses one large generated compilation unit serially and with
+parse_parallel on 1..N workers, for the fast and antlr backends, checks
+that every run builds the same AST and reports the speedup.
+
+    python -m benchmarks.bench_parallel [--functions N] [--max-workers N]
+"""
+
+import argparse
+import os
+import sys
+
+from obfuscator.frontend import PARSERS
+from obfuscator.parallel import parse_parallel
+from benchmarks.common import generated_file, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--parsers", default="fast,antlr")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} core(s), {args.functions} functions")
+    with generated_file(args.functions) as path:
+        with open(path) as f:
+            text = f.read()
+        for backend in args.parsers.split(","):
+            serial_time, serial = timed(PARSERS[backend], path)
+            expected = repr(serial)
+            print(f"{backend}: serial {serial_time:.2f}s")
+            print(f"{'workers':>9} {'time':>9} {'speedup':>8}")
+            for workers in range(1, args.max_workers + 1):
+                elapsed, program = timed(
+                    parse_parallel, text, backend, "antlr", workers
+                )
+                if repr(program) != expected:
+                    print(f"[✗] {backend} AST differs with {workers} worker(s)")
+                    sys.exit(1)
+                speedup = serial_time / elapsed
+                print(f"{workers:>9} {elapsed:>8.2f}s {speedup:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compares full-LL parsing with the two-stage SLL-then-LL strategy.
+
+Parses every file under input/, a generated program and any extra paths
+given on the command line with both strategies and prints the per-file and
+aggregate stage timings and fallback counts.
+
+    python -m benchmarks.bench_parse_strategy [--functions N] [paths ...]
+"""
+
+import argparse
+
+from antlr4 import CommonTokenStream, FileStream
+from antlr4.dfa.DFA import DFA
+
+from obfuscator.frontend import ParseRecord, ParseStats, parse_tree
+from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
+from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
+from benchmarks.common import generated_file, input_files, timed
+
+
+def reset_dfa():
+    """Drops the parser's shared DFA cache so each strategy starts cold."""
+    for i, state in enumerate(ObfuMiniCParser.atn.decisionToState):
+        ObfuMiniCParser.decisionsToDFA[i] = DFA(state, i)
+
+
+def run(paths, strategy: str) -> ParseStats:
+    reset_dfa()
+    stats = ParseStats()
+    for path in paths:
+        stream = CommonTokenStream(ObfuMiniCLexer(FileStream(path)))
+        lex_time, _ = timed(stream.fill)
+        _, sll_time, ll_time = parse_tree(stream, strategy)
+        stats.add(ParseRecord(path, lex_time, sll_time, ll_time))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument("--functions", type=int, default=300)
+    args = parser.parse_args()
+
+    with generated_file(args.functions) as generated:
+        paths = input_files() + [generated] + args.paths
+        totals = {}
+        for strategy in ("ll", "sll-ll"):
+            stats = run(paths, strategy)
+            print(f"== {strategy} ==\n{stats.report()}\n")
+            totals[strategy] = sum(
+                (r.sll_time or 0.0) + (r.ll_time or 0.0) for r in stats.records
+            )
+        print(f"parse speedup {totals['ll'] / totals['sll-ll']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
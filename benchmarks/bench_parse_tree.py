@@ -0,0 +1,87 @@
+"""Measures parse-tree size, memory and parse+build time of the ANTLR frontend.
+
+Runs on an expression-heavy generated program, where the depth of the
+expression rules dominates parse-tree size.
+
+    python -m benchmarks.bench_parse_tree [--functions N] [--terms T]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from antlr4 import CommonTokenStream, FileStream
+from antlr4.tree.Tree import TerminalNode
+
+from obfuscator.ast_builder import ASTBuilder
+from obfuscator.frontend import parse_tree
+from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
+from benchmarks.common import count_lines, generate_expression_program, generated_file
+
+
+def count_contexts(tree) -> int:
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, TerminalNode):
+            continue
+        count += 1
+        if node.children:
+            stack.extend(node.children)
+    return count
+
+
+class CountingBuilder(ASTBuilder):
+    """ASTBuilder that counts visit() calls."""
+
+    calls = 0
+
+    def visit(self, tree):
+        self.calls += 1
+        return super().visit(tree)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=100)
+    parser.add_argument("--terms", type=int, default=40)
+    args = parser.parse_args()
+
+    def generator(n):
+        return generate_expression_program(n, args.terms)
+
+    with generated_file(args.functions, generator) as path:
+        stream = CommonTokenStream(ObfuMiniCLexer(FileStream(path)))
+        stream.fill()
+
+        start = time.perf_counter()
+        tree, _, _ = parse_tree(stream)
+        parse_time = time.perf_counter() - start
+        builder = CountingBuilder()
+        start = time.perf_counter()
+        builder.visit(tree)
+        build_time = time.perf_counter() - start
+
+        contexts = count_contexts(tree)
+        del tree
+
+        stream.seek(0)
+        tracemalloc.start()
+        tree, _, _ = parse_tree(stream)
+        tree_bytes = tracemalloc.get_traced_memory()[0]
+        ASTBuilder().visit(tree)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"{count_lines(path)} lines, {len(stream.tokens)} tokens")
+        print(f"  parse-tree contexts  {contexts:12,}")
+        print(f"  ASTBuilder visits    {builder.calls:12,}")
+        print(f"  parse-tree memory    {tree_bytes / 2**20:12.1f} MiB")
+        print(f"  parse+build peak     {peak_bytes / 2**20:12.1f} MiB")
+        print(f"  parse time           {parse_time:12.3f} s")
+        print(f"  build time           {build_time:12.3f} s")
+
+
+if __name__ == "__main__":
+    main()
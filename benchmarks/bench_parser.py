@@ -0,0 +1,52 @@
+"""Compares the ANTLR and hand-written frontends.
+
+Checks that both produce the same AST for every file under input/ and for a
+generated program, then reports parse throughput in lines per second.
+
+    python -m benchmarks.bench_parser [--functions N] [--repeat R]
+"""
+
+import argparse
+import sys
+
+from obfuscator.frontend import parse_antlr, parse_fast
+from benchmarks.common import count_lines, generated_file, input_files, timed
+
+
+def check_conformance(path: str) -> bool:
+    reference = repr(parse_antlr(path))
+    candidate = repr(parse_fast(path))
+    return reference == candidate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    failures = 0
+    for path in input_files():
+        ok = check_conformance(path)
+        failures += not ok
+        print(f"[{'✓' if ok else '✗'}] {path}")
+
+    with generated_file(args.functions) as path:
+        ok = check_conformance(path)
+        failures += not ok
+        print(f"[{'✓' if ok else '✗'}] generated program ({args.functions} functions)")
+        if failures:
+            sys.exit(1)
+
+        lines = count_lines(path)
+        print(f"\n{lines} lines, best of {args.repeat}:")
+        results = {}
+        for name, fn in (("antlr", parse_antlr), ("fast", parse_fast)):
+            seconds, _ = timed(fn, path, repeat=args.repeat)
+            results[name] = seconds
+            print(f"  {name:6} {seconds:8.3f}s  {lines / seconds:12,.0f} lines/s")
+        print(f"  speedup {results['antlr'] / results['fast']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
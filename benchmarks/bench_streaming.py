@@ -0,0 +1,84 @@
+"""Compares the streaming pipeline with the whole-program pipeline.
+
+Checks that `cli.py --stream` writes byte-identical output for the
+deterministic stages, then runs both modes on a large generated program
+in subprocesses and reports wall time and peak RSS.
+
+    python -m benchmarks.bench_streaming [--functions N] [--stages S,S,...]
+"""
+
+import argparse
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import cli
+from obfuscator.control_flattening import ControlFlowFlattener
+from benchmarks.common import generated_file
+
+DETERMINISTIC_STAGES = ["expr", "flatten", "inline"]
+
+
+def run_cli(input_path, output_path, stages, stream):
+    """Runs cli.py in a child process; returns (seconds, peak RSS in MiB)."""
+    cmd = [sys.executable, "cli.py", input_path, "-o", output_path]
+    cmd += [f"--{stage}" for stage in stages] + ["--parser", "fast"]
+    if stream:
+        cmd.append("--stream")
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    if os.waitstatus_to_exitcode(status) != 0:
+        print(f"[✗] {' '.join(cmd)} failed")
+        sys.exit(1)
+    # ru_maxrss is in KiB on Linux
+    return elapsed, usage.ru_maxrss / 1024
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def check_identical(input_path, out_dir, stages):
+    outputs = []
+    for stream in (False, True):
+        # Label and temporary names come from this class-level counter
+        ControlFlowFlattener.id_counter = itertools.count()
+        path = os.path.join(out_dir, f"check_{int(stream)}.mc")
+        cli.run_pipeline(input_path, path, stages, parser="fast", stream=stream)
+        outputs.append(read(path))
+    return outputs[0] == outputs[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=20000)
+    parser.add_argument("--stages", default=",".join(DETERMINISTIC_STAGES))
+    args = parser.parse_args()
+    stages = args.stages.split(",")
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        with generated_file(200) as path:
+            if not check_identical(path, out_dir, DETERMINISTIC_STAGES):
+                print("[✗] streaming output differs from run_pipeline")
+                sys.exit(1)
+        print("[✓] streaming output is byte-identical to run_pipeline")
+
+        with generated_file(args.functions) as path:
+            size = os.path.getsize(path) / 2**20
+            print(f"{args.functions} functions, {size:.1f} MiB, stages {stages}")
+            print(f"{'mode':>10} {'time':>10} {'peak RSS':>12}")
+            for stream in (False, True):
+                output = os.path.join(out_dir, "out.mc")
+                elapsed, rss = run_cli(path, output, stages, stream)
+                mode = "stream" if stream else "whole"
+                print(f"{mode:>10} {elapsed:>9.2f}s {rss:>9.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
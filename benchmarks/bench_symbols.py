@@ -0,0 +1,121 @@
+"""Cost of the per-function symbol index and of the passes that use it.
+
+Builds the index of every function of a generated program, then times
+NameObfuscator and the variable collection ControlFlowFlattener does with the
+index already memoized (as after an earlier pass that kept it current)
+and with it dropped, next to the number of nodes and of indexed sites.
+Checks that the index NameObfuscator leaves behind matches a fresh one
+and that every Variable site still holds a Variable of its name.
+
+    python -m benchmarks.bench_symbols [--functions N] [--repeat N]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+
+from obfuscator.ast import *
+from obfuscator.fast_parser import FastParser
+from obfuscator.name_obfuscator import NameObfuscator
+from obfuscator.symbols import SymbolIndex, symbol_index
+from benchmarks.common import generate_program
+
+TABLES = ("declarations", "variables", "targets", "calls", "scans", "returns")
+
+
+def best(fn, repeat, setup=None):
+    """Least CPU time of fn() over repeat runs with gc disabled, calling
+    setup() untimed before each."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.disable()
+        start = time.process_time()
+        fn()
+        elapsed = min(elapsed, time.process_time() - start)
+        gc.enable()
+    return elapsed
+
+
+def count_nodes(program) -> int:
+    count = 0
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(iter_children(node))
+    return count
+
+
+def shape(index):
+    return {
+        table: {k: len(v) for k, v in getattr(index, table).items()} for table in TABLES
+    }
+
+
+def sites_hold_their_names(index) -> bool:
+    for name, sites in index.variables.items():
+        for holder, key in sites:
+            value = holder[key] if type(holder) is list else getattr(holder, key)
+            if type(value) is not Variable or value.name != name:
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    program = FastParser(generate_program(args.functions)).parse()
+    functions = program.functions
+
+    def drop():
+        for func in functions:
+            invalidate(func)
+
+    def build():
+        for func in functions:
+            symbol_index(func)
+
+    def collect():
+        for func in functions:
+            index = symbol_index(func)
+            index.local_names()
+            index.returns.keys()
+
+    sites = sum(
+        len(sites)
+        for func in functions
+        for table in TABLES
+        for sites in getattr(symbol_index(func), table).values()
+    )
+    print(f"{args.functions} functions")
+    print(f"  nodes                  {count_nodes(program):>10,}")
+    print(f"  indexed sites          {sites:>10,}")
+    print(f"  build index            {best(build, args.repeat, drop) * 1000:>8.1f}ms")
+    print(
+        f"  collect, memoized      {best(collect, args.repeat, build) * 1000:>8.1f}ms"
+    )
+    print(f"  collect, rebuilt       {best(collect, args.repeat, drop) * 1000:>8.1f}ms")
+    rename = lambda: NameObfuscator().obfuscate(program)
+    print(f"  rename, memoized       {best(rename, args.repeat, build) * 1000:>8.1f}ms")
+    print(f"  rename, rebuilt        {best(rename, args.repeat, drop) * 1000:>8.1f}ms")
+
+    NameObfuscator().obfuscate(program)
+    kept = [symbol_index(func) for func in functions]
+    fresh = [SymbolIndex.build(func) for func in functions]
+    ok = [shape(a) for a in kept] == [shape(b) for b in fresh]
+    ok &= all(sites_hold_their_names(index) for index in kept)
+    print(f"  [{'✓' if ok else '✗'}] the index stays current through renaming")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
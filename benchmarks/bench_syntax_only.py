@@ -0,0 +1,73 @@
+"""Throughput of syntax-only bulk validation.
+
+Writes a tree of small generated files, a tenth of them with a syntax
+error, and validates all of them in one process: with check_syntax on
+the antlr and fast parsers, and by building the AST with parse_antlr as
+the full pipeline would. Checks that every mode flags the same files and
+reports files per second.
+
+    python -m benchmarks.bench_syntax_only [--files N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from obfuscator.fast_lexer import ParseError
+from obfuscator.frontend import parse_antlr
+from obfuscator.syntax_check import check_syntax
+from benchmarks.common import generate_program
+
+
+def write_tree(directory, n_files):
+    paths = []
+    for i in range(n_files):
+        text = generate_program(i % 5 + 1)
+        if i % 10 == 9:
+            text = text.replace("x = x / 2;", "x = x / ;", 1)
+        path = os.path.join(directory, f"d{i % 16}", f"f{i}.mc")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+        paths.append(path)
+    return paths
+
+
+def build_ast(path):
+    try:
+        parse_antlr(path)
+    except ParseError as e:
+        return [e]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=1000)
+    args = parser.parse_args()
+
+    modes = {
+        "syntax-only antlr": lambda path: check_syntax(path, "antlr"),
+        "syntax-only fast": lambda path: check_syntax(path, "fast"),
+        "build AST (antlr)": build_ast,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_tree(directory, args.files)
+        verdicts = None
+        print(f"{'mode':>18} {'time':>8} {'files/s':>9} {'invalid':>8}")
+        for name, check in modes.items():
+            start = time.perf_counter()
+            invalid = [path for path in paths if check(path)]
+            elapsed = time.perf_counter() - start
+            if verdicts is not None and invalid != verdicts:
+                print(f"[✗] {name} flags different files")
+                sys.exit(1)
+            verdicts = invalid
+            rate = len(paths) / elapsed
+            print(f"{name:>18} {elapsed:>7.2f}s {rate:>9.1f} {len(invalid):>8}")
+
+
+if __name__ == "__main__":
+    main()
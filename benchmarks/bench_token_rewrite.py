@@ -0,0 +1,81 @@
+"""Compares rename/minify through the AST with the token-rewriting fast path.
+
+Checks that the token path renames exactly like NameObfuscator: its output,
+parsed and regenerated, must equal the AST path's output byte for byte, with
+and without minification. Then times both paths on a generated program.
+
+    python -m benchmarks.bench_token_rewrite [--functions N] [--repeat R]
+"""
+
+import argparse
+import random
+import sys
+
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.fast_parser import FastParser
+from obfuscator.frontend import parse_antlr, parse_fast
+from obfuscator.name_obfuscator import NameObfuscator
+from obfuscator.token_rewriter import minify, rewrite_tokens
+from benchmarks.common import count_lines, generated_file, input_files, timed
+
+PARSERS = {"antlr": parse_antlr, "fast": parse_fast}
+
+
+def rename_ast(path: str, parser: str = "fast", minified: bool = False) -> str:
+    random.seed(0)
+    program = PARSERS[parser](path)
+    NameObfuscator().obfuscate(program)
+    code = CodeGenerator().generate(program)
+    return minify(code) if minified else code
+
+
+def rename_tokens(path: str, minified: bool = False) -> str:
+    random.seed(0)
+    with open(path, encoding="utf-8") as f:
+        return rewrite_tokens(f.read(), minify=minified)
+
+
+def check_conformance(path: str) -> bool:
+    reference = rename_ast(path)
+    for minified in (False, True):
+        program = FastParser(rename_tokens(path, minified)).parse()
+        if CodeGenerator().generate(program) != reference:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    failures = 0
+    for path in input_files():
+        ok = check_conformance(path)
+        failures += not ok
+        print(f"[{'✓' if ok else '✗'}] {path}")
+
+    with generated_file(args.functions) as path:
+        ok = check_conformance(path)
+        failures += not ok
+        print(f"[{'✓' if ok else '✗'}] generated program ({args.functions} functions)")
+        if failures:
+            sys.exit(1)
+
+        lines = count_lines(path)
+        print(f"\n{lines} lines, best of {args.repeat}:")
+        runs = [
+            ("ast (antlr) rename", rename_ast, (path, "antlr")),
+            ("ast (fast) rename", rename_ast, (path, "fast")),
+            ("tokens rename", rename_tokens, (path,)),
+            ("ast (fast) rename+minify", rename_ast, (path, "fast", True)),
+            ("tokens rename+minify", rename_tokens, (path, True)),
+        ]
+        for name, fn, fn_args in runs:
+            seconds, _ = timed(fn, *fn_args, repeat=args.repeat)
+            print(f"  {name:26} {seconds:8.3f}s  {lines / seconds:12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Size and speed of the wire format against pickle, with round-trip checks.
+
+Encodes a generated program after ExpressionTransformer (so dominated by
+nested BinaryOps) with obfuscator.wire, with pickle, and as the pickled
+nested tuples parse_parallel shipped before, and times decoding it all
+or, lazily, one function. Then round-trips
+every input file after each pass, a deeply nested chain and a program of
+edge-case values, comparing generated code and fingerprints, and
+checks that shared nodes stay shared and that bad input is rejected.
+
+    python -m benchmarks.bench_wire [--functions N] [--repeat N]
+"""
+
+import argparse
+import gc
+import itertools
+import pickle
+import random
+import sys
+import time
+
+from obfuscator import wire
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.fast_parser import FastParser
+from obfuscator.fingerprint import fingerprint
+from obfuscator.inliner import FunctionInliner
+from obfuscator.name_obfuscator import NameObfuscator
+from benchmarks.bench_deep_nesting import chain_program
+from benchmarks.common import (
+    decode_tuples,
+    encode_tuples,
+    generate_program,
+    input_files,
+)
+
+PASSES = [
+    lambda program: NameObfuscator().obfuscate(program),
+    lambda program: DeadCodeInserter().insert(program),
+    lambda program: ExpressionTransformer().transform(program),
+    lambda program: ControlFlowFlattener().flatten(program),
+    lambda program: FunctionInliner(program).inline(),
+]
+
+
+def best(fn, arg, repeat):
+    """Least CPU time of fn(arg) over repeat runs with gc disabled, and
+    its result."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.disable()
+        start = time.process_time()
+        result = fn(arg)
+        elapsed = min(elapsed, time.process_time() - start)
+        gc.enable()
+    return elapsed, result
+
+
+def same(a: Program, b: Program) -> bool:
+    # Not repr: it is quadratic in depth and shows Labels by address
+    return CodeGenerator().generate(a) == CodeGenerator().generate(b) and [
+        fingerprint(f) for f in a.functions
+    ] == [fingerprint(f) for f in b.functions]
+
+
+def edge_cases() -> Program:
+    body = [
+        VariableDecl("int", "n", Literal(-(2**40))),
+        VariableDecl("int", "m", Literal(-1)),
+        VariableDecl("bool", "t", Literal(True)),
+        VariableDecl("bool", "f", Literal(False)),
+        VariableDecl("int", "z", None),
+        Assignment("n", BinaryOp("+", Literal(0), Literal(2**70))),
+        Print('"h\\u00e9llo %d\\n"', [Variable("n"), Literal("x\0y")]),
+        Scan('"%d"', ["&n"]),
+        ExpressionStmt(FuncCall("f", [])),
+        Return(None),
+    ]
+    functions = [
+        Function("int", f"g{i}", [Parameter("int", "a")], body) for i in range(200)
+    ]
+    return Program(functions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    program = FastParser(generate_program(args.functions)).parse()
+    ExpressionTransformer().transform(program)
+    codecs = [
+        ("wire", wire.dumps, wire.loads),
+        (
+            "pickle",
+            lambda p: pickle.dumps(p, pickle.HIGHEST_PROTOCOL),
+            pickle.loads,
+        ),
+        (
+            "tuples+pickle",
+            lambda p: pickle.dumps(encode_tuples(p), pickle.HIGHEST_PROTOCOL),
+            lambda data: decode_tuples(pickle.loads(data)),
+        ),
+    ]
+    print(f"{args.functions} functions after ExpressionTransformer")
+    print(f"  {'':>14} {'bytes':>11} {'encode':>10} {'decode':>10}")
+    ok = True
+    for label, dumps, loads in codecs:
+        encode_time, data = best(dumps, program, args.repeat)
+        decode_time, decoded = best(loads, data, args.repeat)
+        ok &= same(decoded, program)
+        print(
+            f"  {label:>14} {len(data):>11,} {encode_time * 1000:>8.1f}ms"
+            f" {decode_time * 1000:>8.1f}ms"
+        )
+    data = wire.dumps(program)
+    middle = f"f{args.functions // 2}"
+    lazy_time, function = best(
+        lambda data: wire.WireProgram(data).function(middle), data, args.repeat
+    )
+    print(f"  {'wire, one fn':>14} {'':>11} {'':>10} {lazy_time * 1000:>8.2f}ms")
+
+    print("\nround trips:")
+    programs = []
+    for path in input_files():
+        with open(path) as f:
+            text = f.read()
+        ControlFlowFlattener.id_counter = itertools.count()
+        program = FastParser(text).parse()
+        programs.append(program.clone())
+        for run in PASSES:
+            run(program)
+            programs.append(program.clone())
+    flattened = program
+    ok &= all(same(wire.loads(wire.dumps(p)), p) for p in programs)
+    print(f"  [{'✓' if ok else '✗'}] inputs after every pass ({len(programs)} trees)")
+
+    chain = FastParser(chain_program(100_000)).parse()
+    chain_ok = same(wire.loads(wire.dumps(chain)), chain)
+    print(f"  [{'✓' if chain_ok else '✗'}] a chain of 100,000 terms")
+    edge = edge_cases()
+    edge_ok = same(wire.loads(wire.dumps(edge)), edge)
+    print(f"  [{'✓' if edge_ok else '✗'}] negative and large ints, bools, str, None")
+
+    decoded = wire.WireProgram(bytearray(wire.dumps(flattened)))
+    func = decoded[len(decoded) - 1]
+    switch = next(s for s in func.body if isinstance(s, Switch))
+    labels = {id(s) for s in func.body if isinstance(s, Label)}
+    labels |= {id(s) for b in func.body if isinstance(b, Block) for s in b.items}
+    shared_ok = all(id(case.label) in labels for case in switch.cases)
+    print(f"  [{'✓' if shared_ok else '✗'}] switch cases share their Label nodes")
+
+    data = wire.dumps(flattened)
+    newer = wire.MAGIC + bytes([wire.WIRE_VERSION + 1]) + data[5:]
+    rejected = 0
+    for bad in (data[:-3], data[:20], newer, b"not wire"):
+        try:
+            wire.loads(bad)
+        except ValueError:
+            rejected += 1
+    bad_ok = rejected == 4
+    print(f"  [{'✓' if bad_ok else '✗'}] truncated and foreign data is rejected")
+
+    if not (ok and chain_ok and edge_ok and shared_ok and bad_ok):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import inspect
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from obfuscator import ast
+
+INPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "input")
+
+
+def input_files():
+    return sorted(
+        os.path.join(INPUT_DIR, name)
+        for name in os.listdir(INPUT_DIR)
+        if name.endswith(".mc")
+    )
+
+
+def generate_function(i: int) -> str:
+    callee = f"f{i - 1}" if i > 0 else None
+    call = f"{callee}(a, i)" if callee else "a * 2"
+    return f"""int f{i}(int a, int b) {{
+    int x = a + b * {i % 7 + 1}, y = (a - b) % 3;
+    int i = 0;
+    /* block comment {i} */
+    for (i = 0; i < b; i = i + 1) {{
+        x = x + i * 2 - y;
+        if (x > 100 && !(y == 0) || x <= -5) {{
+            x = x / 2;
+        }} else {{
+            y = y + 1;
+        }}
+    }}
+    while (x != 0) {{
+        x = x - 1; // countdown
+    }}
+    printf("f{i} %d %d\\n", x, y);
+    return {call};
+}}
+"""
+
+
+def generate_program(n_functions: int) -> str:
+    parts = [generate_function(i) for i in range(n_functions)]
+    parts.append(f"""int main() {{
+    int r = f{n_functions - 1}(1, 2);
+    printf("%d\\n", r);
+    return 0;
+}}
+""")
+    return "\n".join(parts)
+
+
+@contextmanager
+def generated_file(n_functions: int, generator=None):
+    """Writes a generated program to a temporary .mc file and yields its path."""
+    fd, path = tempfile.mkstemp(suffix=".mc")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write((generator or generate_program)(n_functions))
+        yield path
+    finally:
+        os.remove(path)
+
+
+def timed(fn, *args, repeat=1):
+    """Returns (best wall time in seconds, result of the last call)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def count_lines(path: str) -> int:
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def generate_expression_program(n_functions: int, terms: int = 40) -> str:
+    """Generates functions dominated by long arithmetic/logical expressions."""
+    ops = ["+", "-", "*", "/", "%", "<", "==", "&&", "||", "!="]
+    parts = []
+    for i in range(n_functions):
+        operands = [
+            ["a", "b", "c", str(j + 1), f"(a - {j})", "-b", "!c"][j % 7]
+            for j in range(terms)
+        ]
+        expr = operands[0]
+        for j, operand in enumerate(operands[1:]):
+            expr += f" {ops[(i + j) % len(ops)]} {operand}"
+        parts.append(f"""int e{i}(int a, int b, int c) {{
+    int r = {expr};
+    r = r + e{i}(a, b, {expr});
+    return r;
+}}
+""")
+    return "\n".join(parts)
+
+
+INLINE_LEAVES = 10
+
+
+def generate_inline_program(callers: int, calls: int, callee_size: int = 1) -> str:
+    """Generates callers whose bodies are calls that FunctionInliner inlines.
+
+    Every callee has callee_size statements besides its first and return.
+    """
+    parts = []
+    for k in range(INLINE_LEAVES):
+        body = "".join(
+            f"    int u{s} = {f'u{s - 1}' if s else 't'} * t - a;\n"
+            for s in range(callee_size)
+        )
+        parts.append(f"""int leaf{k}(int a, int b) {{
+    int t = a * 2 + b - {k};
+{body}    return u{callee_size - 1} - b + 1;
+}}
+""")
+    for i in range(callers):
+        body = "".join(
+            (
+                f"    int r{j} = leaf{(i + j) % INLINE_LEAVES}(a + {j}, b - r{j - 1});\n"
+                if j
+                else f"    int r0 = leaf{i % INLINE_LEAVES}(a, b);\n"
+            )
+            for j in range(calls)
+        )
+        parts.append(
+            f"int caller{i}(int a, int b) {{\n{body}    return r{calls - 1};\n}}\n"
+        )
+    parts.append("int main() {\n    return caller0(1, 2);\n}\n")
+    return "\n".join(parts)
+
+
+# Node classes by tag in the nested tuple encoding that ast_cache entries and
+# parse_parallel results used before the wire format
+NODE_CLASSES = [
+    cls
+    for _, cls in sorted(inspect.getmembers(ast, inspect.isclass))
+    if cls.__module__ == ast.__name__ and "__init__" in vars(cls)
+]
+_CLASS_TAGS = {cls: i for i, cls in enumerate(NODE_CLASSES)}
+_CLASS_FIELDS = [
+    tuple(inspect.signature(cls.__init__).parameters)[1:] for cls in NODE_CLASSES
+]
+
+# Marks where a node or list is built from the values above it
+_BUILD = object()
+
+
+def encode_tuples(node):
+    """Converts an AST into nested tuples/lists of primitives.
+
+    A node becomes (class tag, *constructor fields); lists stay lists.
+    Values are converted children first with an explicit stack, so the
+    depth of a tree is not limited by the recursion limit.
+    """
+    tags = _CLASS_TAGS
+    variable = tags[ast.Variable]
+    literal = tags[ast.Literal]
+    out = []
+    # A node or list is pushed again under _BUILD once its items are
+    # pushed, and built from the last len(items) values in out
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if value is _BUILD:
+            value = stack.pop()
+            tag = tags.get(type(value))
+            if tag is None:
+                n = len(value)
+                items = out[len(out) - n :]
+            else:
+                n = len(_CLASS_FIELDS[tag])
+                items = (tag, *out[len(out) - n :])
+            del out[len(out) - n :]
+            out.append(items)
+            continue
+        cls = type(value)
+        if cls is ast.Variable:
+            out.append((variable, value.name))
+            continue
+        if cls is ast.Literal:
+            out.append((literal, value.value))
+            continue
+        tag = tags.get(cls)
+        if tag is not None:
+            stack.append(value)
+            stack.append(_BUILD)
+            stack.extend([getattr(value, f) for f in reversed(_CLASS_FIELDS[tag])])
+        elif isinstance(value, list):
+            stack.append(value)
+            stack.append(_BUILD)
+            stack.extend(reversed(value))
+        else:
+            out.append(value)
+    return out[0]
+
+
+def decode_tuples(data):
+    """Rebuilds the AST encode_tuples() converted, with an explicit stack."""
+    classes = NODE_CLASSES
+    out = []
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if value is _BUILD:
+            value = stack.pop()
+            if isinstance(value, tuple):
+                n = len(value) - 1
+                item = classes[value[0]](*out[len(out) - n :])
+            else:
+                n = len(value)
+                item = out[len(out) - n :]
+            del out[len(out) - n :]
+            out.append(item)
+        elif isinstance(value, tuple):
+            if len(value) == 2 and not isinstance(value[1], (tuple, list)):
+                out.append(classes[value[0]](value[1]))  # Leaves, mostly
+                continue
+            stack.append(value)
+            stack.append(_BUILD)
+            stack.extend(value[:0:-1])
+        elif isinstance(value, list):
+            stack.append(value)
+            stack.append(_BUILD)
+            stack.extend(reversed(value))
+        else:
+            out.append(value)
+    return out[0]
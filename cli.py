@@ -1,10 +1,27 @@
 import argparse
 import os
 import subprocess
-from antlr4 import *
-from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
-from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
-from obfuscator.ast_builder import ASTBuilder
+import sys
+import time
+from obfuscator.frontend import (
+    LEXERS,
+    PARALLEL_PARSERS,
+    PARSERS,
+    parse_file,
+    parse_stats,
+)
+from obfuscator.ast_cache import ASTCache
+from obfuscator.dfa_cache import DFACache
+from obfuscator.function_filter import (
+    merge_selected,
+    parse_selected,
+    reserved_names,
+    selected_functions,
+)
+from obfuscator.streaming import run_streaming
+from obfuscator.fast_lexer import ParseError
+from obfuscator.syntax_check import SYNTAX_PARSERS, Diagnostic, check_syntax
+from obfuscator.token_rewriter import minify as minify_code, rewrite_tokens
 from obfuscator.code_generator import CodeGenerator
 from obfuscator.name_obfuscator import NameObfuscator
 from obfuscator.deadcode import DeadCodeInserter
@@ -13,43 +30,87 @@ from obfuscator.control_flattening import ControlFlowFlattener
 from obfuscator.inliner import FunctionInliner
 
 
-def run_pipeline(input_path, output_path, stages, check_runtime=False):
-    # Step 1: Parse input file
-    input_stream = FileStream(input_path)
-    lexer = ObfuMiniCLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = ObfuMiniCParser(stream)
-    tree = parser.compilationUnit()
+def run_pipeline(
+    input_path,
+    output_path,
+    stages,
+    check_runtime=False,
+    parser="antlr",
+    lexer="antlr",
+    cache=None,
+    stream=False,
+    jobs=1,
+    only_functions=None,
+    minify=False,
+    token_rewrite=False,
+):
+    if token_rewrite:
+        # Rename and/or minify the token stream; no AST, no regeneration
+        with open(input_path, encoding="utf-8") as f:
+            code = rewrite_tokens(f.read(), "rename" in stages, minify)
+        write_output(output_path, code)
+        if check_runtime:
+            run_and_compare(input_path, output_path)
+        return
 
-    # Step 2: Build AST
-    ast = ASTBuilder().visit(tree)
+    if stream:
+        # Parse, transform and write one top-level definition at a time
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        run_streaming(input_path, output_path, stages)
+        print(f"[✓] Obfuscated code saved to {output_path}")
+        if check_runtime:
+            run_and_compare(input_path, output_path)
+        return
+
+    # Step 1-2: Parse input file and build AST (or load it from the cache)
+    if only_functions:
+        # Only the selected functions are parsed and transformed; the rest
+        # stay source text that is emitted verbatim
+        with open(input_path, encoding="utf-8") as f:
+            ast = parse_selected(f.read(), only_functions)
+        targets = selected_functions(ast)
+        reserved = reserved_names(ast)
+    else:
+        ast = parse_file(input_path, parser, lexer, cache, jobs)
+        targets = ast
+        reserved = ()
 
     # Step 3: Apply transformations
     if "rename" in stages:
-        NameObfuscator().obfuscate(ast)
+        NameObfuscator(reserved).obfuscate(targets)
     if "dead" in stages:
-        DeadCodeInserter().insert(ast)
+        DeadCodeInserter().insert(targets)
     if "expr" in stages:
-        ExpressionTransformer().transform(ast)
+        ExpressionTransformer().transform(targets)
     if "flatten" in stages:
-        ControlFlowFlattener().flatten(ast)
+        ControlFlowFlattener().flatten(targets)
+    if targets is not ast:
+        merge_selected(ast, targets)
     if "inline" in stages:
-        FunctionInliner(ast).inline()
+        inliner = FunctionInliner(ast)
+        for func in targets.functions:
+            inliner.inline_function(func)
 
     # Step 4: Generate code
     code = CodeGenerator().generate(ast)
+    if minify:
+        code = minify_code(code)
 
     # Step 5: Output
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(code)
-    print(f"[✓] Obfuscated code saved to {output_path}")
+    write_output(output_path, code)
 
     # Step 6: Runtime behavior check
     if check_runtime:
         run_and_compare(input_path, output_path)
 
 
+def write_output(output_path, code):
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w") as f:
+        f.write(code)
+    print(f"[✓] Obfuscated code saved to {output_path}")
+
+
 def run_and_compare(original_path, obfuscated_path):
     def compile_and_run(src_path):
         bin_path = src_path.replace(".mc", ".out")
@@ -78,9 +139,47 @@ def run_and_compare(original_path, obfuscated_path):
         print("Obfuscated:", obfus_output)
 
 
+def collect_inputs(paths):
+    """Expands directories into the .mc files below them, in sorted order."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".mc"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def run_syntax_check(paths, parser="antlr", lexer="antlr"):
+    """Checks that every input parses; returns the number of invalid files."""
+    files = 0
+    invalid = 0
+    start = time.perf_counter()
+    for path in collect_inputs(paths):
+        diagnostics = check_syntax(path, parser, lexer)
+        for diagnostic in diagnostics:
+            print(diagnostic)
+        files += 1
+        invalid += bool(diagnostics)
+    elapsed = time.perf_counter() - start
+    rate = files / elapsed if elapsed > 0 else 0.0
+    print(
+        f"[{'✗' if invalid else '✓'}] {files} file(s) checked, {invalid} with "
+        f"syntax errors, {elapsed:.2f}s ({rate:.1f} files/s)"
+    )
+    return invalid
+
+
 def main():
     parser = argparse.ArgumentParser(description="Mini-C Obfuscator CLI")
-    parser.add_argument("input", help="Path to input .mc file")
+    parser.add_argument(
+        "input",
+        nargs="+",
+        help="Path to input .mc file (several files or directories with "
+        "--syntax-only)",
+    )
     parser.add_argument(
         "-o",
         "--output",
@@ -95,9 +194,76 @@ def main():
     )
     parser.add_argument("--inline", action="store_true", help="Inline simple functions")
     parser.add_argument("--all", action="store_true", help="Apply all transformations")
+    parser.add_argument(
+        "--minify", action="store_true", help="Strip whitespace and comments"
+    )
+    parser.add_argument(
+        "--token-rewrite",
+        action="store_true",
+        help="Apply --rename and --minify by rewriting the token stream in "
+        "place instead of regenerating code from the AST; the source layout "
+        "is kept unless minified",
+    )
     parser.add_argument(
         "--check", action="store_true", help="Run GCC equivalence check"
     )
+    parser.add_argument(
+        "--parser",
+        choices=sorted(PARSERS),
+        default="antlr",
+        help="Frontend used to build the AST (default: antlr)",
+    )
+    parser.add_argument(
+        "--lexer",
+        choices=sorted(LEXERS),
+        default="antlr",
+        help="Tokenizer feeding the antlr parser (default: antlr)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse top-level definitions in this many processes, 0 for one "
+        "per core (antlr and fast parsers; default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse ASTs of previously parsed inputs from this directory",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=256,
+        help="Size cap of the AST cache before LRU eviction (default: 256)",
+    )
+    parser.add_argument(
+        "--dfa-cache",
+        help="Load the antlr lexer/parser DFA from this file at startup and "
+        "save it back at exit",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process one top-level definition at a time with the fast parser "
+        "to bound memory on very large inputs; --inline then only inlines "
+        "functions defined before their caller",
+    )
+    parser.add_argument(
+        "--only-functions",
+        help="Comma-separated functions to obfuscate; all others are copied "
+        "verbatim and only parsed if a pass needs them (uses the fast parser)",
+    )
+    parser.add_argument(
+        "--syntax-only",
+        action="store_true",
+        help="Only check that the inputs parse (antlr or fast parser); report "
+        "diagnostics and exit non-zero if any file is invalid",
+    )
+    parser.add_argument(
+        "--parse-stats",
+        action="store_true",
+        help="Report SLL/LL parse stage timings and fallbacks (antlr parser)",
+    )
 
     args = parser.parse_args()
 
@@ -116,7 +282,72 @@ def main():
         if args.inline:
             selected_stages.append("inline")
 
-    run_pipeline(args.input, args.output, selected_stages, args.check)
+    cache = None
+    if args.cache_dir:
+        cache = ASTCache(args.cache_dir, int(args.cache_max_mb * 2**20))
+
+    dfa_cache = None
+    if args.dfa_cache:
+        dfa_cache = DFACache(args.dfa_cache)
+        dfa_cache.load()
+
+    if args.syntax_only and args.parser not in SYNTAX_PARSERS:
+        parser.error(f"--syntax-only is not supported by the {args.parser} parser")
+    if args.jobs != 1 and args.parser not in PARALLEL_PARSERS:
+        parser.error(f"--jobs is not supported by the {args.parser} parser")
+    if args.syntax_only:
+        try:
+            invalid = run_syntax_check(args.input, args.parser, args.lexer)
+        finally:
+            if dfa_cache is not None:
+                dfa_cache.save()
+        sys.exit(1 if invalid else 0)
+    if len(args.input) != 1:
+        parser.error("several inputs are only accepted with --syntax-only")
+    only_functions = None
+    if args.only_functions:
+        if args.stream:
+            parser.error("--only-functions cannot be combined with --stream")
+        only_functions = args.only_functions.split(",")
+    if args.minify and args.stream:
+        parser.error("--minify cannot be combined with --stream")
+    if args.token_rewrite:
+        if set(selected_stages) - {"rename"}:
+            parser.error("--token-rewrite only supports --rename and --minify")
+        if args.stream or only_functions:
+            parser.error(
+                "--token-rewrite cannot be combined with --stream or --only-functions"
+            )
+
+    try:
+        run_pipeline(
+            args.input[0],
+            args.output,
+            selected_stages,
+            args.check,
+            args.parser,
+            args.lexer,
+            cache,
+            args.stream,
+            args.jobs,
+            only_functions,
+            args.minify,
+            args.token_rewrite,
+        )
+    except ParseError as e:
+        # Every frontend and the token rewriter stop at the first syntax
+        # error; report it as --syntax-only does
+        print(Diagnostic(args.input[0], e.line, e.column, e.message), file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if dfa_cache is not None:
+            dfa_cache.save()
+    if args.parse_stats:
+        print(parse_stats.report())
+        if cache is not None:
+            print(cache.report())
+        if dfa_cache is not None:
+            print(dfa_cache.report())
 
 
 if __name__ == "__main__":
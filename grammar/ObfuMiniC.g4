@@ -62,41 +62,19 @@ ioStmt
     | SCANF  '(' STRING (',' '&'? ID)* ')' ';' ;
 
 expr
-    : assignExpr ;
-
-assignExpr
-    : logicOrExpr ('=' assignExpr)? ;
-
-logicOrExpr
-    : logicAndExpr ('||' logicAndExpr)* ;
-
-logicAndExpr
-    : equalityExpr ('&&' equalityExpr)* ;
-
-equalityExpr
-    : relationalExpr (('==' | '!=') relationalExpr)* ;
-
-relationalExpr
-    : addExpr (('<' | '<=' | '>' | '>=') addExpr)* ;
-
-addExpr
-    : mulExpr (('+' | '-') mulExpr)* ;
-
-mulExpr
-    : unaryExpr (('*' | '/' | '%') unaryExpr)* ;
-
-unaryExpr
-    : ('+' | '-' | '!') unaryExpr
-    | primaryExpr ;
-
-primaryExpr
-    : ID LPAREN argList? RPAREN     
-    | ID
-    | NUMBER
-    | CHAR
-    | BOOL
-    | STRING 
-    | '(' expr ')' ;
+    : ID LPAREN argList? RPAREN                     # callExpr
+    | ID                                            # varExpr
+    | (NUMBER | CHAR | BOOL | STRING)               # literalExpr
+    | '(' expr ')'                                  # parenExpr
+    | op=('+' | '-' | '!') expr                     # unaryExpr
+    | expr op=('*' | '/' | '%') expr                # binaryExpr
+    | expr op=('+' | '-') expr                      # binaryExpr
+    | expr op=('<' | '<=' | '>' | '>=') expr        # binaryExpr
+    | expr op=('==' | '!=') expr                    # binaryExpr
+    | expr op='&&' expr                             # binaryExpr
+    | expr op='||' expr                             # binaryExpr
+    | <assoc=right> expr '=' expr                   # assignExpr
+    ;
 
 argList     : expr (',' expr)* ;
 
@@ -1,4 +1,5 @@
-from antlr4 import FileStream, CommonTokenStream
+import argparse
+from antlr4 import CommonTokenStream
 from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
 from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
 from obfuscator.ast_builder import ASTBuilder
@@ -8,16 +9,34 @@ from obfuscator.expression_transform import ExpressionTransformer
 from obfuscator.code_generator import CodeGenerator
 from obfuscator.control_flattening import ControlFlowFlattener
 from obfuscator.inliner import FunctionInliner
+from obfuscator.input_stream import MappedFileStream
+from obfuscator.ast_dump import dump
 
 
 def main():
-    input_stream = FileStream("input/input2.mc")
-    lexer = ObfuMiniCLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = ObfuMiniCParser(stream)
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument(
+        "--dump-ast", action="store_true", help="Print the transformed AST"
+    )
+    arg_parser.add_argument(
+        "--dump-depth", type=int, help="Do not expand AST nodes below this depth"
+    )
+    arg_parser.add_argument(
+        "--dump-functions",
+        help="Comma-separated functions to include in the dump (default: all)",
+    )
+    arg_parser.add_argument(
+        "--dump-compact", action="store_true", help="Print one line per AST node"
+    )
+    args = arg_parser.parse_args()
 
-    tree = parser.compilationUnit()
-    ast = ASTBuilder().visit(tree)
+    with MappedFileStream("input/input2.mc") as input_stream:
+        lexer = ObfuMiniCLexer(input_stream)
+        stream = CommonTokenStream(lexer)
+        parser = ObfuMiniCParser(stream)
+
+        tree = parser.compilationUnit()
+        ast = ASTBuilder().visit(tree)
 
     # change name of variables
     obfuscator = NameObfuscator()
@@ -40,7 +59,14 @@ def main():
     generator = CodeGenerator()
     code = generator.generate(ast)
 
-    print(ast)
+    if args.dump_ast:
+        functions = args.dump_functions.split(",") if args.dump_functions else None
+        dump(
+            ast,
+            max_depth=args.dump_depth,
+            functions=functions,
+            compact=args.dump_compact,
+        )
 
     with open("output.mc", "w") as f:
         f.write(code)
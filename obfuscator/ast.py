@@ -1,46 +1,175 @@
+import io
 from typing import List, Optional
 
 """ Base AST Node """
 
 
 class Node:
-    pass
+    __slots__ = ()
+    _child_fields = ()
+
+    def clone(self):
+        return _clone_tree(self)
 
 
 class ASTNode:
+    __slots__ = ()
+    _child_fields = ()
+
+    def clone(self):
+        return _clone_tree(self)
+
     def __repr__(self):
         return self._repr()
 
     def _repr(self, indent=0):
-        pad = "  " * indent
-        fields = vars(self)
-        result = f"{pad}{self.__class__.__name__}:\n"
-        for k, v in fields.items():
-            result += f"{pad}  {k}: "
-            if isinstance(v, ASTNode):
-                result += "\n" + v._repr(indent + 2)
-            elif isinstance(v, list):
-                result += "[\n"
-                for item in v:
-                    if isinstance(item, ASTNode):
-                        result += item._repr(indent + 3) + "\n"
-                    else:
-                        result += "  " * (indent + 3) + repr(item) + "\n"
-                result += pad + "  ]\n"
-            else:
-                result += repr(v) + "\n"
-        return result
+        # Imported here to avoid a cycle
+        from obfuscator.ast_dump import dump
+
+        out = io.StringIO()
+        dump(self, out, indent=indent)
+        return out.getvalue()
+
+
+def iter_fields(node):
+    """Yields (name, value) for each declared field of node, in the order
+    the constructor takes them."""
+    for name in type(node).__slots__:
+        yield name, getattr(node, name)
+
+
+# Each class lists in _child_fields those of its fields that hold nodes or
+# lists of nodes, in constructor order; the rest are names, operators and
+# values. A child field may still hold None, and Assignment targets and Scan
+# args may be names, so walks check each value (is_node, CHILD_FIELDS).
+
+
+class _ChildFieldTable(dict):
+    """Maps classes to their child fields, or None for values that are not
+    nodes."""
+
+    def __missing__(self, cls):
+        fields = self[cls] = getattr(cls, "_child_fields", None)
+        return fields
+
+
+CHILD_FIELDS = _ChildFieldTable()
+
+
+def is_node(value) -> bool:
+    return CHILD_FIELDS[type(value)] is not None
+
+
+def iter_children(node):
+    """Yields the child nodes of node in field order, the items of list
+    fields in turn, skipping values that are not nodes."""
+    fields = CHILD_FIELDS
+    for name in fields[type(node)]:
+        value = getattr(node, name)
+        if type(value) is list:
+            for item in value:
+                if fields[type(item)] is not None:
+                    yield item
+        elif fields[type(value)] is not None:
+            yield value
+
+
+# Subtrees are copied with node.clone(). A copy has new nodes and lists in
+# the child fields and shares what is never modified in place (Variable,
+# Literal, Label and Goto nodes, strings), which is far cheaper than
+# copy.deepcopy.
+
+
+class _CloneTable(dict):
+    """Maps classes to the obfuscator.ast class their copies are made as
+    (the nearest in the MRO, so a RawFunction is copied as a Function),
+    with its fields and whether each is a child field, or None for values
+    that are shared rather than copied."""
+
+    def __missing__(self, cls):
+        entry = None
+        for base in cls.__mro__:
+            if base.__module__ == __name__ and "__init__" in vars(base):
+                if base not in _SHARED:
+                    entry = base, tuple(
+                        (name, name in base._child_fields) for name in base.__slots__
+                    )
+                break
+        self[cls] = entry
+        return entry
+
+
+_CLONE = _CloneTable()
+
+
+def _clone_tree(root):
+    """Copies the tree under root, listing its nodes with an explicit stack
+    and building the copies bottom-up, so its depth is not limited by the
+    recursion limit."""
+    table = _CLONE
+    # Nodes to copy in preorder, last child first: reversed, every node
+    # comes after its children
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        entry = table[type(node)]
+        if entry is None:
+            continue
+        order.append(node)
+        for name, child in entry[1]:
+            if child:
+                value = getattr(node, name)
+                if type(value) is list:
+                    stack.extend(value)
+                else:
+                    stack.append(value)
+    copies = {}  # id(node) -> its copy
+    for node in reversed(order):
+        cls, fields = table[type(node)]
+        args = []
+        for name, child in fields:
+            value = getattr(node, name)
+            if child:
+                if type(value) is list:
+                    value = [copies.get(id(item), item) for item in value]
+                else:
+                    value = copies.get(id(value), value)
+            args.append(value)
+        copies[id(node)] = cls(*args)
+    return copies[id(root)]
 
 
 """ Program Structure """
 
 
 class Program(ASTNode):
+    __slots__ = ("functions",)
+    _child_fields = ("functions",)
+
     def __init__(self, functions: List["Function"]):
         self.functions = functions
 
 
-class Function(ASTNode):
+class _Memoized(ASTNode):
+    # Holds what is memoized about a function's subtree: its fingerprint
+    # (see obfuscator.fingerprint) and its symbol index (obfuscator.symbols).
+    # Those are not fields, and each class's own __slots__ lists exactly its
+    # fields, so the slots are declared on this base instead.
+    __slots__ = ("_fingerprint", "_symbols")
+
+
+def invalidate(func: "Function") -> None:
+    """Forgets what is memoized about func's subtree. Every pass calls this
+    before changing a function; code that edits a tree by hand must too."""
+    func._fingerprint = None
+    func._symbols = None
+
+
+class Function(_Memoized):
+    __slots__ = ("return_type", "name", "params", "body")
+    _child_fields = ("params", "body")
+
     def __init__(
         self,
         return_type: str,
@@ -55,6 +184,9 @@ class Function(ASTNode):
 
 
 class Parameter(ASTNode):
+    __slots__ = ("param_type", "name")
+    _child_fields = ()
+
     def __init__(self, param_type: str, name: str):
         self.param_type = param_type
         self.name = name
@@ -64,17 +196,20 @@ class Parameter(ASTNode):
 
 
 class Statement(ASTNode):
-    pass
+    __slots__ = ()
 
 
 class Expression(ASTNode):
-    pass
+    __slots__ = ()
 
 
 """ Statements """
 
 
 class VariableDecl(Statement):
+    __slots__ = ("var_type", "name", "init_expr")
+    _child_fields = ("init_expr",)
+
     def __init__(self, var_type: str, name: str, init_expr: Optional[Expression]):
         self.var_type = var_type
         self.name = name
@@ -82,16 +217,25 @@ class VariableDecl(Statement):
 
 
 class ExpressionStmt(Statement):
+    __slots__ = ("expr",)
+    _child_fields = ("expr",)
+
     def __init__(self, expr: Optional[Expression]):
         self.expr = expr
 
 
 class Return(Statement):
+    __slots__ = ("value",)
+    _child_fields = ("value",)
+
     def __init__(self, value: Optional[Expression]):
         self.value = value
 
 
 class IfStmt(Statement):
+    __slots__ = ("condition", "then_branch", "else_branch")
+    _child_fields = ("condition", "then_branch", "else_branch")
+
     def __init__(
         self,
         condition: Expression,
@@ -104,12 +248,18 @@ class IfStmt(Statement):
 
 
 class WhileStmt(Statement):
+    __slots__ = ("condition", "body")
+    _child_fields = ("condition", "body")
+
     def __init__(self, condition: Expression, body: Statement):
         self.condition = condition
         self.body = body
 
 
 class ForStmt(Statement):
+    __slots__ = ("init", "cond", "update", "body")
+    _child_fields = ("init", "cond", "update", "body")
+
     def __init__(
         self,
         init: Optional[Expression],
@@ -124,23 +274,35 @@ class ForStmt(Statement):
 
 
 class Block(Statement):
+    __slots__ = ("items",)
+    _child_fields = ("items",)
+
     def __init__(self, items: List[Statement]):
         self.items = items
 
 
 class Print(Statement):
+    __slots__ = ("format_str", "args")
+    _child_fields = ("args",)
+
     def __init__(self, format_str: str, args: List[Expression]):
         self.format_str = format_str
         self.args = args
 
 
 class Scan(Statement):
+    __slots__ = ("format_str", "args")
+    _child_fields = ("args",)
+
     def __init__(self, format_str: str, args: List[str]):
         self.format_str = format_str
         self.args = args
 
 
 class Assignment(Statement):
+    __slots__ = ("target", "value")
+    _child_fields = ("target", "value")
+
     def __init__(self, target: str, value: Expression):
         self.target = target
         self.value = value
@@ -150,6 +312,9 @@ class Assignment(Statement):
 
 
 class BinaryOp(Expression):
+    __slots__ = ("op", "left", "right")
+    _child_fields = ("left", "right")
+
     def __init__(self, op: str, left: Expression, right: Expression):
         self.op = op
         self.left = left
@@ -157,46 +322,104 @@ class BinaryOp(Expression):
 
 
 class UnaryOp(Expression):
+    __slots__ = ("op", "operand")
+    _child_fields = ("operand",)
+
     def __init__(self, op: str, operand: Expression):
         self.op = op
         self.operand = operand
 
 
+# Literal and Variable nodes may be shared (see obfuscator.leaves): replace
+# them rather than assigning to their fields. Copies share them too.
+
+
 class Literal(Expression):
+    __slots__ = ("value",)
+    _child_fields = ()
+
     def __init__(self, value):
         self.value = value
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def clone(self):
+        return self
+
 
 class Variable(Expression):
+    __slots__ = ("name",)
+    _child_fields = ()
+
     def __init__(self, name: str):
         self.name = name
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def clone(self):
+        return self
+
 
 class FuncCall(Expression):
+    __slots__ = ("name", "args")
+    _child_fields = ("args",)
+
     def __init__(self, name: str, args: List[Expression]):
         self.name = name
         self.args = args
 
 
 class Label:
+    __slots__ = ("name",)
+    _child_fields = ()
+
     def __init__(self, name):
         self.name = name
 
+    def clone(self):
+        # Never modified, so copies share it
+        return self
+
 
 class Goto(Node):
+    __slots__ = ("label",)
+    _child_fields = ()
+
     def __init__(self, label):
         self.label = label
 
+    def clone(self):
+        # Never modified, so copies share it
+        return self
+
+
+class SwitchCase(Node):
+    __slots__ = ("value", "label", "body")
+    _child_fields = ("value", "label", "body")
 
-class SwitchCase:
     def __init__(self, value, label, body):
         self.value = value
         self.label = label
         self.body = body
 
 
-class Switch:
+class Switch(Node):
+    __slots__ = ("expr", "cases", "default")
+    _child_fields = ("expr", "cases", "default")
+
     def __init__(self, expr, cases, default=None):
         self.expr = expr
         self.cases = cases
         self.default = default
+
+
+# Copies share these rather than copying them
+_SHARED = (Literal, Variable, Label, Goto)
@@ -17,12 +17,21 @@ from obfuscator.ast import (
     BinaryOp,
     UnaryOp,
     FuncCall,
-    Variable,
-    Literal,
+    Label,
+    Switch,
+    SwitchCase,
 )
+from obfuscator.leaves import LeafInterner
+
+# Pushed above an expression whose operands are still on the work stack
+_EXIT = object()
 
 
 class ASTBuilder(ObfuMiniCVisitor):
+    def __init__(self):
+        super().__init__()
+        self.leaves = LeafInterner()
+
     def visitSwitchStmt(self, ctx):
         expr = self.visit(ctx.expr())
         cases = []
@@ -71,7 +80,7 @@ class ASTBuilder(ObfuMiniCVisitor):
 
     def visitFuncDef(self, ctx):
         return_type = ctx.type_().getText()
-        name = ctx.ID().getText()
+        name = self.leaves.name(ctx.ID().getText())
         params = self.visit(ctx.paramList()) if ctx.paramList() else []
         block = self.visit(ctx.blockStmt())
         return Function(
@@ -82,7 +91,7 @@ class ASTBuilder(ObfuMiniCVisitor):
         return [self.visit(p) for p in ctx.param()]
 
     def visitParam(self, ctx):
-        return Parameter(ctx.type_().getText(), ctx.ID().getText())
+        return Parameter(ctx.type_().getText(), self.leaves.name(ctx.ID().getText()))
 
     def visitBlockStmt(self, ctx):
         stmts = []
@@ -100,7 +109,7 @@ class ASTBuilder(ObfuMiniCVisitor):
         var_type = ctx.type_().getText()
         decls = []
         for init in ctx.initList().init():
-            name = init.ID().getText()
+            name = self.leaves.name(init.ID().getText())
             expr = self.visit(init.expr()) if init.expr() else None
             decls.append(VariableDecl(var_type, name, expr))
         return decls
@@ -125,9 +134,15 @@ class ASTBuilder(ObfuMiniCVisitor):
             body = self.visit(ctx.stmt())
             return WhileStmt(cond, body)
         else:
-            init = self.visit(ctx.expr(0)) if ctx.expr(0) else None
-            cond = self.visit(ctx.expr(1)) if ctx.expr(1) else None
-            update = self.visit(ctx.expr(2)) if ctx.expr(2) else None
+            # Each clause is optional, so place expressions by the ';' before them.
+            clauses = [None, None, None]
+            slot = 0
+            for child in ctx.children:
+                if isinstance(child, ObfuMiniCParser.ExprContext):
+                    clauses[slot] = self.visit(child)
+                elif child.getText() == ";":
+                    slot += 1
+            init, cond, update = clauses
             body = self.visit(ctx.stmt())
             return ForStmt(init, cond, update, body)
 
@@ -138,99 +153,88 @@ class ASTBuilder(ObfuMiniCVisitor):
             return Print(fmt, args)
         elif ctx.SCANF():
             fmt = ctx.STRING().getText().strip('"')
-            args = [tok.getText().replace("&", "") for tok in ctx.ID()]
+            args = [
+                self.leaves.name(tok.getText().replace("&", "")) for tok in ctx.ID()
+            ]
             return Scan(fmt, args)
 
     # === Expressions ===
 
+    # Expression contexts nest once per operator, so a chain like a+a+...+a
+    # is as deep as it is long. Compound expressions are therefore built by
+    # _expr with an explicit stack rather than one visit per level.
+
     def visitAssignExpr(self, ctx):
-        if ctx.getChildCount() == 3:
-            target = ctx.getChild(0).getText()
-            value = self.visit(ctx.assignExpr())
-            return Assignment(target, value)
-        return self.visit(ctx.logicOrExpr())
-
-    def visitLogicOrExpr(self, ctx):
-        if len(ctx.logicAndExpr()) == 1:
-            return self.visit(ctx.logicAndExpr(0))
-        left = self.visit(ctx.logicAndExpr(0))
-        for i in range(1, len(ctx.logicAndExpr())):
-            right = self.visit(ctx.logicAndExpr(i))
-            left = BinaryOp("||", left, right)
-        return left
-
-    def visitLogicAndExpr(self, ctx):
-        if len(ctx.equalityExpr()) == 1:
-            return self.visit(ctx.equalityExpr(0))
-        left = self.visit(ctx.equalityExpr(0))
-        for i in range(1, len(ctx.equalityExpr())):
-            right = self.visit(ctx.equalityExpr(i))
-            left = BinaryOp("&&", left, right)
-        return left
-
-    def visitEqualityExpr(self, ctx):
-        left = self.visit(ctx.relationalExpr(0))
-        for i in range(1, len(ctx.relationalExpr())):
-            op = ctx.getChild(2 * i - 1).getText()
-            right = self.visit(ctx.relationalExpr(i))
-            left = BinaryOp(op, left, right)
-        return left
-
-    def visitRelationalExpr(self, ctx):
-        left = self.visit(ctx.addExpr(0))
-        for i in range(1, len(ctx.addExpr())):
-            op = ctx.getChild(2 * i - 1).getText()
-            right = self.visit(ctx.addExpr(i))
-            left = BinaryOp(op, left, right)
-        return left
-
-    def visitAddExpr(self, ctx):
-        left = self.visit(ctx.mulExpr(0))
-        for i in range(1, len(ctx.mulExpr())):
-            op = ctx.getChild(2 * i - 1).getText()
-            right = self.visit(ctx.mulExpr(i))
-            left = BinaryOp(op, left, right)
-        return left
-
-    def visitMulExpr(self, ctx):
-        left = self.visit(ctx.unaryExpr(0))
-        for i in range(1, len(ctx.unaryExpr())):
-            op = ctx.getChild(2 * i - 1).getText()
-            right = self.visit(ctx.unaryExpr(i))
-            left = BinaryOp(op, left, right)
-        return left
+        return self._expr(ctx)
+
+    def visitBinaryExpr(self, ctx):
+        return self._expr(ctx)
 
     def visitUnaryExpr(self, ctx):
-        if ctx.getChildCount() == 2:
-            op = ctx.getChild(0).getText()
-            operand = self.visit(ctx.unaryExpr())
-            return UnaryOp(op, operand)
-        return self.visit(ctx.primaryExpr())
-
-    def visitPrimaryExpr(self, ctx):
-        if ctx.ID() and ctx.LPAREN():
-            name = ctx.ID().getText()
-            args = self.visit(ctx.argList()) if ctx.argList() else []
-            return FuncCall(name, args)
-
-        if ctx.ID() and ctx.expr():
-            return FuncCall(
-                ctx.ID().getText(), self.visit(ctx.argList()) if ctx.argList() else []
-            )
-        elif ctx.ID():
-            return Variable(ctx.ID().getText())
-        elif ctx.NUMBER():
-            return Literal(int(ctx.NUMBER().getText()))
-        elif ctx.BOOL():
-            return Literal(ctx.BOOL().getText() == "true")
-        elif ctx.CHAR():
-            return Literal(ctx.CHAR().getText().strip("'"))
-        elif ctx.STRING():
-            return Literal(ctx.STRING().getText().strip('"'))
-        elif ctx.expr():
-            return self.visit(ctx.expr())
-        else:
-            return None
+        return self._expr(ctx)
+
+    def visitCallExpr(self, ctx):
+        return self._expr(ctx)
+
+    def visitParenExpr(self, ctx):
+        return self._expr(ctx)
+
+    def _expr(self, ctx):
+        # A context's operands are pushed above it and _EXIT; when _EXIT
+        # comes back up, their nodes are the last ones on out.
+        out = []
+        stack = [ctx]
+        while stack:
+            ctx = stack.pop()
+            if ctx is _EXIT:
+                ctx = stack.pop()
+                if isinstance(ctx, ObfuMiniCParser.BinaryExprContext):
+                    right = out.pop()
+                    out.append(BinaryOp(ctx.op.text, out.pop(), right))
+                elif isinstance(ctx, ObfuMiniCParser.UnaryExprContext):
+                    out.append(UnaryOp(ctx.op.text, out.pop()))
+                elif isinstance(ctx, ObfuMiniCParser.CallExprContext):
+                    n = len(ctx.argList().expr()) if ctx.argList() else 0
+                    args = out[len(out) - n :]
+                    del out[len(out) - n :]
+                    out.append(FuncCall(self.leaves.name(ctx.ID().getText()), args))
+                else:
+                    out.append(Assignment(ctx.expr(0).getText(), out.pop()))
+            elif isinstance(ctx, ObfuMiniCParser.BinaryExprContext):
+                stack += (ctx, _EXIT, ctx.expr(1), ctx.expr(0))
+            elif isinstance(ctx, ObfuMiniCParser.UnaryExprContext):
+                stack += (ctx, _EXIT, ctx.expr())
+            elif isinstance(ctx, ObfuMiniCParser.CallExprContext):
+                stack += (ctx, _EXIT)
+                if ctx.argList():
+                    stack.extend(reversed(ctx.argList().expr()))
+            elif isinstance(ctx, ObfuMiniCParser.AssignExprContext):
+                stack += (ctx, _EXIT, ctx.expr(1))
+            elif isinstance(ctx, ObfuMiniCParser.ParenExprContext):
+                stack.append(ctx.expr())
+            else:
+                out.append(self.visit(ctx))
+        return out[0]
+
+    def visitVarExpr(self, ctx):
+        return self.leaves.variable(ctx.ID().getText())
+
+    def visitLiteralExpr(self, ctx):
+        return self._literal(ctx.start)
+
+    def visitLiteral(self, ctx):
+        return self._literal(ctx.start)
+
+    def _literal(self, token):
+        if token.type == ObfuMiniCParser.NUMBER:
+            return self.leaves.literal(int(token.text))
+        elif token.type == ObfuMiniCParser.BOOL:
+            return self.leaves.literal(token.text == "true")
+        elif token.type == ObfuMiniCParser.CHAR:
+            return self.leaves.literal(token.text.strip("'"))
+        elif token.type == ObfuMiniCParser.STRING:
+            return self.leaves.literal(token.text.strip('"'))
+        return None
 
     def visitArgList(self, ctx):
         return [self.visit(e) for e in ctx.expr()]
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import tempfile
+import zlib
+from obfuscator import ast, wire
+from obfuscator.parser.ObfuMiniCLexer import serializedATN as lexer_atn
+from obfuscator.parser.ObfuMiniCParser import serializedATN as parser_atn
+
+# Bump when the on-disk encoding changes.
+CACHE_FORMAT = 3
+
+# Modules whose source determines the AST built for a given input.
+_FRONTEND_MODULES = [
+    "ast",
+    "ast_builder",
+    "ast_listener",
+    "fast_lexer",
+    "fast_parser",
+    "frontend",
+    "incremental",
+    "input_stream",
+    "leaves",
+]
+
+_fingerprint = None
+
+
+def frontend_fingerprint() -> bytes:
+    """Hash of the grammar ATNs and frontend sources, computed once per process."""
+    global _fingerprint
+    if _fingerprint is None:
+        h = hashlib.sha256(f"format={CACHE_FORMAT}".encode())
+        h.update(repr(lexer_atn()).encode())
+        h.update(repr(parser_atn()).encode())
+        package_dir = os.path.dirname(ast.__file__)
+        for name in _FRONTEND_MODULES:
+            with open(os.path.join(package_dir, name + ".py"), "rb") as f:
+                h.update(f.read())
+        _fingerprint = h.digest()
+    return _fingerprint
+
+
+# Entries are Programs in the wire format (see obfuscator.wire), compressed.
+# Unlike marshal, it takes trees of any depth.
+
+
+def dumps(program: ast.Program) -> bytes:
+    return zlib.compress(wire.dumps(program), 1)
+
+
+def loads(data: bytes) -> ast.Program:
+    return wire.loads(zlib.decompress(data))
+
+
+class ASTCache:
+    """Content-addressed on-disk cache of frontend results.
+
+    Entries are keyed by the input bytes, the parser backend and the
+    frontend fingerprint, and hold the Program in the compressed wire
+    format above. Writes go through a temporary file and os.replace, so
+    concurrent processes only ever see complete entries. Hits refresh the
+    entry's mtime and eviction removes the least recently used entries once
+    the directory grows past max_bytes.
+    """
+
+    SUFFIX = ".ast"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, source: bytes, parser: str) -> str:
+        h = hashlib.sha256(frontend_fingerprint())
+        h.update(parser.encode())
+        h.update(b"\0")
+        h.update(source)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                program = loads(f.read())
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (ValueError, EOFError, TypeError, IndexError, zlib.error):
+            # Unreadable entry, e.g. written by an incompatible interpreter.
+            self._remove(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return program
+
+    def put(self, key: str, program: ast.Program, evict: bool = True) -> None:
+        data = dumps(program)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        if evict:
+            self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                self.evictions += 1
+            total -= size
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def report(self) -> str:
+        return (
+            f"AST cache {self.directory}: {self.hits} hit(s), "
+            f"{self.misses} miss(es), {self.evictions} eviction(s)"
+        )
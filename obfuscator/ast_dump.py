@@ -0,0 +1,123 @@
+import sys
+from obfuscator.ast import ASTNode, Program, is_node, iter_fields
+
+
+def _has_own_repr(node) -> bool:
+    # Nodes such as RawFunction print themselves without their fields
+    return getattr(type(node), "_repr", ASTNode._repr) is not ASTNode._repr
+
+
+def dump(
+    node,
+    out=None,
+    max_depth: int = None,
+    functions=None,
+    compact: bool = False,
+    indent: int = 0,
+) -> None:
+    """Writes node to out (default sys.stdout) as it walks the tree.
+
+    The default format is the one repr() gives; compact=True writes one
+    line per node instead, with its scalar fields inline and each child on
+    its own line, labelled with the field it sits in. Nodes deeper than
+    max_depth (the root is at depth 0) are shown but not expanded.
+    functions, a collection of names, restricts a Program to those
+    functions. Lines are written as soon as they are known, with an
+    explicit stack, so the dump costs time linear in the tree and memory
+    proportional to its depth.
+    """
+    if out is None:
+        out = sys.stdout
+    if functions is not None and isinstance(node, Program):
+        functions = set(functions)
+        node = Program([f for f in node.functions if f.name in functions])
+    if compact:
+        _dump_compact(node, out.write, max_depth)
+    else:
+        _dump_tree(node, out.write, max_depth, indent)
+
+
+# Pieces of text collected before each write to the stream
+_BUFFERED = 1024
+
+
+def _dump_tree(root, write, max_depth, indent):
+    buffer = []
+    stack = [(root, indent, 0)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            buffer.append(item)
+        else:
+            _expand(item, buffer, stack, max_depth)
+        if len(buffer) >= _BUFFERED:
+            write("".join(buffer))
+            buffer.clear()
+    write("".join(buffer))
+
+
+def _expand(item, buffer, stack, max_depth):
+    """Writes a node's text up to its first child to buffer and pushes the
+    rest, children and the text between them, onto stack."""
+    node, indent, depth = item
+    pad = "  " * indent
+    if _has_own_repr(node):
+        buffer.append(node._repr(indent))
+        return
+    if max_depth is not None and depth >= max_depth:
+        buffer.append(f"{pad}{node.__class__.__name__}: ...\n")
+        return
+    # Text and child nodes in output order, adjacent text merged
+    parts = []
+    text = [f"{pad}{node.__class__.__name__}:\n"]
+    for k in type(node).__slots__:
+        v = getattr(node, k)
+        if is_node(v):
+            text.append(f"{pad}  {k}: \n")
+            parts.append("".join(text))
+            parts.append((v, indent + 2, depth + 1))
+            text = []
+        elif isinstance(v, list):
+            text.append(f"{pad}  {k}: [\n")
+            item_pad = "  " * (indent + 3)
+            for element in v:
+                if is_node(element):
+                    parts.append("".join(text))
+                    parts.append((element, indent + 3, depth + 1))
+                    text = ["\n"]
+                else:
+                    text.append(item_pad + repr(element) + "\n")
+            text.append(pad + "  ]\n")
+        else:
+            text.append(f"{pad}  {k}: {v!r}\n")
+    parts.append("".join(text))
+    buffer.append(parts[0])
+    stack.extend(reversed(parts[1:]))
+
+
+def _dump_compact(root, write, max_depth):
+    stack = [(root, "", 0)]
+    while stack:
+        node, label, depth = stack.pop()
+        pad = "  " * depth
+        if _has_own_repr(node):
+            write(f"{pad}{label}{node._repr().strip()}\n")
+            continue
+        line = [f"{pad}{label}{node.__class__.__name__}"]
+        children = []
+        for k, v in iter_fields(node):
+            if is_node(v):
+                children.append((v, f"{k}: ", depth + 1))
+            elif isinstance(v, list) and any(is_node(e) for e in v):
+                for i, element in enumerate(v):
+                    if is_node(element):
+                        children.append((element, f"{k}[{i}]: ", depth + 1))
+                    else:
+                        line.append(f"{k}[{i}]={element!r}")
+            else:
+                line.append(f"{k}={v!r}")
+        if children and max_depth is not None and depth >= max_depth:
+            line.append("...")
+            children = []
+        write(" ".join(line) + "\n")
+        stack.extend(reversed(children))
@@ -0,0 +1,51 @@
+from antlr4.tree.Tree import TerminalNode
+from obfuscator.parser.ObfuMiniCListener import ObfuMiniCListener
+from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
+from obfuscator.ast_builder import ASTBuilder
+from obfuscator.ast import Program
+
+
+class ASTListener(ObfuMiniCListener):
+    """Builds the AST while the parser runs, one top-level definition at a time.
+
+    Registered with Parser.addParseListener, it converts each funcDef as soon
+    as its rule exits, using ASTBuilder on that subtree only, and then prunes
+    the subtree from the parse tree. Only the definition being parsed is ever
+    held as contexts. Top-level varDecls are pruned too, since ASTBuilder
+    drops them.
+    """
+
+    def __init__(self):
+        self.builder = ASTBuilder()
+        self.functions = []
+
+    def reset(self) -> None:
+        """Forgets the functions of an abandoned parse (e.g. a failed SLL pass)."""
+        self.functions = []
+
+    def program(self) -> Program:
+        return Program(self.functions)
+
+    def exitFuncDef(self, ctx: ObfuMiniCParser.FuncDefContext):
+        self.functions.append(self.builder.visitFuncDef(ctx))
+        self._prune(ctx)
+
+    def exitVarDecl(self, ctx: ObfuMiniCParser.VarDeclContext):
+        if isinstance(ctx.parentCtx, ObfuMiniCParser.CompilationUnitContext):
+            self._prune(ctx)
+
+    def _prune(self, ctx):
+        # The listener runs before the parser pops ctx, so it is still the
+        # last child of the compilation unit.
+        ctx.parentCtx.removeLastChild()
+        # Break the parent/child cycles below ctx so the subtree is freed
+        # right away instead of at the next full garbage collection; ctx's
+        # own parentCtx is still needed by Parser.exitRule.
+        stack = [ctx]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, TerminalNode) and node.children:
+                for child in node.children:
+                    child.parentCtx = None
+                stack.extend(node.children)
+                node.children = None
@@ -1,7 +1,8 @@
 from obfuscator.ast import *
+from obfuscator.visitor import NodeVisitor
 
 
-class CodeGenerator:
+class CodeGenerator(NodeVisitor):
     def __init__(self):
         self.indent_level = 0
         self.output = []
@@ -14,135 +15,160 @@ class CodeGenerator:
             self.visit(func)
         return "\n".join(self.output)
 
-    def visit(self, node):
-        if isinstance(node, Program):
-            for func in node.functions:
-                self.visit(func)
-
-        elif isinstance(node, Function):
-            params = ", ".join([f"{p.param_type} {p.name}" for p in node.params])
-            self.emit(f"{node.return_type} {node.name}({params}) {{")
-            self.indent_level += 1
-            for stmt in node.body:
-                self.visit(stmt)
-            self.indent_level -= 1
-            self.emit("}")
-
-        elif isinstance(node, VariableDecl):
-            if node.init_expr:
-                expr = self.visit_expr(node.init_expr)
-                self.emit(f"{node.var_type} {node.name} = {expr};")
-            else:
-                self.emit(f"{node.var_type} {node.name};")
-
-        elif isinstance(node, Assignment):
-            expr = self.visit_expr(node.value)
-            target = (
-                node.target.name
-                if isinstance(node.target, Variable)
-                else str(node.target)
-            )
-            self.emit(f"{target} = {expr};")
-
-        elif isinstance(node, Return):
-            expr = self.visit_expr(node.value)
-            self.emit(f"return {expr};")
-
-        elif isinstance(node, IfStmt):
-            cond = self.visit_expr(node.condition)
-            self.emit(f"if ({cond})")
-            self.visit(node.then_branch)
-            if node.else_branch:
-                self.emit("else")
-                self.visit(node.else_branch)
-
-        elif isinstance(node, WhileStmt):
-            cond = self.visit_expr(node.condition)
-            self.emit(f"while ({cond})")
-            self.visit(node.body)
-
-        elif isinstance(node, ForStmt):
-            init = self.visit_expr(node.init) if node.init else ""
-            cond = self.visit_expr(node.cond) if node.cond else ""
-            update = self.visit_expr(node.update) if node.update else ""
-            self.emit(f"for ({init}; {cond}; {update})")
-            self.visit(node.body)
-
-        elif isinstance(node, Block):
-            self.emit("{")
-            self.indent_level += 1
-            for stmt in node.items:
-                self.visit(stmt)
-            self.indent_level -= 1
-            self.emit("}")
-
-        elif isinstance(node, ExpressionStmt):
-            expr = self.visit_expr(node.expr)
-            self.emit(f"{expr};")
-
-        elif isinstance(node, Print):
-            if node.args:
-                args = ", ".join([self.visit_expr(arg) for arg in node.args])
-                self.emit(f'printf("{node.format_str}", {args});')
-            else:
-                self.emit(f'printf("{node.format_str}");')
-
-        elif isinstance(node, Label):
-            self.indent_level = max(0, self.indent_level - 1)
-            self.emit(f"{node.name}:")
-            self.indent_level += 1
-
-        elif isinstance(node, Goto):
-            self.emit(f"goto {node.label};")
-
-        elif isinstance(node, Switch):
-            expr = self.visit_expr(node.expr)
-            self.emit(f"switch ({expr}) {{")
-            self.indent_level += 1
-            for case in node.cases:
-                case_value = self.visit_expr(case.value)
-                self.emit(f"case {case_value}: goto {case.label.name};")
-            self.indent_level -= 1
-            self.emit("}")
+    def visit_Program(self, node):
+        return node.functions
 
-        else:
-            self.emit(f"// Unknown node: {type(node).__name__}")
+    def visit_RawFunction(self, node):
+        self.output.append(node.source)
 
-    def visit_expr(self, expr):
-        if isinstance(expr, Literal):
-            if isinstance(expr.value, str):
-                escaped = (
-                    expr.value.replace("\\", "\\\\")
-                    .replace('"', '\\"')
-                    .replace("\n", "\\n")
-                )
-                return f'"{escaped}"'
-            else:
-                return str(expr.value)
+    def visit_Function(self, node):
+        params = ", ".join([f"{p.param_type} {p.name}" for p in node.params])
+        self.emit(f"{node.return_type} {node.name}({params}) {{")
+        self.indent_level += 1
+        yield from node.body
+        self.indent_level -= 1
+        self.emit("}")
 
-        elif isinstance(expr, Variable):
-            return expr.name
+    def visit_VariableDecl(self, node):
+        if node.init_expr:
+            expr = self.visit_expr(node.init_expr)
+            self.emit(f"{node.var_type} {node.name} = {expr};")
+        else:
+            self.emit(f"{node.var_type} {node.name};")
+
+    def visit_Assignment(self, node):
+        expr = self.visit_expr(node.value)
+        target = (
+            node.target.name if isinstance(node.target, Variable) else str(node.target)
+        )
+        self.emit(f"{target} = {expr};")
+
+    def visit_Return(self, node):
+        expr = self.visit_expr(node.value)
+        self.emit(f"return {expr};")
+
+    def visit_IfStmt(self, node):
+        cond = self.visit_expr(node.condition)
+        self.emit(f"if ({cond})")
+        yield node.then_branch
+        if node.else_branch:
+            self.emit("else")
+            yield node.else_branch
+
+    def visit_WhileStmt(self, node):
+        cond = self.visit_expr(node.condition)
+        self.emit(f"while ({cond})")
+        return (node.body,)
+
+    def visit_ForStmt(self, node):
+        init = self.visit_expr(node.init) if node.init else ""
+        cond = self.visit_expr(node.cond) if node.cond else ""
+        update = self.visit_expr(node.update) if node.update else ""
+        self.emit(f"for ({init}; {cond}; {update})")
+        return (node.body,)
+
+    def visit_Block(self, node):
+        self.emit("{")
+        self.indent_level += 1
+        yield from node.items
+        self.indent_level -= 1
+        self.emit("}")
+
+    def visit_ExpressionStmt(self, node):
+        expr = self.visit_expr(node.expr)
+        self.emit(f"{expr};")
+
+    def visit_Print(self, node):
+        if node.args:
+            args = ", ".join([self.visit_expr(arg) for arg in node.args])
+            self.emit(f'printf("{node.format_str}", {args});')
+        else:
+            self.emit(f'printf("{node.format_str}");')
 
-        elif isinstance(expr, BinaryOp):
-            left = self.visit_expr(expr.left)
-            right = self.visit_expr(expr.right)
-            return f"({left} {expr.op} {right})"
+    def visit_Label(self, node):
+        self.indent_level = max(0, self.indent_level - 1)
+        self.emit(f"{node.name}:")
+        self.indent_level += 1
 
-        elif isinstance(expr, UnaryOp):
-            operand = self.visit_expr(expr.operand)
-            return f"({expr.op}{operand})"
+    def visit_Goto(self, node):
+        self.emit(f"goto {node.label};")
 
-        elif isinstance(expr, FuncCall):
-            args = ", ".join([self.visit_expr(arg) for arg in expr.args])
-            return f"{expr.name}({args})"
+    def visit_Switch(self, node):
+        expr = self.visit_expr(node.expr)
+        self.emit(f"switch ({expr}) {{")
+        self.indent_level += 1
+        for case in node.cases:
+            case_value = self.visit_expr(case.value)
+            self.emit(f"case {case_value}: goto {case.label.name};")
+        self.indent_level -= 1
+        self.emit("}")
 
-        elif isinstance(expr, Assignment):
-            target = (
-                expr.target.name
-                if isinstance(expr.target, Variable)
-                else str(expr.target)
+    def generic_visit(self, node):
+        self.emit(f"// Unknown node: {type(node).__name__}")
+
+    def visit_expr(self, expr):
+        """The C text of an expression, written out with an explicit stack.
+
+        A node pushes its operands together with the text between them, in
+        reverse, so popping the stack yields the pieces in order; they are
+        joined once at the end. Deep expressions therefore cost neither a
+        Python frame per level nor a copy of each operand's text per level.
+        """
+        cls = type(expr)
+        if cls is Variable:
+            return expr.name
+        if cls is Literal:
+            return self._literal(expr)
+        parts = []
+        stack = [expr]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            cls = type(node)
+            if cls is str:
+                parts.append(node)
+            elif cls is Variable:
+                parts.append(node.name)
+            elif cls is Literal:
+                parts.append(self._literal(node))
+            elif cls is BinaryOp:
+                push(")")
+                push(node.right)
+                push(f" {node.op} ")
+                push(node.left)
+                push("(")
+            elif cls is UnaryOp:
+                push(")")
+                push(node.operand)
+                push(f"({node.op}")
+            elif cls is FuncCall:
+                push(")")
+                for i in range(len(node.args) - 1, 0, -1):
+                    push(node.args[i])
+                    push(", ")
+                if node.args:
+                    push(node.args[0])
+                push(f"{node.name}(")
+            elif cls is Assignment:
+                target = (
+                    node.target.name
+                    if isinstance(node.target, Variable)
+                    else str(node.target)
+                )
+                push(node.value)
+                push(f"{target} = ")
+            else:
+                parts.append(f"/* Unknown expr: {cls.__name__} */")
+        return "".join(parts)
+
+    def _literal(self, expr):
+        if isinstance(expr.value, str):
+            escaped = (
+                expr.value.replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
             )
-            value = self.visit_expr(expr.value)
-            return f"{target} = {value}"
+            return f'"{escaped}"'
         else:
-            return f"/* Unknown expr: {type(expr).__name__} */"
+            return str(expr.value)
@@ -1,6 +1,6 @@
 from obfuscator.ast import *
+from obfuscator.symbols import symbol_index
 from itertools import count
-from typing import List
 
 
 class ControlFlowFlattener:
@@ -21,8 +21,10 @@ class ControlFlowFlattener:
         end_label_name = f"{prefix}_end"
 
         # Collect all variables (declared, assigned, or used)
-        all_vars = self.collect_all_variables(func.body)
-        returned_vars = self.collect_returned_variable_names(func.body)
+        index = symbol_index(func)
+        all_vars = index.local_names()
+        returned_vars = index.returns.keys()
+        invalidate(func)
 
         # Initialize state variable to 0
         state_decl = VariableDecl("int", state_var, Literal(0))
@@ -116,116 +118,3 @@ class ControlFlowFlattener:
 
         func.body = new_body + [dispatcher_label, dispatcher] + case_bodies
         return func
-
-    def collect_all_variables(self, stmts: List[ASTNode]):
-        """Collect all variable names (declared, assigned, or used in expressions)."""
-        vars = set()
-
-        def walk(node):
-            if isinstance(node, VariableDecl):
-                vars.add(node.name)
-            elif isinstance(node, Variable):
-                vars.add(node.name)
-            elif isinstance(node, Assignment):
-                if isinstance(node.target, Variable):
-                    vars.add(node.target.name)
-                walk(node.value)
-            elif isinstance(node, BinaryOp):
-                walk(node.left)
-                walk(node.right)
-            elif isinstance(node, FuncCall):
-                for arg in node.args:
-                    walk(arg)
-            elif isinstance(node, list):
-                for s in node:
-                    walk(s)
-            elif isinstance(node, IfStmt):
-                walk(node.condition)
-                walk(node.then_branch)
-                if node.else_branch:
-                    walk(node.else_branch)
-            elif isinstance(node, ForStmt):
-                if node.init:
-                    if isinstance(node.init, VariableDecl):
-                        vars.add(node.init.name)
-                    elif isinstance(node.init, Assignment):
-                        if isinstance(node.init.target, Variable):
-                            vars.add(node.init.target.name)
-                    elif isinstance(node.init, ExpressionStmt):
-                        if isinstance(node.init.expr, Assignment):
-                            if isinstance(node.init.expr.target, Variable):
-                                vars.add(node.init.expr.target.name)
-                    walk(node.init)
-                if node.cond:
-                    walk(node.cond)
-                if node.update:
-                    if isinstance(node.update, Assignment):
-                        if isinstance(node.update.target, Variable):
-                            vars.add(node.update.target.name)
-                    elif isinstance(node.update, ExpressionStmt):
-                        if isinstance(node.update.expr, Assignment):
-                            if isinstance(node.update.expr.target, Variable):
-                                vars.add(node.update.expr.target.name)
-                    walk(node.update)
-                walk(node.body)
-            elif isinstance(node, WhileStmt):
-                walk(node.condition)
-                walk(node.body)
-            elif isinstance(node, Return):
-                if node.value:
-                    walk(node.value)
-            elif isinstance(node, ExpressionStmt):
-                if node.expr:
-                    walk(node.expr)
-            elif isinstance(node, Print):
-                for arg in node.args:
-                    walk(arg)
-            elif isinstance(node, Scan):
-                for arg in node.args:
-                    if isinstance(arg, Variable):
-                        walk(arg)
-            elif hasattr(node, "__dict__"):
-                for val in node.__dict__.values():
-                    if isinstance(val, ASTNode):
-                        walk(val)
-                    elif isinstance(val, list):
-                        for item in val:
-                            if isinstance(item, ASTNode):
-                                walk(item)
-
-        for s in stmts:
-            walk(s)
-        return vars
-
-    def collect_returned_variable_names(self, stmts: List[ASTNode]):
-        """Track returned variables (used in return statements)."""
-        names = set()
-
-        def walk(node):
-            if isinstance(node, Return) and isinstance(node.value, Variable):
-                names.add(node.value.name)
-            elif isinstance(node, list):
-                for s in node:
-                    walk(s)
-            elif isinstance(node, IfStmt):
-                walk(node.then_branch)
-                if node.else_branch:
-                    walk(node.else_branch)
-            elif isinstance(node, ForStmt):
-                walk(node.body)
-            elif isinstance(node, WhileStmt):
-                walk(node.body)
-            elif isinstance(node, ExpressionStmt):
-                if node.expr:
-                    walk(node.expr)
-            elif isinstance(node, Print):
-                for arg in node.args:
-                    walk(arg)
-            elif isinstance(node, Scan):
-                for arg in node.args:
-                    if isinstance(arg, Variable):
-                        walk(arg)
-
-        for s in stmts:
-            walk(s)
-        return names
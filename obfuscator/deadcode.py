@@ -1,44 +1,49 @@
 import random
 from obfuscator.ast import *
+from obfuscator.visitor import walk
 
 
 class DeadCodeInserter:
     def __init__(self):
         self.counter = 0
 
-    def insert(self, node):
-        if isinstance(node, Program):
-            for func in node.functions:
-                self.insert(func)
-
-        elif isinstance(node, Function):
-            new_body = []
-            for stmt in node.body:
-                if random.random() < 0.3:
-                    new_body.append(self.make_dead_stmt())
-                self.insert(stmt)
-                new_body.append(stmt)
-            node.body = new_body
-
-        elif isinstance(node, Block):
-            new_items = []
-            for stmt in node.items:
-                if random.random() < 0.3:
-                    new_items.append(self.make_dead_stmt())
-                self.insert(stmt)
-                new_items.append(stmt)
-            node.items = new_items
-
-        elif isinstance(node, IfStmt):
-            self.insert(node.then_branch)
-            if node.else_branch:
-                self.insert(node.else_branch)
-
-        elif isinstance(node, WhileStmt):
-            self.insert(node.body)
-
-        elif isinstance(node, ForStmt):
-            self.insert(node.body)
+    insert = walk("insert_", "generic_insert")
+
+    def insert_Program(self, node):
+        return node.functions
+
+    def insert_Function(self, node):
+        invalidate(node)
+        new_body = []
+        for stmt in node.body:
+            if random.random() < 0.3:
+                new_body.append(self.make_dead_stmt())
+            yield stmt
+            new_body.append(stmt)
+        node.body = new_body
+
+    def insert_Block(self, node):
+        new_items = []
+        for stmt in node.items:
+            if random.random() < 0.3:
+                new_items.append(self.make_dead_stmt())
+            yield stmt
+            new_items.append(stmt)
+        node.items = new_items
+
+    def insert_IfStmt(self, node):
+        if node.else_branch:
+            return (node.then_branch, node.else_branch)
+        return (node.then_branch,)
+
+    def insert_WhileStmt(self, node):
+        return (node.body,)
+
+    def insert_ForStmt(self, node):
+        return (node.body,)
+
+    def generic_insert(self, node):
+        pass
 
     def make_dead_stmt(self):
         kind = random.choice(["var", "if"])
@@ -0,0 +1,237 @@
+import hashlib
+import io
+import marshal
+import os
+import pickle
+import tempfile
+from antlr4.PredictionContext import (
+    ArrayPredictionContext,
+    PredictionContext,
+    SingletonPredictionContext,
+)
+from antlr4.atn.ATNConfig import ATNConfig, LexerATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFA import DFA
+from antlr4.dfa.DFAState import DFAState, PredPrediction
+from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
+from obfuscator.parser.ObfuMiniCLexer import serializedATN as lexer_atn
+from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
+from obfuscator.parser.ObfuMiniCParser import serializedATN as parser_atn
+
+# Bump when the on-disk layout changes.
+DFA_CACHE_FORMAT = 1
+
+RECOGNIZERS = {"lexer": ObfuMiniCLexer, "parser": ObfuMiniCParser}
+
+_version = None
+
+
+# Runtime classes stored field by field; their layout is part of the version.
+_PICKLED_CLASSES = [DFAState, PredPrediction, ATNConfig, LexerATNConfig]
+
+
+def dfa_cache_version() -> bytes:
+    """Hash of both serialized ATNs and the runtime's DFA object layout."""
+    global _version
+    if _version is None:
+        h = hashlib.sha256(f"format={DFA_CACHE_FORMAT}".encode())
+        for cls in _PICKLED_CLASSES:
+            h.update(f"{cls.__name__}{cls.__slots__}".encode())
+        h.update(repr(lexer_atn()).encode())
+        h.update(repr(parser_atn()).encode())
+        _version = h.digest()
+    return _version
+
+
+def _restore_config_set(cls, configs, state):
+    config_set = cls.__new__(cls)
+    ATNConfigSet.__init__(config_set, state["fullCtx"])
+    config_set.configs = configs
+    for name, value in state.items():
+        setattr(config_set, name, value)
+    if config_set.readonly:
+        config_set.configLookup = None
+    else:
+        for config in configs:
+            config_set.getOrAdd(config)
+    return config_set
+
+
+class _DFAPickler(pickle.Pickler):
+    """Pickles DFA states relative to one recognizer's ATN.
+
+    ATN states, lexer actions and the runtime's singletons (which it
+    compares by identity) are stored by reference. Objects that cache a
+    string-based hash (prediction contexts, lexer action executors, config
+    sets) are rebuilt through their constructors on load, because str
+    hashes differ between processes.
+    """
+
+    def __init__(self, file, atn):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.actions = {
+            id(action): i for i, action in enumerate(atn.lexerActions or [])
+        }
+
+    def persistent_id(self, obj):
+        if obj is PredictionContext.EMPTY:
+            return "empty"
+        if obj is SemanticContext.NONE:
+            return "none"
+        if obj is ATNSimulator.ERROR:
+            return "error"
+        if isinstance(obj, ATNState):
+            return ("state", obj.stateNumber)
+        if id(obj) in self.actions:
+            return ("action", self.actions[id(obj)])
+        return None
+
+    def reducer_override(self, obj):
+        cls = type(obj)
+        if cls is SingletonPredictionContext:
+            return SingletonPredictionContext.create, (obj.parentCtx, obj.returnState)
+        if cls is ArrayPredictionContext:
+            return ArrayPredictionContext, (obj.parents, obj.returnStates)
+        if cls is LexerActionExecutor:
+            return LexerActionExecutor, (obj.lexerActions,)
+        if isinstance(obj, ATNConfigSet):
+            state = {
+                "fullCtx": obj.fullCtx,
+                "readonly": obj.readonly,
+                "uniqueAlt": obj.uniqueAlt,
+                "conflictingAlts": obj.conflictingAlts,
+                "hasSemanticContext": obj.hasSemanticContext,
+                "dipsIntoOuterContext": obj.dipsIntoOuterContext,
+            }
+            return _restore_config_set, (cls, obj.configs, state)
+        return NotImplemented
+
+
+class _DFAUnpickler(pickle.Unpickler):
+    def __init__(self, file, atn):
+        super().__init__(file)
+        self.atn = atn
+
+    def persistent_load(self, pid):
+        if pid == "empty":
+            return PredictionContext.EMPTY
+        if pid == "none":
+            return SemanticContext.NONE
+        if pid == "error":
+            return ATNSimulator.ERROR
+        kind, index = pid
+        if kind == "state":
+            return self.atn.states[index]
+        return self.atn.lexerActions[index]
+
+    def find_class(self, module, name):
+        # Only runtime classes and the helper above can appear in a cache file
+        if module.split(".")[0] == "antlr4" or module == __name__:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"unexpected class {module}.{name}")
+
+
+def _dump_dfas(recognizer) -> bytes:
+    dfas = [
+        (dfa.decision, dfa.s0, list(dfa._states), dfa.precedenceDfa)
+        for dfa in recognizer.decisionsToDFA
+    ]
+    buf = io.BytesIO()
+    _DFAPickler(buf, recognizer.atn).dump(dfas)
+    return buf.getvalue()
+
+
+def _load_dfas(recognizer, data: bytes) -> None:
+    atn = recognizer.atn
+    dfas = []
+    for decision, s0, states, precedence in _DFAUnpickler(io.BytesIO(data), atn).load():
+        dfa = DFA(atn.decisionToState[decision], decision)
+        dfa.s0 = s0
+        dfa.precedenceDfa = precedence
+        dfa._states = {state: state for state in states}
+        dfas.append(dfa)
+    # In place, so simulators that already exist see the warm DFA too
+    recognizer.decisionsToDFA[:] = dfas
+
+
+def dfa_state_count() -> int:
+    return sum(
+        len(dfa._states)
+        for recognizer in RECOGNIZERS.values()
+        for dfa in recognizer.decisionsToDFA
+    )
+
+
+class DFACache:
+    """Persists the lexer and parser DFAs that ANTLR builds lazily.
+
+    Adaptive prediction fills decisionsToDFA on first use of every decision,
+    so a fresh process pays that warm-up again. load() installs the states
+    saved by an earlier run, provided the file was written for the same
+    serialized ATNs and runtime object layout; save() writes them back only when
+    this process added states. Writes go through a temporary file and
+    os.replace, so concurrent runs never see a partial file.
+
+    The file is a pickle, so only point this at a directory you control.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.loaded_states = 0
+        self.loaded = False
+
+    def load(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(dfa_cache_version())) != dfa_cache_version():
+                    return False
+                payload = marshal.loads(f.read())
+            for name, recognizer in RECOGNIZERS.items():
+                _load_dfas(recognizer, payload[name])
+        except FileNotFoundError:
+            return False
+        except (
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            IndexError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ):
+            # Corrupt or foreign file: start cold and overwrite it on save
+            for recognizer in RECOGNIZERS.values():
+                atn = recognizer.atn
+                recognizer.decisionsToDFA[:] = [
+                    DFA(ds, i) for i, ds in enumerate(atn.decisionToState)
+                ]
+            return False
+        self.loaded_states = dfa_state_count()
+        self.loaded = True
+        return True
+
+    def save(self) -> bool:
+        if self.loaded and dfa_state_count() == self.loaded_states:
+            return False
+        payload = {name: _dump_dfas(r) for name, r in RECOGNIZERS.items()}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dfa_cache_version())
+                f.write(marshal.dumps(payload))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.loaded_states = dfa_state_count()
+        self.loaded = True
+        return True
+
+    def report(self) -> str:
+        return f"DFA cache {self.path}: {dfa_state_count()} state(s)"
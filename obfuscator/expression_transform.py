@@ -1,83 +1,128 @@
 from obfuscator.ast import *
+from obfuscator.visitor import walk
 import random
 
+# Pushed above an expression whose operands are still on the work stack
+_EXIT = object()
+
 
 class ExpressionTransformer:
     def transform(self, node):
-        if isinstance(node, Program):
-            for i in range(len(node.functions)):
-                node.functions[i] = self.transform(node.functions[i])
-        elif isinstance(node, Function):
-            for i in range(len(node.body)):
-                node.body[i] = self.transform(node.body[i])
-
-        elif isinstance(node, Block):
-            for i in range(len(node.items)):
-                node.items[i] = self.transform(node.items[i])
-
-        elif isinstance(node, VariableDecl):
-            if node.init_expr:
-                node.init_expr = self._transform_expr(node.init_expr)
-
-        elif isinstance(node, Assignment):
-            node.value = self._transform_expr(node.value)
-
-        elif isinstance(node, ExpressionStmt):
-            if node.expr:
-                node.expr = self._transform_expr(node.expr)
-
-        elif isinstance(node, IfStmt):
-            node.condition = self._transform_expr(node.condition)
-            node.then_branch = self.transform(node.then_branch)
-            if node.else_branch:
-                node.else_branch = self.transform(node.else_branch)
-
-        elif isinstance(node, WhileStmt):
-            node.condition = self._transform_expr(node.condition)
-            node.body = self.transform(node.body)
-
-        elif isinstance(node, ForStmt):
-            if node.init:
-                node.init = self.transform(node.init)
-            if node.cond:
-                node.cond = self._transform_expr(node.cond)
-            if node.update:
-                node.update = self.transform(node.update)
-            node.body = self.transform(node.body)
-
-        elif isinstance(node, Return):
-            if node.value:
-                node.value = self._transform_expr(node.value)
-
-        elif isinstance(node, Print):
-            for i in range(len(node.args)):
-                node.args[i] = self._transform_expr(node.args[i])
-
+        self._transform(node)
         return node
 
-    def _transform_expr(self, expr):
-        if isinstance(expr, BinaryOp):
-            expr.left = self._transform_expr(expr.left)
-            expr.right = self._transform_expr(expr.right)
-            return self.rewrite_binary(expr)
-
-        elif isinstance(expr, UnaryOp):
-            expr.operand = self._transform_expr(expr.operand)
-            return self.rewrite_unary(expr)
+    # Statement handlers transform their expressions in place and return the
+    # statements nested in them, which are walked with an explicit stack
+    _transform = walk("transform_", "generic_transform")
+
+    def transform_Program(self, node):
+        return node.functions
+
+    def transform_Function(self, node):
+        invalidate(node)
+        return node.body
+
+    def transform_Block(self, node):
+        return node.items
+
+    def transform_VariableDecl(self, node):
+        if node.init_expr:
+            node.init_expr = self._transform_expr(node.init_expr)
+
+    def transform_Assignment(self, node):
+        node.value = self._transform_expr(node.value)
+
+    def transform_ExpressionStmt(self, node):
+        if node.expr:
+            node.expr = self._transform_expr(node.expr)
+
+    def transform_IfStmt(self, node):
+        node.condition = self._transform_expr(node.condition)
+        if node.else_branch:
+            return (node.then_branch, node.else_branch)
+        return (node.then_branch,)
+
+    def transform_WhileStmt(self, node):
+        node.condition = self._transform_expr(node.condition)
+        return (node.body,)
+
+    def transform_ForStmt(self, node):
+        # A generator, so the clauses are transformed in source order
+        if node.init:
+            yield node.init
+        if node.cond:
+            node.cond = self._transform_expr(node.cond)
+        if node.update:
+            yield node.update
+        yield node.body
+
+    def transform_Return(self, node):
+        if node.value:
+            node.value = self._transform_expr(node.value)
 
-        elif isinstance(expr, Assignment):
-            expr.value = self._transform_expr(expr.value)
-            return expr
+    def transform_Print(self, node):
+        for i in range(len(node.args)):
+            node.args[i] = self._transform_expr(node.args[i])
 
-        elif isinstance(expr, FuncCall):
-            for i in range(len(expr.args)):
-                expr.args[i] = self._transform_expr(expr.args[i])
-            return expr
+    def generic_transform(self, node):
+        pass
 
-        elif isinstance(expr, Variable) or isinstance(expr, Literal):
+    def _transform_expr(self, expr):
+        """Transforms an expression bottom-up with an explicit stack.
+
+        A node's operands are pushed above it and an _EXIT marker; when the
+        marker comes back up, the transformed operands are stored in the
+        node and the node is rewritten. Variables, Literals and anything
+        unknown are left as they are.
+        """
+        cls = type(expr)
+        if cls is Variable or cls is Literal:
             return expr
-
-        return expr
+        out = []
+        stack = [expr]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if node is _EXIT:
+                node = pop()
+                cls = type(node)
+                if cls is BinaryOp:
+                    node.right = out.pop()
+                    node.left = out.pop()
+                    node = self.rewrite_binary(node)
+                elif cls is UnaryOp:
+                    node.operand = out.pop()
+                    node = self.rewrite_unary(node)
+                elif cls is FuncCall:
+                    n = len(node.args)
+                    node.args[:] = out[len(out) - n :]
+                    del out[len(out) - n :]
+                else:
+                    node.value = out.pop()
+                out.append(node)
+                continue
+            cls = type(node)
+            if cls is BinaryOp:
+                push(node)
+                push(_EXIT)
+                push(node.right)
+                push(node.left)
+            elif cls is UnaryOp:
+                push(node)
+                push(_EXIT)
+                push(node.operand)
+            elif cls is FuncCall and node.args:
+                push(node)
+                push(_EXIT)
+                stack.extend(reversed(node.args))
+            elif cls is Assignment:
+                push(node)
+                push(_EXIT)
+                push(node.value)
+            else:
+                out.append(node)
+        return out[0]
 
     def rewrite_binary(self, node):
         if node.op == "+":
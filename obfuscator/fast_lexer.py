@@ -0,0 +1,163 @@
+import re
+from antlr4 import InputStream
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import CommonToken, Token
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.Lexer import TokenSource
+from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
+
+
+class ParseError(Exception):
+    def __init__(self, message, line, column):
+        super().__init__(f"line {line}:{column} {message}")
+        self.message = message
+        self.line = line
+        self.column = column
+
+    def __reduce__(self):
+        return ParseError, (self.message, self.line, self.column)
+
+
+# Token types are taken from the generated parser, whose literalNames are
+# indexed by token type, so every frontend agrees on them.
+LITERAL_TYPES = {
+    name[1:-1]: i
+    for i, name in enumerate(ObfuMiniCParser.literalNames)
+    if name.startswith("'")
+}
+ID = ObfuMiniCParser.ID
+NUMBER = ObfuMiniCParser.NUMBER
+BOOL = ObfuMiniCParser.BOOL
+CHAR = ObfuMiniCParser.CHAR
+STRING = ObfuMiniCParser.STRING
+EOF = Token.EOF
+
+WORD_TYPES = {name: i for name, i in LITERAL_TYPES.items() if name.isidentifier()}
+WORD_TYPES["true"] = BOOL
+WORD_TYPES["false"] = BOOL
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>[ \t\r\n]+)
+    | (?P<comment>//[^\r\n]*|/\*.*?\*/)
+    | (?P<id>[a-zA-Z_][a-zA-Z0-9_]*)
+    | (?P<number>[0-9]+)
+    | (?P<char>'.')
+    | (?P<string>"(?:[^"\\]|\\.)*")
+    | (?P<op>\|\||&&|==|!=|<=|>=|[=&<>+\-*/%!(){};,:])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def iter_tokens(text: str, on_error=None, line: int = 1, column: int = 0):
+    """Yields (type, text, line, column, start) tuples, ending with EOF.
+
+    Whitespace and comments are skipped like the WS/*_COMMENT lexer rules.
+    An unrecognized character raises ParseError, or is reported to
+    on_error(line, column, char) and skipped when a callback is given.
+    line and column give the position of text[0], for text cut out of a
+    larger file.
+    """
+    match = _TOKEN_RE.match
+    word_types = WORD_TYPES
+    pos = 0
+    line_start = -column
+    end = len(text)
+    while pos < end:
+        m = match(text, pos)
+        if m is None:
+            if on_error is None:
+                raise ParseError(
+                    f"token recognition error at: '{text[pos]}'", line, pos - line_start
+                )
+            on_error(line, pos - line_start, text[pos])
+            pos += 1
+            continue
+        kind = m.lastgroup
+        value = m.group()
+        if kind == "id":
+            yield (word_types.get(value, ID), value, line, pos - line_start, pos)
+        elif kind == "op":
+            yield (LITERAL_TYPES[value], value, line, pos - line_start, pos)
+        elif kind == "number":
+            yield (NUMBER, value, line, pos - line_start, pos)
+        elif kind == "string":
+            yield (STRING, value, line, pos - line_start, pos)
+        elif kind == "char":
+            yield (CHAR, value, line, pos - line_start, pos)
+        if kind != "id" and kind != "number" and "\n" in value:
+            line += value.count("\n")
+            line_start = pos + value.rindex("\n") + 1
+        pos = m.end()
+    yield (EOF, "<EOF>", line, pos - line_start, pos)
+
+
+def tokenize(text: str):
+    return list(iter_tokens(text))
+
+
+_new_token = object.__new__
+
+
+class FastLexer(TokenSource):
+    """Regex-based drop-in for ObfuMiniCLexer.
+
+    Emits CommonTokens with the generated token types, so it can feed a
+    CommonTokenStream and ObfuMiniCParser unchanged.
+    """
+
+    def __init__(self, input: InputStream):
+        self._input = input
+        self._factory = CommonTokenFactory.DEFAULT
+        self._listeners = [ConsoleErrorListener.INSTANCE]
+        self._source = (self, input)
+        self._tokens = None
+        self._eof = None
+        # Like ObfuMiniCLexer, the start position can be set before lexing
+        self.line = 1
+        self.column = 0
+
+    def nextToken(self):
+        if self._eof is not None:
+            return self._eof
+        if self._tokens is None:
+            self._tokens = iter_tokens(
+                self._input.strdata, self._report_error, self.line, self.column
+            )
+        token_type, text, line, column, start = next(self._tokens)
+        # Fill the fields directly; CommonToken.__init__ would read line and
+        # column back from this source only for them to be overwritten.
+        token = _new_token(CommonToken)
+        token.source = self._source
+        token.type = token_type
+        token.channel = Token.DEFAULT_CHANNEL
+        token.start = start
+        token.stop = start + len(text) - 1
+        token.tokenIndex = -1
+        token.line = line
+        token.column = column
+        token._text = text
+        self.line = line
+        self.column = column
+        if token_type == EOF:
+            token.stop = start - 1
+            self._eof = token
+        return token
+
+    def _report_error(self, line, column, char):
+        msg = f"token recognition error at: '{char}'"
+        for listener in self._listeners:
+            listener.syntaxError(self, None, line, column, msg, None)
+
+    def removeErrorListeners(self):
+        self._listeners = []
+
+    def addErrorListener(self, listener):
+        self._listeners.append(listener)
+
+    def getInputStream(self):
+        return self._input
+
+    def getSourceName(self):
+        return self._input.getSourceName()
@@ -0,0 +1,309 @@
+from obfuscator.ast import *
+from obfuscator.fast_lexer import (
+    ParseError,
+    tokenize,
+    ID,
+    NUMBER,
+    BOOL,
+    CHAR,
+    STRING,
+    EOF,
+)
+from obfuscator.leaves import LeafInterner
+
+TYPE_NAMES = {"int", "char", "bool"}
+
+BINARY_PRECEDENCE = {
+    "||": 1,
+    "&&": 2,
+    "==": 3,
+    "!=": 3,
+    "<": 4,
+    "<=": 4,
+    ">": 4,
+    ">=": 4,
+    "+": 5,
+    "-": 5,
+    "*": 6,
+    "/": 6,
+    "%": 6,
+}
+
+
+class FastParser:
+    """Recursive-descent parser for ObfuMiniC that builds the AST directly.
+
+    Produces the same nodes as running ASTBuilder over the ANTLR parse tree.
+    """
+
+    def __init__(self, text: str):
+        self.tokens = tokenize(text)
+        self.pos = 0
+        self.leaves = LeafInterner()
+
+    # === Token helpers ===
+
+    def _peek(self, offset=0):
+        return self.tokens[min(self.pos + offset, len(self.tokens) - 1)]
+
+    def _next(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def _at(self, text):
+        tok = self.tokens[self.pos]
+        return tok[1] == text and tok[0] != STRING and tok[0] != CHAR
+
+    def _accept(self, text):
+        if self._at(text):
+            self.pos += 1
+            return True
+        return False
+
+    def _expect(self, text):
+        tok = self.tokens[self.pos]
+        if tok[1] != text or tok[0] == STRING or tok[0] == CHAR:
+            self._error(f"expected '{text}'", tok)
+        self.pos += 1
+        return tok
+
+    def _expect_type(self, token_type, name):
+        tok = self.tokens[self.pos]
+        if tok[0] != token_type:
+            self._error(f"expected {name}", tok)
+        self.pos += 1
+        return tok
+
+    def _error(self, message, tok):
+        raise ParseError(f"{message} at '{tok[1]}'", tok[2], tok[3])
+
+    def _at_type_name(self):
+        tok = self.tokens[self.pos]
+        return tok[0] != ID and tok[1] in TYPE_NAMES
+
+    # === Program Structure ===
+
+    def parse(self) -> Program:
+        functions = []
+        while self._peek()[0] != EOF:
+            if not self._at_type_name():
+                self._error("expected type", self._peek())
+            if self._peek(2)[1] == "(":
+                functions.append(self.parse_function())
+            else:
+                # Top-level declarations are dropped, matching ASTBuilder.
+                self.parse_var_decl()
+        return Program(functions)
+
+    def parse_function(self) -> Function:
+        return_type = self._next()[1]
+        name = self.leaves.name(self._expect_type(ID, "identifier")[1])
+        self._expect("(")
+        params = []
+        if not self._at(")"):
+            params.append(self.parse_param())
+            while self._accept(","):
+                params.append(self.parse_param())
+        self._expect(")")
+        return Function(return_type, name, params, self.parse_block().items)
+
+    def parse_param(self) -> Parameter:
+        if not self._at_type_name():
+            self._error("expected type", self._peek())
+        param_type = self._next()[1]
+        name = self._expect_type(ID, "identifier")[1]
+        return Parameter(param_type, self.leaves.name(name))
+
+    def parse_var_decl(self) -> List[VariableDecl]:
+        var_type = self._next()[1]
+        decls = []
+        while True:
+            name = self.leaves.name(self._expect_type(ID, "identifier")[1])
+            expr = self.parse_expr() if self._accept("=") else None
+            decls.append(VariableDecl(var_type, name, expr))
+            if not self._accept(","):
+                break
+        self._expect(";")
+        return decls
+
+    # === Statements ===
+
+    def parse_block(self) -> Block:
+        self._expect("{")
+        stmts = []
+        while not self._at("}"):
+            if self._peek()[0] == EOF:
+                self._error("expected '}'", self._peek())
+            if self._at_type_name():
+                stmts.extend(self.parse_var_decl())
+            else:
+                stmts.append(self.parse_stmt())
+        self.pos += 1
+        return Block(stmts)
+
+    def parse_stmt(self) -> Statement:
+        tok = self._peek()
+        kind = tok[1] if tok[0] != ID else None
+        if kind == "{":
+            return self.parse_block()
+        if kind == "if":
+            return self.parse_if()
+        if kind == "while":
+            self.pos += 1
+            self._expect("(")
+            cond = self.parse_expr()
+            self._expect(")")
+            return WhileStmt(cond, self.parse_stmt())
+        if kind == "for":
+            return self.parse_for()
+        if kind == "return":
+            self.pos += 1
+            value = None if self._at(";") else self.parse_expr()
+            self._expect(";")
+            return Return(value)
+        if kind == "printf":
+            return self.parse_printf()
+        if kind == "scanf":
+            return self.parse_scanf()
+        if kind == "switch":
+            return self.parse_switch()
+        expr = None if self._at(";") else self.parse_expr()
+        self._expect(";")
+        return ExpressionStmt(expr)
+
+    def parse_if(self) -> IfStmt:
+        self.pos += 1
+        self._expect("(")
+        cond = self.parse_expr()
+        self._expect(")")
+        then_branch = self.parse_stmt()
+        else_branch = self.parse_stmt() if self._accept("else") else None
+        return IfStmt(cond, then_branch, else_branch)
+
+    def parse_for(self) -> ForStmt:
+        self.pos += 1
+        self._expect("(")
+        init = None if self._at(";") else self.parse_expr()
+        self._expect(";")
+        cond = None if self._at(";") else self.parse_expr()
+        self._expect(";")
+        update = None if self._at(")") else self.parse_expr()
+        self._expect(")")
+        return ForStmt(init, cond, update, self.parse_stmt())
+
+    def parse_printf(self) -> Print:
+        self.pos += 1
+        self._expect("(")
+        fmt = self._expect_type(STRING, "string")[1].strip('"')
+        args = []
+        while self._accept(","):
+            args.append(self.parse_expr())
+        self._expect(")")
+        self._expect(";")
+        return Print(fmt, args)
+
+    def parse_scanf(self) -> Scan:
+        self.pos += 1
+        self._expect("(")
+        fmt = self._expect_type(STRING, "string")[1].strip('"')
+        args = []
+        while self._accept(","):
+            self._accept("&")
+            args.append(self.leaves.name(self._expect_type(ID, "identifier")[1]))
+        self._expect(")")
+        self._expect(";")
+        return Scan(fmt, args)
+
+    def parse_switch(self) -> Switch:
+        self.pos += 1
+        self._expect("(")
+        expr = self.parse_expr()
+        self._expect(")")
+        self._expect("{")
+        cases = []
+        default = None
+        while not self._accept("}"):
+            if self._accept("case"):
+                tok = self._next()
+                if tok[0] not in (NUMBER, CHAR, BOOL):
+                    self._error("expected literal", tok)
+                value = self._literal(tok)
+                self._expect(":")
+                label = Label(f"case_{len(cases)}")
+                cases.append(SwitchCase(value, label, Block(self._case_body())))
+            else:
+                self._expect("default")
+                self._expect(":")
+                default = Block(self._case_body())
+        return Switch(expr, cases, default)
+
+    def _case_body(self):
+        stmts = []
+        while not (self._at("case") or self._at("default") or self._at("}")):
+            stmts.append(self.parse_stmt())
+        return stmts
+
+    # === Expressions ===
+
+    def parse_expr(self) -> Expression:
+        start = self.pos
+        left = self.parse_binary(1)
+        if self._at("="):
+            target = "".join(tok[1] for tok in self.tokens[start : self.pos])
+            self.pos += 1
+            return Assignment(target, self.parse_expr())
+        return left
+
+    def parse_binary(self, min_prec) -> Expression:
+        left = self.parse_unary()
+        tokens = self.tokens
+        while True:
+            tok = tokens[self.pos]
+            prec = BINARY_PRECEDENCE.get(tok[1])
+            if prec is None or prec < min_prec or tok[0] == STRING or tok[0] == CHAR:
+                return left
+            self.pos += 1
+            right = self.parse_binary(prec + 1)
+            left = BinaryOp(tok[1], left, right)
+
+    def parse_unary(self) -> Expression:
+        tok = self.tokens[self.pos]
+        if tok[1] in ("+", "-", "!") and tok[0] != STRING and tok[0] != CHAR:
+            self.pos += 1
+            return UnaryOp(tok[1], self.parse_unary())
+        return self.parse_primary()
+
+    def parse_primary(self) -> Expression:
+        tok = self._next()
+        token_type = tok[0]
+        if token_type == ID:
+            if self._accept("("):
+                args = []
+                if not self._at(")"):
+                    args.append(self.parse_expr())
+                    while self._accept(","):
+                        args.append(self.parse_expr())
+                self._expect(")")
+                return FuncCall(self.leaves.name(tok[1]), args)
+            return self.leaves.variable(tok[1])
+        if token_type == STRING:
+            return self.leaves.literal(tok[1].strip('"'))
+        if token_type in (NUMBER, CHAR, BOOL):
+            return self._literal(tok)
+        if tok[1] == "(":
+            expr = self.parse_expr()
+            self._expect(")")
+            return expr
+        self._error("expected expression", tok)
+
+    def _literal(self, tok) -> Literal:
+        if tok[0] == NUMBER:
+            return self.leaves.literal(int(tok[1]))
+        if tok[0] == BOOL:
+            return self.leaves.literal(tok[1] == "true")
+        return self.leaves.literal(tok[1].strip("'"))
+
+
+def parse(text: str) -> Program:
+    return FastParser(text).parse()
@@ -0,0 +1,130 @@
+"""Structural fingerprints of AST subtrees.
+
+A fingerprint is a 64-bit int computed bottom-up from a node's class, its
+scalar fields and its children's fingerprints. It depends only on the
+tree's structure, not on object identity, so equal subtrees get equal
+fingerprints in every run and process (on the same Python version), and
+a Function's can key caches of parsed, transformed or generated code. It
+is not cryptographic: use it to find work that can be skipped, not to
+check untrusted input.
+
+Classes and scalar values are given fixed 64-bit codes (a BLAKE2b digest
+of their name or repr), and a node's fingerprint is hash() of the tuple of
+its codes. Hashing ints and tuples of ints does not depend on
+PYTHONHASHSEED, unlike hashing strings.
+
+Function nodes memoize their fingerprint, so asking again is free until
+the function changes, i.e. until obfuscator.ast.invalidate(func) is
+called. Nodes below a Function are not memoized: without links to their
+parents, a change could not be propagated up to the memos above it.
+"""
+
+import hashlib
+from obfuscator.ast import *
+
+
+def _code(data: bytes) -> int:
+    digest = hashlib.blake2b(data, digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class _FieldTable(dict):
+    """Maps classes to the fields a fingerprint covers, or None for values
+    that are not nodes."""
+
+    def __missing__(self, cls):
+        fields = vars(cls).get("__slots__")
+        if fields is None and issubclass(cls, Function):
+            # RawFunction: kept as source text, which is what it emits
+            fields = ("name", "source")
+        self[cls] = fields
+        return fields
+
+
+class _ClassCodes(dict):
+    def __missing__(self, cls):
+        code = self[cls] = _code(cls.__name__.encode())
+        return code
+
+
+class _ScalarCodes(dict):
+    """Maps (type, value) pairs to codes, so 1, 1.0 and "1" differ."""
+
+    def __missing__(self, key):
+        cls, value = key
+        code = self[key] = _code(f"{cls.__name__}:{value!r}".encode())
+        return code
+
+
+_FIELDS = _FieldTable()
+_CLASSES = _ClassCodes()
+_SCALARS = _ScalarCodes()
+
+
+def fingerprint(node) -> int:
+    """The structural fingerprint of node's subtree."""
+    fields = _FIELDS
+    classes = _CLASSES
+    scalars = _SCALARS
+    variable = classes[Variable]
+    literal = classes[Literal]
+    binary = classes[BinaryOp]
+
+    # Leaves are hashed as they are found; other nodes are listed parents
+    # first, through their child fields, and hashed in reverse over all
+    # their fields, so children always come before parents
+    hashes = {}
+    order = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        cls = type(item)
+        if cls is Variable:
+            if item not in hashes:
+                hashes[item] = hash((variable, scalars[str, item.name]))
+        elif cls is Literal:
+            if item not in hashes:
+                value = item.value
+                hashes[item] = hash((literal, scalars[type(value), value]))
+        elif cls is BinaryOp:
+            order.append(item)
+            stack.append(item.left)
+            stack.append(item.right)
+        elif isinstance(item, Function) and getattr(item, "_fingerprint", None):
+            hashes[item] = item._fingerprint
+        else:
+            order.append(item)
+            stack += iter_children(item)
+
+    for item in reversed(order):
+        cls = type(item)
+        if cls is BinaryOp:
+            key = (binary, scalars[str, item.op], hashes[item.left], hashes[item.right])
+            hashes[item] = hash(key)
+            continue
+        if item in hashes:
+            continue  # Shared, and reached more than once
+        key = [classes[cls]]
+        for name in fields[cls]:
+            value = getattr(item, name)
+            if type(value) is list:
+                key.append(
+                    tuple(
+                        [
+                            (
+                                hashes[v]
+                                if fields[type(v)] is not None
+                                else scalars[type(v), v]
+                            )
+                            for v in value
+                        ]
+                    )
+                )
+            elif fields[type(value)] is not None:
+                key.append(hashes[value])
+            else:
+                key.append(scalars[type(value), value])
+        hashes[item] = digest = hash(tuple(key))
+        if isinstance(item, Function):
+            item._fingerprint = digest
+    return hashes[node]
@@ -0,0 +1,316 @@
+from array import array
+from obfuscator import ast
+
+# Every class in obfuscator.ast that has fields is a node kind
+NODE_CLASSES = sorted(
+    (
+        cls
+        for cls in vars(ast).values()
+        if isinstance(cls, type)
+        and cls.__module__ == ast.__name__
+        and "__init__" in vars(cls)
+        and getattr(cls, "__slots__", ())
+    ),
+    key=lambda cls: cls.__name__,
+)
+KINDS = {cls: kind for kind, cls in enumerate(NODE_CLASSES)}
+_FIELDS = [cls.__slots__ for cls in NODE_CLASSES]
+_FIELD_COUNTS = [len(f) for f in _FIELDS]
+_FIELD_POS = [{name: i for i, name in enumerate(f)} for f in _FIELDS]
+
+# Seeded into every string table, so an operator's string ID is its code
+OPERATORS = tuple("|| && == != < <= > >= + - * / % ! =".split())
+
+# A field value is one int32: a 3-bit tag and a 29-bit payload
+_TAG_BITS = 3
+_TAG_MASK = (1 << _TAG_BITS) - 1
+NONE, NODE, LIST, STRING, CONSTANT = range(5)
+
+# Work-stack markers: add the list whose items are done, or build the node
+# or list whose values are done
+_ADD_LIST = object()
+_BUILD = object()
+
+
+class FlatAST:
+    """An AST stored as a struct of typed arrays instead of node objects.
+
+    Node i has kind kinds[i] (an index into NODE_CLASSES) and its fields,
+    in the class's __slots__ order, at fields[offsets[i]:]. A field holds a
+    tagged value: another node's index, a list (items at
+    list_items[list_offsets[k]:list_offsets[k + 1]], themselves tagged), an
+    interned string ID, an interned constant, or None. Names and operators
+    are therefore shared by ID, and a node costs 5 bytes plus 4 per field.
+
+    from_tree numbers nodes in preorder with the root at 0, so until the
+    store is modified, scanning indexes in order is a preorder traversal.
+    Fields are rewritten in place; new nodes and lists are appended, and a
+    replaced list's storage is simply left unused.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.offsets = array("I")
+        self.fields = array("i")
+        self.list_offsets = array("I", [0])
+        self.list_items = array("i")
+        self.strings = list(OPERATORS)
+        self.string_ids = {s: i for i, s in enumerate(OPERATORS)}
+        self.constants = []
+        self.constant_ids = {}
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def nbytes(self) -> int:
+        """Bytes used by the arrays (the string and constant tables aside)."""
+        return sum(
+            a.itemsize * len(a)
+            for a in (
+                self.kinds,
+                self.offsets,
+                self.fields,
+                self.list_offsets,
+                self.list_items,
+            )
+        )
+
+    # === Conversion ===
+
+    @classmethod
+    def from_tree(cls, node) -> "FlatAST":
+        flat = cls()
+        flat._encode(node)
+        return flat
+
+    def _encode(self, value) -> int:
+        # Explicit stack of (value, holder, key): the encoded value goes to
+        # holder[key], either a slot in self.fields or a list being built.
+        # Nodes are numbered as they are popped, fields first to last, so
+        # in preorder; a list is added once its items are done.
+        root = [None]
+        stack = [(value, root, 0)]
+        while stack:
+            value, holder, key = stack.pop()
+            if value is _ADD_LIST:
+                items, holder, key = holder
+                holder[key] = self._add_list(items) << _TAG_BITS | LIST
+                continue
+            kind = KINDS.get(type(value))
+            if kind is not None:
+                index = self.add(type(value))
+                holder[key] = index << _TAG_BITS | NODE
+                start = self.offsets[index]
+                fields = self.fields
+                for i in range(_FIELD_COUNTS[kind] - 1, -1, -1):
+                    name = _FIELDS[kind][i]
+                    stack.append((getattr(value, name), fields, start + i))
+            elif isinstance(value, list):
+                items = [NONE] * len(value)
+                stack.append((_ADD_LIST, (items, holder, key), None))
+                for i in range(len(value) - 1, -1, -1):
+                    stack.append((value[i], items, i))
+            else:
+                holder[key] = self.encode_scalar(value)
+        return root[0]
+
+    def encode_scalar(self, value) -> int:
+        """The tagged field value of a string, constant or None, interning it."""
+        if value is None:
+            return NONE
+        if isinstance(value, str):
+            string_id = self.string_ids.get(value)
+            if string_id is None:
+                string_id = self.string_ids[value] = len(self.strings)
+                self.strings.append(value)
+            return string_id << _TAG_BITS | STRING
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"cannot store a {type(value).__name__} in a FlatAST")
+        # Keyed by type as well, since True == 1
+        key = (type(value), value)
+        constant_id = self.constant_ids.get(key)
+        if constant_id is None:
+            constant_id = self.constant_ids[key] = len(self.constants)
+            self.constants.append(value)
+        return constant_id << _TAG_BITS | CONSTANT
+
+    def to_tree(self, index: int = 0):
+        """Rebuilds the obfuscator.ast objects rooted at node index."""
+        return self.decode(index << _TAG_BITS | NODE)
+
+    def decode(self, value):
+        """Turns a tagged field value back into AST objects and Python values."""
+        kinds = self.kinds
+        offsets = self.offsets
+        fields = self.fields
+        list_offsets = self.list_offsets
+        list_items = self.list_items
+        scalars = (None, None, None, self.strings, self.constants)
+        # Children first, with an explicit stack: a node or list is pushed
+        # again with its number of values under _BUILD, and built from the
+        # last values on out. Nodes without children are built at once.
+        out = []
+        stack = [value]
+        while stack:
+            value = stack.pop()
+            if value is _BUILD:
+                n = stack.pop()
+                value = stack.pop()
+                if value & _TAG_MASK == NODE:
+                    cls = NODE_CLASSES[kinds[value >> _TAG_BITS]]
+                    item = cls(*out[len(out) - n :])
+                else:
+                    item = out[len(out) - n :]
+                del out[len(out) - n :]
+                out.append(item)
+                continue
+            tag = value & _TAG_MASK
+            payload = value >> _TAG_BITS
+            if tag == NODE:
+                kind = kinds[payload]
+                start = offsets[payload]
+                values = fields[start : start + _FIELD_COUNTS[kind]]
+                for v in values:
+                    if (v & _TAG_MASK) in (NODE, LIST):
+                        stack += (value, len(values), _BUILD)
+                        stack.extend(reversed(values))
+                        break
+                else:
+                    out.append(
+                        NODE_CLASSES[kind](
+                            *[
+                                (
+                                    None
+                                    if v & _TAG_MASK == NONE
+                                    else scalars[v & _TAG_MASK][v >> _TAG_BITS]
+                                )
+                                for v in values
+                            ]
+                        )
+                    )
+            elif tag == LIST:
+                items = list_items[list_offsets[payload] : list_offsets[payload + 1]]
+                stack += (value, len(items), _BUILD)
+                stack.extend(reversed(items))
+            elif tag == NONE:
+                out.append(None)
+            else:
+                out.append(scalars[tag][payload])
+        return out[0]
+
+    # === Traversal ===
+
+    def node_class(self, index: int) -> type:
+        return NODE_CLASSES[self.kinds[index]]
+
+    def _field(self, index: int, name: str) -> int:
+        return self.offsets[index] + _FIELD_POS[self.kinds[index]][name]
+
+    def _list(self, list_id: int):
+        start = self.list_offsets[list_id]
+        return self.list_items[start : self.list_offsets[list_id + 1]]
+
+    def child(self, index: int, name: str) -> int:
+        """The node in field name of node index, or -1 for None."""
+        value = self.fields[self._field(index, name)]
+        tag = value & _TAG_MASK
+        if tag == NODE:
+            return value >> _TAG_BITS
+        if tag == NONE:
+            return -1
+        raise TypeError(f"{self.node_class(index).__name__}.{name} is not a node")
+
+    def children(self, index: int, name: str = None):
+        """Node indexes in list field name, or in every field if name is None.
+
+        Non-node list items (e.g. the strings in Scan.args) are skipped.
+        """
+        if name is None:
+            kind = self.kinds[index]
+            start = self.offsets[index]
+            values = self.fields[start : start + _FIELD_COUNTS[kind]]
+        else:
+            value = self.fields[self._field(index, name)]
+            if value & _TAG_MASK != LIST:
+                raise TypeError(
+                    f"{self.node_class(index).__name__}.{name} is not a list"
+                )
+            values = [value]
+        result = []
+        for value in values:
+            tag = value & _TAG_MASK
+            if tag == NODE:
+                result.append(value >> _TAG_BITS)
+            elif tag == LIST:
+                for item in self._list(value >> _TAG_BITS):
+                    if item & _TAG_MASK == NODE:
+                        result.append(item >> _TAG_BITS)
+        return result
+
+    def scalar(self, index: int, name: str):
+        """The string, constant or None in field name of node index."""
+        value = self.fields[self._field(index, name)]
+        tag = value & _TAG_MASK
+        if tag == NODE or tag == LIST:
+            raise TypeError(f"{self.node_class(index).__name__}.{name} is not a scalar")
+        return self.decode(value)
+
+    def op_code(self, index: int) -> int:
+        """The operator of a BinaryOp or UnaryOp as an index into OPERATORS."""
+        return self.fields[self._field(index, "op")] >> _TAG_BITS
+
+    def walk(self, root: int = 0):
+        """Yields the node indexes below root (inclusive) in preorder."""
+        kinds = self.kinds
+        offsets = self.offsets
+        fields = self.fields
+        field_counts = _FIELD_COUNTS
+        stack = [root]
+        while stack:
+            index = stack.pop()
+            yield index
+            start = offsets[index]
+            end = start + field_counts[kinds[index]]
+            # Pushed in reverse so the first field is visited first
+            for k in range(end - 1, start - 1, -1):
+                value = fields[k]
+                tag = value & _TAG_MASK
+                if tag == NODE:
+                    stack.append(value >> _TAG_BITS)
+                elif tag == LIST:
+                    items = self._list(value >> _TAG_BITS)
+                    for item in reversed(items):
+                        if item & _TAG_MASK == NODE:
+                            stack.append(item >> _TAG_BITS)
+
+    # === Transformation ===
+
+    def add(self, cls: type) -> int:
+        """Appends a node of class cls with every field None; returns its index."""
+        kind = KINDS[cls]
+        index = len(self.kinds)
+        self.kinds.append(kind)
+        self.offsets.append(len(self.fields))
+        self.fields.extend([NONE] * _FIELD_COUNTS[kind])
+        return index
+
+    def _add_list(self, items) -> int:
+        self.list_items.extend(items)
+        self.list_offsets.append(len(self.list_items))
+        return len(self.list_offsets) - 2
+
+    def set_child(self, index: int, name: str, child: int) -> None:
+        """Points field name at node child, or sets it to None if child is -1."""
+        self.fields[self._field(index, name)] = (
+            NONE if child < 0 else child << _TAG_BITS | NODE
+        )
+
+    def set_children(self, index: int, name: str, children) -> None:
+        """Sets list field name to the given node indexes."""
+        items = [child << _TAG_BITS | NODE for child in children]
+        self.fields[self._field(index, name)] = (
+            self._add_list(items) << _TAG_BITS | LIST
+        )
+
+    def set_scalar(self, index: int, name: str, value) -> None:
+        self.fields[self._field(index, name)] = self.encode_scalar(value)
@@ -0,0 +1,243 @@
+import time
+from antlr4 import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from obfuscator.parser.ObfuMiniCLexer import ObfuMiniCLexer
+from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
+from obfuscator.ast_builder import ASTBuilder
+from obfuscator.ast_listener import ASTListener
+from obfuscator.ast import Program
+from obfuscator.fast_lexer import FastLexer, ParseError
+from obfuscator import fast_parser
+from obfuscator.incremental import IncrementalParser
+from obfuscator.input_stream import MappedFileStream
+from obfuscator.parallel import parse_parallel
+
+
+class ParseRecord:
+    """Timings of one ANTLR parse, split by stage. A stage that did not run is None."""
+
+    def __init__(self, path: str, lex_time: float, sll_time, ll_time):
+        self.path = path
+        self.lex_time = lex_time
+        self.sll_time = sll_time
+        self.ll_time = ll_time
+
+    @property
+    def fell_back(self) -> bool:
+        return self.sll_time is not None and self.ll_time is not None
+
+    def __str__(self):
+        def ms(seconds):
+            return "-" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+        if self.sll_time is None:
+            outcome = "LL only"
+        else:
+            outcome = "LL fallback" if self.fell_back else "SLL ok"
+        return (
+            f"{self.path}: {outcome}, lex {ms(self.lex_time)}, "
+            f"SLL {ms(self.sll_time)}, LL {ms(self.ll_time)}"
+        )
+
+
+class ParseStats:
+    """Collects ParseRecords across every ANTLR parse in this process."""
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, record: ParseRecord) -> None:
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    @property
+    def fallbacks(self) -> int:
+        return sum(1 for r in self.records if r.fell_back)
+
+    def report(self) -> str:
+        lines = [str(r) for r in self.records]
+        total = len(self.records)
+        lex = sum(r.lex_time for r in self.records)
+        sll = sum(r.sll_time or 0.0 for r in self.records)
+        ll = sum(r.ll_time or 0.0 for r in self.records)
+        lines.append(
+            f"{total} file(s), {self.fallbacks} LL fallback(s), "
+            f"lex {lex:.3f}s, SLL {sll:.3f}s, LL {ll:.3f}s"
+        )
+        return "\n".join(lines)
+
+
+parse_stats = ParseStats()
+
+
+class RaiseErrorListener(ErrorListener):
+    """Raises the first syntax error reported as a ParseError, as the fast
+    frontend does, instead of printing it and recovering."""
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        raise ParseError(msg, line, column)
+
+
+RaiseErrorListener.INSTANCE = RaiseErrorListener()
+
+
+def raise_errors(recognizer):
+    """Makes a lexer or parser raise ParseError at its first syntax error."""
+    recognizer.removeErrorListeners()
+    recognizer.addErrorListener(RaiseErrorListener.INSTANCE)
+    return recognizer
+
+
+def parse_tree(stream: CommonTokenStream, strategy: str = "sll-ll", listener=None):
+    """Parses a compilationUnit and returns (tree, sll_time, ll_time).
+
+    Stage timings are None for a stage that did not run. An optional
+    ASTListener is registered as a parse listener and reset before a
+    fallback re-parse.
+
+    With the "sll-ll" strategy the cheaper SLL prediction mode is tried first
+    with a bail-out error strategy; only when it fails is the input re-parsed
+    with full LL and the default error strategy. The "ll" strategy goes
+    straight to the second stage. A syntax error raises ParseError.
+    """
+    parser = raise_errors(ObfuMiniCParser(stream))
+    if listener is not None:
+        parser.addParseListener(listener)
+    sll_time = None
+    if strategy == "sll-ll":
+        parser._interp.predictionMode = PredictionMode.SLL
+        parser._errHandler = BailErrorStrategy()
+        parser.removeErrorListeners()
+        start = time.perf_counter()
+        try:
+            tree = parser.compilationUnit()
+            return tree, time.perf_counter() - start, None
+        except ParseCancellationException:
+            sll_time = time.perf_counter() - start
+        parser._errHandler = DefaultErrorStrategy()
+        raise_errors(parser)
+        # Parser.reset() fails while parse listeners are registered
+        parser.removeParseListeners()
+        parser.reset()
+        parser._interp.predictionMode = PredictionMode.LL
+        if listener is not None:
+            listener.reset()
+            parser.addParseListener(listener)
+    elif strategy != "ll":
+        raise ValueError(f"Unknown parse strategy: {strategy}")
+
+    start = time.perf_counter()
+    tree = parser.compilationUnit()
+    return tree, sll_time, time.perf_counter() - start
+
+
+LEXERS = {
+    "antlr": ObfuMiniCLexer,
+    "fast": FastLexer,
+}
+
+
+def parse_antlr(
+    input_path: str,
+    strategy: str = "sll-ll",
+    lexer: str = "antlr",
+    builder: str = "visitor",
+) -> Program:
+    """Reference frontend: generated ANTLR lexer/parser plus ASTBuilder.
+
+    With builder="listener" the AST is built by an ASTListener during the
+    parse, so the full parse tree never exists alongside the AST. The first
+    lexer or parser error raises ParseError.
+    """
+    if builder not in ("visitor", "listener"):
+        raise ValueError(f"Unknown AST builder: {builder}")
+    # Token text is read from the mapped file, so build the AST before closing
+    with MappedFileStream(input_path) as input_stream:
+        stream = CommonTokenStream(raise_errors(LEXERS[lexer](input_stream)))
+        start = time.perf_counter()
+        stream.fill()
+        lex_time = time.perf_counter() - start
+
+        listener = ASTListener() if builder == "listener" else None
+        tree, sll_time, ll_time = parse_tree(stream, strategy, listener)
+        parse_stats.add(ParseRecord(input_path, lex_time, sll_time, ll_time))
+        if listener is not None:
+            return listener.program()
+        return ASTBuilder().visit(tree)
+
+
+def parse_fast(input_path: str) -> Program:
+    """Hand-written recursive-descent frontend, see obfuscator.fast_parser."""
+    with open(input_path, encoding="utf-8") as f:
+        return fast_parser.parse(f.read())
+
+
+incremental_parser = IncrementalParser()
+
+
+def parse_incremental(input_path: str, cache=None) -> Program:
+    """Fast frontend that only reparses top-level definitions that changed.
+
+    Unchanged definitions are reused from earlier calls in this process and,
+    given an ASTCache, from earlier runs.
+    """
+    incremental_parser.cache = cache
+    with open(input_path, encoding="utf-8") as f:
+        return incremental_parser.parse(f.read())
+
+
+PARSERS = {
+    "antlr": parse_antlr,
+    "antlr-listener": parse_antlr,
+    "fast": parse_fast,
+    "incremental": parse_incremental,
+}
+
+# Backends whose top-level definitions can be parsed in a process pool
+PARALLEL_PARSERS = ("antlr", "fast")
+
+
+def parse_file(
+    input_path: str,
+    parser: str = "antlr",
+    lexer: str = "antlr",
+    cache=None,
+    jobs: int = 1,
+) -> Program:
+    """Builds the AST with the chosen backend; lexer only applies to the antlr ones.
+
+    With an ASTCache the frontend is skipped entirely for inputs seen before.
+    jobs other than 1 parses the top-level definitions of the antlr and fast
+    backends in a pool of that many processes (0 meaning one per core).
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown parser backend: {parser}")
+    if lexer not in LEXERS:
+        raise ValueError(f"Unknown lexer backend: {lexer}")
+    if jobs != 1 and parser not in PARALLEL_PARSERS:
+        raise ValueError(f"Parallel parsing is not supported by {parser}")
+    if cache is not None:
+        with open(input_path, "rb") as f:
+            key = cache.key(f.read(), parser)
+        program = cache.get(key)
+        if program is not None:
+            return program
+    if jobs != 1:
+        with open(input_path, encoding="utf-8") as f:
+            program = parse_parallel(f.read(), parser, lexer, jobs or None)
+    elif parser == "antlr":
+        program = parse_antlr(input_path, lexer=lexer)
+    elif parser == "antlr-listener":
+        program = parse_antlr(input_path, lexer=lexer, builder="listener")
+    elif parser == "incremental":
+        program = parse_incremental(input_path, cache)
+    else:
+        program = PARSERS[parser](input_path)
+    if cache is not None:
+        cache.put(key, program)
+    return program
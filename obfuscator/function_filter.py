@@ -0,0 +1,95 @@
+import re
+from functools import cached_property
+from obfuscator.ast import Function, Program
+from obfuscator.incremental import parse_span, prescan_calls, split_definitions
+
+# "type name (" after any leading whitespace and comments
+_HEADER_RE = re.compile(
+    r"(?:\s|//[^\r\n]*|/\*.*?\*/)*"
+    r"[A-Za-z_][A-Za-z0-9_]*\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(",
+    re.DOTALL,
+)
+
+
+class RawFunction(Function):
+    """A top-level function kept as its source text and emitted verbatim.
+
+    The AST is only parsed when a pass reads it, e.g. the inliner looking
+    at a callee's params and body.
+    """
+
+    # Walks do not parse it: it has no children until it is replaced
+    _child_fields = ()
+
+    def __init__(self, name: str, text: str, start: int, end: int):
+        self.name = name
+        self.text = text
+        self.start = start
+        self.end = end
+
+    @property
+    def source(self) -> str:
+        return self.text[self.start : self.end].strip()
+
+    @cached_property
+    def function(self) -> Function:
+        return parse_span(self.text, self.start, self.end).functions[0]
+
+    @cached_property
+    def return_type(self):
+        return self.function.return_type
+
+    @cached_property
+    def params(self):
+        return self.function.params
+
+    @cached_property
+    def body(self):
+        return self.function.body
+
+    def _repr(self, indent=0):
+        return f"{'  ' * indent}RawFunction: {self.name}\n"
+
+
+def parse_selected(text: str, names) -> Program:
+    """Parses only the named functions; all others become RawFunctions.
+
+    Definitions are found with the incremental frontend's boundary scan
+    and named by matching their header, so unselected code is never
+    tokenized. Spans that are not function definitions (top-level
+    varDecls) are parsed as usual, which drops them like ASTBuilder does.
+    """
+    names = set(names)
+    functions = []
+    for start, end in split_definitions(text):
+        m = _HEADER_RE.match(text, start, end)
+        if m is not None and m.group(1) not in names:
+            functions.append(RawFunction(m.group(1), text, start, end))
+        else:
+            functions.extend(parse_span(text, start, end).functions)
+    return Program(functions)
+
+
+def selected_functions(program: Program) -> Program:
+    return Program([f for f in program.functions if not isinstance(f, RawFunction)])
+
+
+def merge_selected(program: Program, selected: Program) -> None:
+    """Writes the (possibly replaced) selected functions back in place."""
+    transformed = iter(selected.functions)
+    for i, func in enumerate(program.functions):
+        if not isinstance(func, RawFunction):
+            program.functions[i] = next(transformed)
+
+
+def reserved_names(program: Program) -> set:
+    """Names that renaming must keep, since raw source refers to them.
+
+    That is every unselected function and everything called from one.
+    """
+    reserved = set()
+    for func in program.functions:
+        if isinstance(func, RawFunction):
+            reserved.add(func.name)
+            reserved |= prescan_calls(func.source)
+    return reserved
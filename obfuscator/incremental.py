@@ -0,0 +1,157 @@
+import hashlib
+import re
+from obfuscator.ast import Program
+from obfuscator.fast_lexer import ParseError
+from obfuscator.fast_parser import FastParser
+from obfuscator import wire
+
+# Only the tokens that matter for finding top-level boundaries; strings,
+# chars and comments are matched so braces inside them are skipped.
+_BOUNDARY_RE = re.compile(
+    r"""
+    "(?:[^"\\]|\\.)*"
+    | '.'
+    | //[^\r\n]*
+    | /\*.*?\*/
+    | [{};]
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def split_definitions(text: str):
+    """Splits a compilation unit into top-level funcDef/varDecl source spans.
+
+    Returns (start, end) offsets. A span ends at a ';' or a closing '}' at
+    brace depth zero; leading whitespace and comments belong to the span that
+    follows them, and any trailing text forms a last span of its own.
+    """
+    spans = []
+    depth = 0
+    start = 0
+    for m in _BOUNDARY_RE.finditer(text):
+        tok = m.group()
+        if tok == "{":
+            depth += 1
+        elif tok == "}":
+            depth -= 1
+            if depth == 0:
+                spans.append((start, m.end()))
+                start = m.end()
+        elif tok == ";" and depth == 0:
+            spans.append((start, m.end()))
+            start = m.end()
+    if text[start:].strip():
+        spans.append((start, len(text)))
+    return spans
+
+
+_CALL_RE = re.compile(r"\b([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+_NOT_CALLS = {"if", "while", "for", "switch", "return", "printf", "scanf"}
+
+
+def prescan_calls(text: str) -> set:
+    """Names that appear in call position anywhere in the source.
+
+    A cheap over-approximation: strings and comments are not excluded.
+    """
+    return {name for name in _CALL_RE.findall(text) if name not in _NOT_CALLS}
+
+
+def parse_span(text: str, start: int, end: int) -> Program:
+    """Parses text[start:end] with the fast parser.
+
+    Errors are reported with their line and column in the whole text.
+    """
+    try:
+        return FastParser(text[start:end]).parse()
+    except ParseError as e:
+        line = e.line + text.count("\n", 0, start)
+        column = e.column
+        if e.line == 1:
+            column += start - (text.rfind("\n", 0, start) + 1)
+        raise ParseError(e.message, line, column) from None
+
+
+def fingerprint(span: str) -> bytes:
+    return hashlib.blake2b(span.encode(), digest_size=16).digest()
+
+
+class IncrementalParser:
+    """Reparses only the top-level definitions that changed since the last call.
+
+    Unchanged spans reuse the Function nodes built for them earlier, so the
+    cost of a call after a small edit is the boundary scan plus the edited
+    definitions. The passes mutate the AST in place, so by default each
+    span also keeps its definitions encoded in the wire format (see
+    obfuscator.wire): a reused definition is handed out again as is while
+    nothing has invalidated it (see obfuscator.ast.invalidate), and as a
+    fresh decoded copy once it may have changed. Programs returned by
+    earlier calls then share nodes with the latest one, which is the only
+    one that may be changed. With copy=False the cached nodes are always
+    returned and must be treated as read-only.
+
+    Only the spans of the latest call are retained. With an ASTCache,
+    per-span results also persist across processes.
+    """
+
+    def __init__(self, cache=None, copy: bool = True):
+        self.cache = cache
+        self.copy = copy
+        self.spans = {}
+        self.parsed = 0
+        self.reused = 0
+
+    def parse(self, text: str) -> Program:
+        functions = []
+        spans = {}
+        self.parsed = 0
+        self.reused = 0
+        for start, end in split_definitions(text):
+            span = text[start:end]
+            key = fingerprint(span)
+            if key in spans:
+                # Repeated in this text; the first occurrence has the nodes
+                self.reused += 1
+                data, funcs = spans[key]
+                if data is not None:
+                    funcs = wire.loads(data).functions
+            else:
+                entry = self.spans.get(key)
+                if entry is None:
+                    entry = self._load(span, start, text)
+                else:
+                    self.reused += 1
+                    data, funcs = entry
+                    if data is not None and _touched(funcs):
+                        entry = data, wire.loads(data).functions
+                spans[key] = entry
+                funcs = entry[1]
+            functions.extend(funcs)
+        self.spans = spans
+        if self.cache is not None and self.parsed:
+            self.cache.evict()
+        return Program(functions)
+
+    def _load(self, span: str, start: int, text: str):
+        program = None
+        if self.cache is not None:
+            cache_key = self.cache.key(span.encode(), "incremental")
+            program = self.cache.get(cache_key)
+            if program is not None:
+                self.reused += 1
+        if program is None:
+            program = parse_span(text, start, start + len(span))
+            self.parsed += 1
+            if self.cache is not None:
+                self.cache.put(cache_key, program, evict=False)
+        # The wire format is encoded and decoded without recursion, so
+        # deeply nested expressions can be copied
+        data = wire.dumps(program) if self.copy else None
+        return data, program.functions
+
+
+def _touched(functions) -> bool:
+    # A freshly parsed or decoded Function has no _fingerprint; it is set
+    # when the function is invalidated, or fingerprinted, which may follow
+    return any(hasattr(func, "_fingerprint") for func in functions)
@@ -1,50 +1,85 @@
 from obfuscator.ast import *
-import copy
+from obfuscator.leaves import LeafInterner
+from obfuscator.visitor import walk
 import itertools
 
+# Pushed above an expression whose operands are still on the work stack
+_EXIT = object()
+
 
 class FunctionInliner:
     def __init__(self, ast: Program):
         self.ast = ast
         self.function_map = {func.name: func for func in ast.functions}
         self.counter = itertools.count()
+        self.leaves = LeafInterner()
 
     def inline(self):
         for func in self.ast.functions:
-            func.body = self._inline_block(func.body)
+            self.inline_function(func)
+
+    def inline_function(self, func: Function):
+        invalidate(func)
+        func.body = self._inline_block(func.body)
 
     def _inline_block(self, stmts: List[Statement]) -> List[Statement]:
-        result = []
-        for stmt in stmts:
-            if isinstance(stmt, ExpressionStmt) and isinstance(stmt.expr, FuncCall):
-                inlined = self._try_inline_call(stmt.expr)
-                if inlined:
-                    result.extend(inlined)
-                    continue
-            elif isinstance(stmt, VariableDecl) and isinstance(
-                stmt.init_expr, FuncCall
-            ):
-                inlined = self._try_inline_call(stmt.init_expr, assign_to=stmt.name)
-                if inlined:
-                    result.extend(inlined)
-                    continue
-            elif isinstance(stmt, IfStmt):
-                stmt.then_branch = self._wrap(stmt.then_branch)
-                if stmt.else_branch:
-                    stmt.else_branch = self._wrap(stmt.else_branch)
-            elif isinstance(stmt, WhileStmt):
-                stmt.body = self._wrap(stmt.body)
-            elif isinstance(stmt, ForStmt):
-                stmt.body = self._wrap(stmt.body)
-            elif isinstance(stmt, Block):
-                stmt.items = self._inline_block(stmt.items)
-            result.append(stmt)
-        return result
+        # Nested bodies are inlined from an explicit stack of (statements
+        # left, result) pairs rather than by recursion. A compound statement
+        # gets its new bodies at once and they are filled in before the
+        # statements after it, so calls are inlined in source order.
+        body = []
+        stack = [(iter(stmts), body)]
+        while stack:
+            remaining, result = stack.pop()
+            for stmt in remaining:
+                nested = None
+                if isinstance(stmt, ExpressionStmt) and isinstance(
+                    stmt.expr, FuncCall
+                ):
+                    inlined = self._try_inline_call(stmt.expr)
+                    if inlined:
+                        result.extend(inlined)
+                        continue
+                elif isinstance(stmt, VariableDecl) and isinstance(
+                    stmt.init_expr, FuncCall
+                ):
+                    inlined = self._try_inline_call(
+                        stmt.init_expr, assign_to=stmt.name
+                    )
+                    if inlined:
+                        result.extend(inlined)
+                        continue
+                elif isinstance(stmt, IfStmt):
+                    stmt.then_branch, then_body = self._wrap(stmt.then_branch)
+                    nested = [then_body]
+                    if stmt.else_branch:
+                        stmt.else_branch, else_body = self._wrap(stmt.else_branch)
+                        nested.insert(0, else_body)
+                elif isinstance(stmt, WhileStmt):
+                    stmt.body, body_items = self._wrap(stmt.body)
+                    nested = [body_items]
+                elif isinstance(stmt, ForStmt):
+                    stmt.body, body_items = self._wrap(stmt.body)
+                    nested = [body_items]
+                elif isinstance(stmt, Block):
+                    items = stmt.items
+                    stmt.items = []
+                    nested = [(iter(items), stmt.items)]
+                result.append(stmt)
+                if nested:
+                    # Come back to the rest of this list after the bodies
+                    stack.append((remaining, result))
+                    stack.extend(nested)
+                    break
+        return body
 
     def _wrap(self, s):
+        """A new Block for a branch or loop body, and the (statements,
+        result) pair that fills it in."""
+        block = Block([])
         if isinstance(s, Block):
-            return Block(self._inline_block(s.items))
-        return Block(self._inline_block([s]))
+            return block, (iter(s.items), block.items)
+        return block, (iter([s]), block.items)
 
     def _try_inline_call(
         self, call: FuncCall, assign_to=None
@@ -82,8 +117,8 @@ class FunctionInliner:
                 param_mapping[param.name] = fresh_name
                 inlined_stmts.append(VariableDecl(param.param_type, fresh_name, arg))
 
-        body_copy = copy.deepcopy(target_func.body)
-        renamer = _LocalVarRenamer(self.counter, param_mapping)
+        body_copy = self._copy_body(target_func)
+        renamer = _LocalVarRenamer(self.counter, param_mapping, self.leaves)
         body_copy = renamer.rename_block(body_copy, param_names)
 
         temp_result = self._fresh_name("ret") if assign_to is None else assign_to
@@ -91,12 +126,14 @@ class FunctionInliner:
         for stmt in body_copy:
             if isinstance(stmt, Return):
                 if stmt.value:
-                    final_stmts.append(Assignment(Variable(temp_result), stmt.value))
+                    final_stmts.append(
+                        Assignment(self.leaves.variable(temp_result), stmt.value)
+                    )
             else:
                 final_stmts.append(stmt)
 
         if assign_to is None:
-            inlined_stmts.append(ExpressionStmt(Variable(temp_result)))
+            inlined_stmts.append(ExpressionStmt(self.leaves.variable(temp_result)))
         else:
             if temp_result != assign_to:
                 inlined_stmts.append(VariableDecl("int", temp_result, None))
@@ -104,75 +141,127 @@ class FunctionInliner:
         inlined_stmts.extend(final_stmts)
         return inlined_stmts
 
+    def _copy_body(self, func: Function) -> List[Statement]:
+        return [stmt.clone() for stmt in func.body]
+
     def _fresh_name(self, base):
         return f"{base}_{next(self.counter)}"
 
 
 class _LocalVarRenamer:
-    def __init__(self, counter, initial_map=None):
+    def __init__(self, counter, initial_map=None, leaves=None):
         self.counter = counter
         self.name_map = initial_map or {}
+        self.leaves = leaves or LeafInterner()
 
     def rename_block(
         self, stmts: List[Statement], exclude: List[str] = []
     ) -> List[Statement]:
         renamed = []
         for stmt in stmts:
-            renamed.append(self._rename_stmt(stmt, exclude))
+            self._rename_stmt(stmt, exclude)
+            renamed.append(stmt)
         return renamed
 
-    def _rename_stmt(self, stmt: Statement, exclude: List[str]) -> Statement:
-        if isinstance(stmt, VariableDecl):
-            if stmt.name not in exclude:
-                new_name = self._fresh(stmt.name)
-                self.name_map[stmt.name] = new_name
-                stmt.name = new_name
-            if stmt.init_expr:
-                stmt.init_expr = self._rename_expr(stmt.init_expr)
-        elif isinstance(stmt, Assignment):
-            stmt.target = Variable(self._map(stmt.target))
+    # Statements are renamed in place; compound ones return the statements
+    # nested in them for walk to visit
+    _rename_stmt = walk("_rename_stmt_", "_rename_other_stmt")
+
+    def _rename_stmt_VariableDecl(self, stmt: VariableDecl, exclude: List[str]):
+        if stmt.name not in exclude:
+            new_name = self._fresh(stmt.name)
+            self.name_map[stmt.name] = new_name
+            stmt.name = new_name
+        if stmt.init_expr:
+            stmt.init_expr = self._rename_expr(stmt.init_expr)
+
+    def _rename_stmt_Assignment(self, stmt: Assignment, exclude: List[str]):
+        target = stmt.target
+        name = target.name if isinstance(target, Variable) else target
+        stmt.target = self.leaves.variable(self._map(name))
+        stmt.value = self._rename_expr(stmt.value)
+
+    def _rename_stmt_ExpressionStmt(self, stmt: ExpressionStmt, exclude: List[str]):
+        if stmt.expr:
+            stmt.expr = self._rename_expr(stmt.expr)
+
+    def _rename_stmt_Return(self, stmt: Return, exclude: List[str]):
+        if stmt.value:
             stmt.value = self._rename_expr(stmt.value)
-        elif isinstance(stmt, ExpressionStmt):
-            if stmt.expr:
-                stmt.expr = self._rename_expr(stmt.expr)
-        elif isinstance(stmt, Return):
-            if stmt.value:
-                stmt.value = self._rename_expr(stmt.value)
-        elif isinstance(stmt, IfStmt):
-            stmt.condition = self._rename_expr(stmt.condition)
-            stmt.then_branch = self._rename_stmt(stmt.then_branch, exclude)
-            if stmt.else_branch:
-                stmt.else_branch = self._rename_stmt(stmt.else_branch, exclude)
-        elif isinstance(stmt, WhileStmt):
-            stmt.condition = self._rename_expr(stmt.condition)
-            stmt.body = self._rename_stmt(stmt.body, exclude)
-        elif isinstance(stmt, ForStmt):
-            if stmt.init:
-                stmt.init = self._rename_expr(stmt.init)
-            if stmt.cond:
-                stmt.cond = self._rename_expr(stmt.cond)
-            if stmt.update:
-                stmt.update = self._rename_expr(stmt.update)
-            stmt.body = self._rename_stmt(stmt.body, exclude)
-        elif isinstance(stmt, Block):
-            stmt.items = self.rename_block(stmt.items, exclude)
-        return stmt
+
+    def _rename_stmt_IfStmt(self, stmt: IfStmt, exclude: List[str]):
+        stmt.condition = self._rename_expr(stmt.condition)
+        if stmt.else_branch:
+            return (stmt.then_branch, stmt.else_branch)
+        return (stmt.then_branch,)
+
+    def _rename_stmt_WhileStmt(self, stmt: WhileStmt, exclude: List[str]):
+        stmt.condition = self._rename_expr(stmt.condition)
+        return (stmt.body,)
+
+    def _rename_stmt_ForStmt(self, stmt: ForStmt, exclude: List[str]):
+        if stmt.init:
+            stmt.init = self._rename_expr(stmt.init)
+        if stmt.cond:
+            stmt.cond = self._rename_expr(stmt.cond)
+        if stmt.update:
+            stmt.update = self._rename_expr(stmt.update)
+        return (stmt.body,)
+
+    def _rename_stmt_Block(self, stmt: Block, exclude: List[str]):
+        return stmt.items
+
+    def _rename_other_stmt(self, stmt: Statement, exclude: List[str]):
+        pass
 
     def _rename_expr(self, expr: Expression) -> Expression:
-        if isinstance(expr, Variable):
-            return Variable(self._map(expr.name))
-        elif isinstance(expr, BinaryOp):
-            return BinaryOp(
-                expr.op, self._rename_expr(expr.left), self._rename_expr(expr.right)
-            )
-        elif isinstance(expr, UnaryOp):
-            return UnaryOp(expr.op, self._rename_expr(expr.operand))
-        elif isinstance(expr, FuncCall):
-            return FuncCall(expr.name, [self._rename_expr(arg) for arg in expr.args])
-        elif isinstance(expr, Literal):
-            return expr
-        else:
+        """A copy of expr with its variables renamed, built bottom-up with an
+        explicit stack. Literals, and nodes other than operators, calls and
+        variables, are shared as they are."""
+        cls = type(expr)
+        if cls is Variable:
+            return self.leaves.variable(self._map(expr.name))
+        if cls is Literal:
             return expr
+        out = []
+        stack = [expr]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if node is _EXIT:
+                node = pop()
+                cls = type(node)
+                if cls is BinaryOp:
+                    right = out.pop()
+                    out.append(BinaryOp(node.op, out.pop(), right))
+                elif cls is UnaryOp:
+                    out.append(UnaryOp(node.op, out.pop()))
+                else:
+                    n = len(node.args)
+                    args = out[len(out) - n :]
+                    del out[len(out) - n :]
+                    out.append(FuncCall(node.name, args))
+                continue
+            cls = type(node)
+            if cls is Variable:
+                out.append(self.leaves.variable(self._map(node.name)))
+            elif cls is BinaryOp:
+                push(node)
+                push(_EXIT)
+                push(node.right)
+                push(node.left)
+            elif cls is UnaryOp:
+                push(node)
+                push(_EXIT)
+                push(node.operand)
+            elif cls is FuncCall:
+                push(node)
+                push(_EXIT)
+                stack.extend(reversed(node.args))
+            else:
+                out.append(node)
+        return out[0]
 
     def _map(self, name):
         return self.name_map.get(name, name)
@@ -0,0 +1,92 @@
+import mmap
+import re
+from array import array
+from antlr4 import InputStream
+from antlr4.Token import Token
+
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+
+class MappedFileStream(InputStream):
+    """Memory-mapped replacement for antlr4.FileStream.
+
+    FileStream keeps the decoded text plus a list with one int per character,
+    roughly 9 bytes per source byte. Here an ASCII file is read straight from
+    the mapping, whose indexing already yields code points; anything else is
+    decoded as UTF-8 into an array of 4-byte code points. Token text is
+    sliced from the buffer on demand.
+
+    The mapping stays open until close(), so use the stream as a context
+    manager around both parsing and AST building.
+    """
+
+    def __init__(self, fileName: str):
+        self.name = fileName
+        self.fileName = fileName
+        self._index = 0
+        self._strdata = None
+        self._file = open(fileName, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._mmap = None
+        buffer = self._mmap if self._mmap is not None else b""
+        if _NON_ASCII.search(buffer) is None:
+            self.data = buffer
+        else:
+            text = bytes(buffer).decode("utf-8")
+            self.data = array("I", text.encode("utf-32-le"))
+            self.close()
+        self._size = len(self.data)
+
+    @property
+    def strdata(self) -> str:
+        """The whole text, decoded on first use (e.g. by FastLexer)."""
+        if self._strdata is None:
+            if isinstance(self.data, array):
+                self._strdata = self.data.tobytes().decode("utf-32-le")
+            else:
+                self._strdata = self.data[:].decode("ascii")
+        return self._strdata
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0
+        if offset < 0:
+            offset += 1
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        return self.data[pos]
+
+    def LT(self, offset: int):
+        return self.LA(offset)
+
+    def getText(self, start: int, stop: int) -> str:
+        if start >= self._size:
+            return ""
+        chunk = self.data[start : stop + 1]
+        if isinstance(chunk, array):
+            return chunk.tobytes().decode("utf-32-le")
+        return chunk.decode("ascii")
+
+    def getSourceName(self) -> str:
+        return self.fileName
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            if self.data is self._mmap:
+                self.data = b""
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return self.strdata
@@ -0,0 +1,37 @@
+import sys
+from obfuscator.ast import Literal, Variable
+
+
+class LeafInterner:
+    """Hash-conses Variable and Literal nodes and interns identifiers.
+
+    Leaves built through one interner are shared: every occurrence of a
+    name or constant is the same object, and names are sys.intern'ed, so
+    repeated identifiers cost one string. Shared leaves are immutable by
+    convention; a pass that renames or rewrites a leaf puts a new node in
+    its parent instead of assigning to the leaf (copy-on-write).
+
+    Tables are per interner, i.e. per parse or per pass, so they are freed
+    with the AST rather than growing for the life of the process.
+    """
+
+    def __init__(self):
+        self.variables = {}
+        self.literals = {}
+
+    def name(self, name: str) -> str:
+        return sys.intern(name)
+
+    def variable(self, name: str) -> Variable:
+        node = self.variables.get(name)
+        if node is None:
+            node = self.variables[name] = Variable(sys.intern(name))
+        return node
+
+    def literal(self, value) -> Literal:
+        # Keyed by type as well, since True == 1
+        key = (type(value), value)
+        node = self.literals.get(key)
+        if node is None:
+            node = self.literals[key] = Literal(value)
+        return node
@@ -0,0 +1,92 @@
+import multiprocessing
+import os
+from antlr4 import CommonTokenStream, InputStream
+from obfuscator.ast import Program
+from obfuscator.ast_builder import ASTBuilder
+from obfuscator.fast_lexer import ParseError
+from obfuscator.fast_parser import FastParser
+from obfuscator.incremental import split_definitions
+from obfuscator import wire
+
+# Chunks per worker; more than one evens out definitions of uneven size.
+CHUNKS_PER_WORKER = 4
+
+
+def split_chunks(text: str, n_chunks: int):
+    """Groups consecutive top-level definitions into about n_chunks spans.
+
+    Returns (start, end) offsets that cover the definitions in source order.
+    """
+    spans = split_definitions(text)
+    if not spans:
+        return []
+    target = max(1, len(text) // max(1, n_chunks))
+    chunks = []
+    chunk_start = spans[0][0]
+    for start, end in spans:
+        if end - chunk_start >= target:
+            chunks.append((chunk_start, end))
+            chunk_start = end
+    if chunk_start < spans[-1][1]:
+        chunks.append((chunk_start, spans[-1][1]))
+    return chunks
+
+
+def _parse_chunk(job):
+    # Imported here to avoid a cycle: frontend imports this module.
+    from obfuscator.frontend import LEXERS, parse_tree, raise_errors
+
+    parser, lexer, text, line, column = job
+    if parser == "fast":
+        try:
+            program = FastParser(text).parse()
+        except ParseError as e:
+            if e.line == 1:
+                column += e.column
+            else:
+                column = e.column
+            raise ParseError(e.message, e.line + line - 1, column) from None
+    else:
+        token_source = raise_errors(LEXERS[lexer](InputStream(text)))
+        token_source.line = line
+        token_source.column = column
+        tree, _, _ = parse_tree(CommonTokenStream(token_source))
+        program = ASTBuilder().visit(tree)
+    return program.functions
+
+
+def _parse_chunk_encoded(job):
+    # The wire format is a fraction of the size of pickled nodes, and is
+    # quicker to encode and decode than pickled ast_cache tuples
+    return wire.dumps(Program(_parse_chunk(job)))
+
+
+def parse_parallel(
+    text: str, parser: str = "fast", lexer: str = "antlr", workers: int = None
+) -> Program:
+    """Parses the top-level definitions of text across a process pool.
+
+    A brace-matching pre-scan splits the compilation unit into chunks of
+    whole definitions; each worker parses its chunk with the chosen
+    backend and the Function lists are merged back in source order. Workers
+    are told where their chunk starts, so syntax errors report the same
+    line and column as a serial parse.
+    """
+    workers = workers or os.cpu_count()
+    jobs = []
+    line = 1
+    pos = 0
+    for start, end in split_chunks(text, workers * CHUNKS_PER_WORKER):
+        line += text.count("\n", pos, start)
+        pos = start
+        column = start - (text.rfind("\n", 0, start) + 1)
+        jobs.append((parser, lexer, text[start:end], line, column))
+    functions = []
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            functions.extend(_parse_chunk(job))
+        return Program(functions)
+    with multiprocessing.Pool(workers) as pool:
+        for encoded in pool.imap(_parse_chunk_encoded, jobs):
+            functions.extend(wire.loads(encoded).functions)
+    return Program(functions)
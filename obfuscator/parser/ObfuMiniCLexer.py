@@ -10,93 +10,106 @@ else:
 
 def serializedATN():
     return [
-        4,0,41,247,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,44,283,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
         26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
         32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
-        39,7,39,2,40,7,40,1,0,1,0,1,1,1,1,1,2,1,2,1,2,1,3,1,3,1,3,1,4,1,
-        4,1,4,1,5,1,5,1,5,1,6,1,6,1,7,1,7,1,7,1,8,1,8,1,9,1,9,1,9,1,10,1,
-        10,1,11,1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,15,1,15,1,16,1,16,1,
-        16,1,16,1,16,1,16,1,16,1,16,1,16,3,16,131,8,16,1,17,1,17,1,17,1,
-        17,1,18,1,18,1,18,1,18,5,18,141,8,18,10,18,12,18,144,9,18,1,18,1,
-        18,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,
-        21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,
-        23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,26,1,
-        26,1,26,1,27,1,27,1,27,1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,
-        28,1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,32,1,33,1,33,1,34,1,34,1,
-        35,4,35,213,8,35,11,35,12,35,214,1,36,1,36,5,36,219,8,36,10,36,12,
-        36,222,9,36,1,37,4,37,225,8,37,11,37,12,37,226,1,37,1,37,1,38,1,
-        38,1,38,1,38,5,38,235,8,38,10,38,12,38,238,9,38,1,38,1,38,1,39,1,
-        39,1,39,1,40,1,40,1,40,0,0,41,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,
-        17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,
-        39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,
-        61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,
-        1,0,6,2,0,34,34,92,92,1,0,48,57,3,0,65,90,95,95,97,122,4,0,48,57,
-        65,90,95,95,97,122,3,0,9,10,13,13,32,32,2,0,10,10,13,13,253,0,1,
-        1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,
-        0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,
-        0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,
-        0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,
-        0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,
-        0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,
-        0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,
-        0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,
-        0,0,1,83,1,0,0,0,3,85,1,0,0,0,5,87,1,0,0,0,7,90,1,0,0,0,9,93,1,0,
-        0,0,11,96,1,0,0,0,13,99,1,0,0,0,15,101,1,0,0,0,17,104,1,0,0,0,19,
-        106,1,0,0,0,21,109,1,0,0,0,23,111,1,0,0,0,25,113,1,0,0,0,27,115,
-        1,0,0,0,29,117,1,0,0,0,31,119,1,0,0,0,33,130,1,0,0,0,35,132,1,0,
-        0,0,37,136,1,0,0,0,39,147,1,0,0,0,41,151,1,0,0,0,43,156,1,0,0,0,
-        45,161,1,0,0,0,47,168,1,0,0,0,49,174,1,0,0,0,51,180,1,0,0,0,53,184,
-        1,0,0,0,55,187,1,0,0,0,57,192,1,0,0,0,59,199,1,0,0,0,61,201,1,0,
-        0,0,63,203,1,0,0,0,65,205,1,0,0,0,67,207,1,0,0,0,69,209,1,0,0,0,
-        71,212,1,0,0,0,73,216,1,0,0,0,75,224,1,0,0,0,77,230,1,0,0,0,79,241,
-        1,0,0,0,81,244,1,0,0,0,83,84,5,61,0,0,84,2,1,0,0,0,85,86,5,38,0,
-        0,86,4,1,0,0,0,87,88,5,124,0,0,88,89,5,124,0,0,89,6,1,0,0,0,90,91,
-        5,38,0,0,91,92,5,38,0,0,92,8,1,0,0,0,93,94,5,61,0,0,94,95,5,61,0,
-        0,95,10,1,0,0,0,96,97,5,33,0,0,97,98,5,61,0,0,98,12,1,0,0,0,99,100,
-        5,60,0,0,100,14,1,0,0,0,101,102,5,60,0,0,102,103,5,61,0,0,103,16,
-        1,0,0,0,104,105,5,62,0,0,105,18,1,0,0,0,106,107,5,62,0,0,107,108,
-        5,61,0,0,108,20,1,0,0,0,109,110,5,43,0,0,110,22,1,0,0,0,111,112,
-        5,45,0,0,112,24,1,0,0,0,113,114,5,42,0,0,114,26,1,0,0,0,115,116,
-        5,47,0,0,116,28,1,0,0,0,117,118,5,37,0,0,118,30,1,0,0,0,119,120,
-        5,33,0,0,120,32,1,0,0,0,121,122,5,116,0,0,122,123,5,114,0,0,123,
-        124,5,117,0,0,124,131,5,101,0,0,125,126,5,102,0,0,126,127,5,97,0,
-        0,127,128,5,108,0,0,128,129,5,115,0,0,129,131,5,101,0,0,130,121,
-        1,0,0,0,130,125,1,0,0,0,131,34,1,0,0,0,132,133,5,39,0,0,133,134,
-        9,0,0,0,134,135,5,39,0,0,135,36,1,0,0,0,136,142,5,34,0,0,137,141,
-        8,0,0,0,138,139,5,92,0,0,139,141,9,0,0,0,140,137,1,0,0,0,140,138,
-        1,0,0,0,141,144,1,0,0,0,142,140,1,0,0,0,142,143,1,0,0,0,143,145,
-        1,0,0,0,144,142,1,0,0,0,145,146,5,34,0,0,146,38,1,0,0,0,147,148,
-        5,105,0,0,148,149,5,110,0,0,149,150,5,116,0,0,150,40,1,0,0,0,151,
-        152,5,99,0,0,152,153,5,104,0,0,153,154,5,97,0,0,154,155,5,114,0,
-        0,155,42,1,0,0,0,156,157,5,98,0,0,157,158,5,111,0,0,158,159,5,111,
-        0,0,159,160,5,108,0,0,160,44,1,0,0,0,161,162,5,112,0,0,162,163,5,
-        114,0,0,163,164,5,105,0,0,164,165,5,110,0,0,165,166,5,116,0,0,166,
-        167,5,102,0,0,167,46,1,0,0,0,168,169,5,115,0,0,169,170,5,99,0,0,
-        170,171,5,97,0,0,171,172,5,110,0,0,172,173,5,102,0,0,173,48,1,0,
-        0,0,174,175,5,119,0,0,175,176,5,104,0,0,176,177,5,105,0,0,177,178,
-        5,108,0,0,178,179,5,101,0,0,179,50,1,0,0,0,180,181,5,102,0,0,181,
-        182,5,111,0,0,182,183,5,114,0,0,183,52,1,0,0,0,184,185,5,105,0,0,
-        185,186,5,102,0,0,186,54,1,0,0,0,187,188,5,101,0,0,188,189,5,108,
-        0,0,189,190,5,115,0,0,190,191,5,101,0,0,191,56,1,0,0,0,192,193,5,
-        114,0,0,193,194,5,101,0,0,194,195,5,116,0,0,195,196,5,117,0,0,196,
-        197,5,114,0,0,197,198,5,110,0,0,198,58,1,0,0,0,199,200,5,40,0,0,
-        200,60,1,0,0,0,201,202,5,41,0,0,202,62,1,0,0,0,203,204,5,123,0,0,
-        204,64,1,0,0,0,205,206,5,125,0,0,206,66,1,0,0,0,207,208,5,59,0,0,
-        208,68,1,0,0,0,209,210,5,44,0,0,210,70,1,0,0,0,211,213,7,1,0,0,212,
-        211,1,0,0,0,213,214,1,0,0,0,214,212,1,0,0,0,214,215,1,0,0,0,215,
-        72,1,0,0,0,216,220,7,2,0,0,217,219,7,3,0,0,218,217,1,0,0,0,219,222,
-        1,0,0,0,220,218,1,0,0,0,220,221,1,0,0,0,221,74,1,0,0,0,222,220,1,
-        0,0,0,223,225,7,4,0,0,224,223,1,0,0,0,225,226,1,0,0,0,226,224,1,
-        0,0,0,226,227,1,0,0,0,227,228,1,0,0,0,228,229,6,37,0,0,229,76,1,
-        0,0,0,230,231,5,47,0,0,231,232,5,47,0,0,232,236,1,0,0,0,233,235,
-        8,5,0,0,234,233,1,0,0,0,235,238,1,0,0,0,236,234,1,0,0,0,236,237,
-        1,0,0,0,237,239,1,0,0,0,238,236,1,0,0,0,239,240,6,38,0,0,240,78,
-        1,0,0,0,241,242,5,43,0,0,242,243,5,43,0,0,243,80,1,0,0,0,244,245,
-        5,45,0,0,245,246,5,45,0,0,246,82,1,0,0,0,8,0,130,140,142,214,220,
-        226,236,1,6,0,0
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,1,0,1,0,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,4,1,4,1,4,1,4,
+        1,4,1,4,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,10,
+        1,11,1,11,1,12,1,12,1,13,1,13,1,13,1,14,1,14,1,15,1,15,1,15,1,16,
+        1,16,1,16,1,17,1,17,1,17,1,18,1,18,1,18,1,19,1,19,1,19,1,20,1,20,
+        1,20,1,20,1,20,1,20,1,20,1,20,1,20,3,20,159,8,20,1,21,1,21,1,21,
+        1,21,1,22,1,22,1,22,1,22,5,22,169,8,22,10,22,12,22,172,9,22,1,22,
+        1,22,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,
+        1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,
+        1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,30,
+        1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,
+        1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,1,37,1,37,1,38,1,38,
+        1,39,4,39,241,8,39,11,39,12,39,242,1,40,1,40,5,40,247,8,40,10,40,
+        12,40,250,9,40,1,41,4,41,253,8,41,11,41,12,41,254,1,41,1,41,1,42,
+        1,42,1,42,1,42,5,42,263,8,42,10,42,12,42,266,9,42,1,42,1,42,1,43,
+        1,43,1,43,1,43,5,43,274,8,43,10,43,12,43,277,9,43,1,43,1,43,1,43,
+        1,43,1,43,1,275,0,44,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,
+        10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,41,
+        21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,63,
+        32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,83,42,85,
+        43,87,44,1,0,6,2,0,34,34,92,92,1,0,48,57,3,0,65,90,95,95,97,122,
+        4,0,48,57,65,90,95,95,97,122,3,0,9,10,13,13,32,32,2,0,10,10,13,13,
+        290,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,
+        0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,
+        0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,
+        0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,
+        0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,
+        0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,
+        0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,
+        0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,
+        0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,1,89,1,0,0,0,
+        3,91,1,0,0,0,5,98,1,0,0,0,7,103,1,0,0,0,9,105,1,0,0,0,11,113,1,0,
+        0,0,13,115,1,0,0,0,15,117,1,0,0,0,17,119,1,0,0,0,19,121,1,0,0,0,
+        21,123,1,0,0,0,23,125,1,0,0,0,25,127,1,0,0,0,27,129,1,0,0,0,29,132,
+        1,0,0,0,31,134,1,0,0,0,33,137,1,0,0,0,35,140,1,0,0,0,37,143,1,0,
+        0,0,39,146,1,0,0,0,41,158,1,0,0,0,43,160,1,0,0,0,45,164,1,0,0,0,
+        47,175,1,0,0,0,49,179,1,0,0,0,51,184,1,0,0,0,53,189,1,0,0,0,55,196,
+        1,0,0,0,57,202,1,0,0,0,59,208,1,0,0,0,61,212,1,0,0,0,63,215,1,0,
+        0,0,65,220,1,0,0,0,67,227,1,0,0,0,69,229,1,0,0,0,71,231,1,0,0,0,
+        73,233,1,0,0,0,75,235,1,0,0,0,77,237,1,0,0,0,79,240,1,0,0,0,81,244,
+        1,0,0,0,83,252,1,0,0,0,85,258,1,0,0,0,87,269,1,0,0,0,89,90,5,61,
+        0,0,90,2,1,0,0,0,91,92,5,115,0,0,92,93,5,119,0,0,93,94,5,105,0,0,
+        94,95,5,116,0,0,95,96,5,99,0,0,96,97,5,104,0,0,97,4,1,0,0,0,98,99,
+        5,99,0,0,99,100,5,97,0,0,100,101,5,115,0,0,101,102,5,101,0,0,102,
+        6,1,0,0,0,103,104,5,58,0,0,104,8,1,0,0,0,105,106,5,100,0,0,106,107,
+        5,101,0,0,107,108,5,102,0,0,108,109,5,97,0,0,109,110,5,117,0,0,110,
+        111,5,108,0,0,111,112,5,116,0,0,112,10,1,0,0,0,113,114,5,38,0,0,
+        114,12,1,0,0,0,115,116,5,43,0,0,116,14,1,0,0,0,117,118,5,45,0,0,
+        118,16,1,0,0,0,119,120,5,33,0,0,120,18,1,0,0,0,121,122,5,42,0,0,
+        122,20,1,0,0,0,123,124,5,47,0,0,124,22,1,0,0,0,125,126,5,37,0,0,
+        126,24,1,0,0,0,127,128,5,60,0,0,128,26,1,0,0,0,129,130,5,60,0,0,
+        130,131,5,61,0,0,131,28,1,0,0,0,132,133,5,62,0,0,133,30,1,0,0,0,
+        134,135,5,62,0,0,135,136,5,61,0,0,136,32,1,0,0,0,137,138,5,61,0,
+        0,138,139,5,61,0,0,139,34,1,0,0,0,140,141,5,33,0,0,141,142,5,61,
+        0,0,142,36,1,0,0,0,143,144,5,38,0,0,144,145,5,38,0,0,145,38,1,0,
+        0,0,146,147,5,124,0,0,147,148,5,124,0,0,148,40,1,0,0,0,149,150,5,
+        116,0,0,150,151,5,114,0,0,151,152,5,117,0,0,152,159,5,101,0,0,153,
+        154,5,102,0,0,154,155,5,97,0,0,155,156,5,108,0,0,156,157,5,115,0,
+        0,157,159,5,101,0,0,158,149,1,0,0,0,158,153,1,0,0,0,159,42,1,0,0,
+        0,160,161,5,39,0,0,161,162,9,0,0,0,162,163,5,39,0,0,163,44,1,0,0,
+        0,164,170,5,34,0,0,165,169,8,0,0,0,166,167,5,92,0,0,167,169,9,0,
+        0,0,168,165,1,0,0,0,168,166,1,0,0,0,169,172,1,0,0,0,170,168,1,0,
+        0,0,170,171,1,0,0,0,171,173,1,0,0,0,172,170,1,0,0,0,173,174,5,34,
+        0,0,174,46,1,0,0,0,175,176,5,105,0,0,176,177,5,110,0,0,177,178,5,
+        116,0,0,178,48,1,0,0,0,179,180,5,99,0,0,180,181,5,104,0,0,181,182,
+        5,97,0,0,182,183,5,114,0,0,183,50,1,0,0,0,184,185,5,98,0,0,185,186,
+        5,111,0,0,186,187,5,111,0,0,187,188,5,108,0,0,188,52,1,0,0,0,189,
+        190,5,112,0,0,190,191,5,114,0,0,191,192,5,105,0,0,192,193,5,110,
+        0,0,193,194,5,116,0,0,194,195,5,102,0,0,195,54,1,0,0,0,196,197,5,
+        115,0,0,197,198,5,99,0,0,198,199,5,97,0,0,199,200,5,110,0,0,200,
+        201,5,102,0,0,201,56,1,0,0,0,202,203,5,119,0,0,203,204,5,104,0,0,
+        204,205,5,105,0,0,205,206,5,108,0,0,206,207,5,101,0,0,207,58,1,0,
+        0,0,208,209,5,102,0,0,209,210,5,111,0,0,210,211,5,114,0,0,211,60,
+        1,0,0,0,212,213,5,105,0,0,213,214,5,102,0,0,214,62,1,0,0,0,215,216,
+        5,101,0,0,216,217,5,108,0,0,217,218,5,115,0,0,218,219,5,101,0,0,
+        219,64,1,0,0,0,220,221,5,114,0,0,221,222,5,101,0,0,222,223,5,116,
+        0,0,223,224,5,117,0,0,224,225,5,114,0,0,225,226,5,110,0,0,226,66,
+        1,0,0,0,227,228,5,40,0,0,228,68,1,0,0,0,229,230,5,41,0,0,230,70,
+        1,0,0,0,231,232,5,123,0,0,232,72,1,0,0,0,233,234,5,125,0,0,234,74,
+        1,0,0,0,235,236,5,59,0,0,236,76,1,0,0,0,237,238,5,44,0,0,238,78,
+        1,0,0,0,239,241,7,1,0,0,240,239,1,0,0,0,241,242,1,0,0,0,242,240,
+        1,0,0,0,242,243,1,0,0,0,243,80,1,0,0,0,244,248,7,2,0,0,245,247,7,
+        3,0,0,246,245,1,0,0,0,247,250,1,0,0,0,248,246,1,0,0,0,248,249,1,
+        0,0,0,249,82,1,0,0,0,250,248,1,0,0,0,251,253,7,4,0,0,252,251,1,0,
+        0,0,253,254,1,0,0,0,254,252,1,0,0,0,254,255,1,0,0,0,255,256,1,0,
+        0,0,256,257,6,41,0,0,257,84,1,0,0,0,258,259,5,47,0,0,259,260,5,47,
+        0,0,260,264,1,0,0,0,261,263,8,5,0,0,262,261,1,0,0,0,263,266,1,0,
+        0,0,264,262,1,0,0,0,264,265,1,0,0,0,265,267,1,0,0,0,266,264,1,0,
+        0,0,267,268,6,42,0,0,268,86,1,0,0,0,269,270,5,47,0,0,270,271,5,42,
+        0,0,271,275,1,0,0,0,272,274,9,0,0,0,273,272,1,0,0,0,274,277,1,0,
+        0,0,275,276,1,0,0,0,275,273,1,0,0,0,276,278,1,0,0,0,277,275,1,0,
+        0,0,278,279,5,42,0,0,279,280,5,47,0,0,280,281,1,0,0,0,281,282,6,
+        43,0,0,282,88,1,0,0,0,9,0,158,168,170,242,248,254,264,275,1,6,0,
+        0
     ]
 
 class ObfuMiniCLexer(Lexer):
@@ -121,56 +134,59 @@ class ObfuMiniCLexer(Lexer):
     T__13 = 14
     T__14 = 15
     T__15 = 16
-    BOOL = 17
-    CHAR = 18
-    STRING = 19
-    INT = 20
-    CHAR_TOK = 21
-    BOOL_TOK = 22
-    PRINTF = 23
-    SCANF = 24
-    WHILE = 25
-    FOR = 26
-    IF = 27
-    ELSE = 28
-    RETURN = 29
-    LPAREN = 30
-    RPAREN = 31
-    LBRACE = 32
-    RBRACE = 33
-    SEMI = 34
-    COMMA = 35
-    NUMBER = 36
-    ID = 37
-    WS = 38
-    LINE_COMMENT = 39
-    INCR = 40
-    DECR = 41
+    T__16 = 17
+    T__17 = 18
+    T__18 = 19
+    T__19 = 20
+    BOOL = 21
+    CHAR = 22
+    STRING = 23
+    INT = 24
+    CHAR_TOK = 25
+    BOOL_TOK = 26
+    PRINTF = 27
+    SCANF = 28
+    WHILE = 29
+    FOR = 30
+    IF = 31
+    ELSE = 32
+    RETURN = 33
+    LPAREN = 34
+    RPAREN = 35
+    LBRACE = 36
+    RBRACE = 37
+    SEMI = 38
+    COMMA = 39
+    NUMBER = 40
+    ID = 41
+    WS = 42
+    LINE_COMMENT = 43
+    BLOCK_COMMENT = 44
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
     modeNames = [ "DEFAULT_MODE" ]
 
     literalNames = [ "<INVALID>",
-            "'='", "'&'", "'||'", "'&&'", "'=='", "'!='", "'<'", "'<='", 
-            "'>'", "'>='", "'+'", "'-'", "'*'", "'/'", "'%'", "'!'", "'int'", 
-            "'char'", "'bool'", "'printf'", "'scanf'", "'while'", "'for'", 
-            "'if'", "'else'", "'return'", "'('", "')'", "'{'", "'}'", "';'", 
-            "','", "'++'", "'--'" ]
+            "'='", "'switch'", "'case'", "':'", "'default'", "'&'", "'+'", 
+            "'-'", "'!'", "'*'", "'/'", "'%'", "'<'", "'<='", "'>'", "'>='", 
+            "'=='", "'!='", "'&&'", "'||'", "'int'", "'char'", "'bool'", 
+            "'printf'", "'scanf'", "'while'", "'for'", "'if'", "'else'", 
+            "'return'", "'('", "')'", "'{'", "'}'", "';'", "','" ]
 
     symbolicNames = [ "<INVALID>",
             "BOOL", "CHAR", "STRING", "INT", "CHAR_TOK", "BOOL_TOK", "PRINTF", 
             "SCANF", "WHILE", "FOR", "IF", "ELSE", "RETURN", "LPAREN", "RPAREN", 
             "LBRACE", "RBRACE", "SEMI", "COMMA", "NUMBER", "ID", "WS", "LINE_COMMENT", 
-            "INCR", "DECR" ]
+            "BLOCK_COMMENT" ]
 
     ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
                   "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
-                  "T__14", "T__15", "BOOL", "CHAR", "STRING", "INT", "CHAR_TOK", 
-                  "BOOL_TOK", "PRINTF", "SCANF", "WHILE", "FOR", "IF", "ELSE", 
-                  "RETURN", "LPAREN", "RPAREN", "LBRACE", "RBRACE", "SEMI", 
-                  "COMMA", "NUMBER", "ID", "WS", "LINE_COMMENT", "INCR", 
-                  "DECR" ]
+                  "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
+                  "BOOL", "CHAR", "STRING", "INT", "CHAR_TOK", "BOOL_TOK", 
+                  "PRINTF", "SCANF", "WHILE", "FOR", "IF", "ELSE", "RETURN", 
+                  "LPAREN", "RPAREN", "LBRACE", "RBRACE", "SEMI", "COMMA", 
+                  "NUMBER", "ID", "WS", "LINE_COMMENT", "BLOCK_COMMENT" ]
 
     grammarFileName = "ObfuMiniC.g4"
 
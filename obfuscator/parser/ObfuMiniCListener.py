@@ -98,6 +98,51 @@ class ObfuMiniCListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by ObfuMiniCParser#switchStmt.
+    def enterSwitchStmt(self, ctx:ObfuMiniCParser.SwitchStmtContext):
+        pass
+
+    # Exit a parse tree produced by ObfuMiniCParser#switchStmt.
+    def exitSwitchStmt(self, ctx:ObfuMiniCParser.SwitchStmtContext):
+        pass
+
+
+    # Enter a parse tree produced by ObfuMiniCParser#switchBlock.
+    def enterSwitchBlock(self, ctx:ObfuMiniCParser.SwitchBlockContext):
+        pass
+
+    # Exit a parse tree produced by ObfuMiniCParser#switchBlock.
+    def exitSwitchBlock(self, ctx:ObfuMiniCParser.SwitchBlockContext):
+        pass
+
+
+    # Enter a parse tree produced by ObfuMiniCParser#caseBlock.
+    def enterCaseBlock(self, ctx:ObfuMiniCParser.CaseBlockContext):
+        pass
+
+    # Exit a parse tree produced by ObfuMiniCParser#caseBlock.
+    def exitCaseBlock(self, ctx:ObfuMiniCParser.CaseBlockContext):
+        pass
+
+
+    # Enter a parse tree produced by ObfuMiniCParser#defaultBlock.
+    def enterDefaultBlock(self, ctx:ObfuMiniCParser.DefaultBlockContext):
+        pass
+
+    # Exit a parse tree produced by ObfuMiniCParser#defaultBlock.
+    def exitDefaultBlock(self, ctx:ObfuMiniCParser.DefaultBlockContext):
+        pass
+
+
+    # Enter a parse tree produced by ObfuMiniCParser#literal.
+    def enterLiteral(self, ctx:ObfuMiniCParser.LiteralContext):
+        pass
+
+    # Exit a parse tree produced by ObfuMiniCParser#literal.
+    def exitLiteral(self, ctx:ObfuMiniCParser.LiteralContext):
+        pass
+
+
     # Enter a parse tree produced by ObfuMiniCParser#exprStmt.
     def enterExprStmt(self, ctx:ObfuMiniCParser.ExprStmtContext):
         pass
@@ -143,93 +188,66 @@ class ObfuMiniCListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by ObfuMiniCParser#expr.
-    def enterExpr(self, ctx:ObfuMiniCParser.ExprContext):
-        pass
-
-    # Exit a parse tree produced by ObfuMiniCParser#expr.
-    def exitExpr(self, ctx:ObfuMiniCParser.ExprContext):
-        pass
-
-
-    # Enter a parse tree produced by ObfuMiniCParser#assignExpr.
-    def enterAssignExpr(self, ctx:ObfuMiniCParser.AssignExprContext):
-        pass
-
-    # Exit a parse tree produced by ObfuMiniCParser#assignExpr.
-    def exitAssignExpr(self, ctx:ObfuMiniCParser.AssignExprContext):
-        pass
-
-
-    # Enter a parse tree produced by ObfuMiniCParser#logicOrExpr.
-    def enterLogicOrExpr(self, ctx:ObfuMiniCParser.LogicOrExprContext):
-        pass
-
-    # Exit a parse tree produced by ObfuMiniCParser#logicOrExpr.
-    def exitLogicOrExpr(self, ctx:ObfuMiniCParser.LogicOrExprContext):
-        pass
-
-
-    # Enter a parse tree produced by ObfuMiniCParser#logicAndExpr.
-    def enterLogicAndExpr(self, ctx:ObfuMiniCParser.LogicAndExprContext):
+    # Enter a parse tree produced by ObfuMiniCParser#varExpr.
+    def enterVarExpr(self, ctx:ObfuMiniCParser.VarExprContext):
         pass
 
-    # Exit a parse tree produced by ObfuMiniCParser#logicAndExpr.
-    def exitLogicAndExpr(self, ctx:ObfuMiniCParser.LogicAndExprContext):
+    # Exit a parse tree produced by ObfuMiniCParser#varExpr.
+    def exitVarExpr(self, ctx:ObfuMiniCParser.VarExprContext):
         pass
 
 
-    # Enter a parse tree produced by ObfuMiniCParser#equalityExpr.
-    def enterEqualityExpr(self, ctx:ObfuMiniCParser.EqualityExprContext):
+    # Enter a parse tree produced by ObfuMiniCParser#unaryExpr.
+    def enterUnaryExpr(self, ctx:ObfuMiniCParser.UnaryExprContext):
         pass
 
-    # Exit a parse tree produced by ObfuMiniCParser#equalityExpr.
-    def exitEqualityExpr(self, ctx:ObfuMiniCParser.EqualityExprContext):
+    # Exit a parse tree produced by ObfuMiniCParser#unaryExpr.
+    def exitUnaryExpr(self, ctx:ObfuMiniCParser.UnaryExprContext):
         pass
 
 
-    # Enter a parse tree produced by ObfuMiniCParser#relationalExpr.
-    def enterRelationalExpr(self, ctx:ObfuMiniCParser.RelationalExprContext):
+    # Enter a parse tree produced by ObfuMiniCParser#literalExpr.
+    def enterLiteralExpr(self, ctx:ObfuMiniCParser.LiteralExprContext):
         pass
 
-    # Exit a parse tree produced by ObfuMiniCParser#relationalExpr.
-    def exitRelationalExpr(self, ctx:ObfuMiniCParser.RelationalExprContext):
+    # Exit a parse tree produced by ObfuMiniCParser#literalExpr.
+    def exitLiteralExpr(self, ctx:ObfuMiniCParser.LiteralExprContext):
         pass
 
 
-    # Enter a parse tree produced by ObfuMiniCParser#addExpr.
-    def enterAddExpr(self, ctx:ObfuMiniCParser.AddExprContext):
+    # Enter a parse tree produced by ObfuMiniCParser#binaryExpr.
+    def enterBinaryExpr(self, ctx:ObfuMiniCParser.BinaryExprContext):
         pass
 
-    # Exit a parse tree produced by ObfuMiniCParser#addExpr.
-    def exitAddExpr(self, ctx:ObfuMiniCParser.AddExprContext):
+    # Exit a parse tree produced by ObfuMiniCParser#binaryExpr.
+    def exitBinaryExpr(self, ctx:ObfuMiniCParser.BinaryExprContext):
         pass
 
 
-    # Enter a parse tree produced by ObfuMiniCParser#mulExpr.
-    def enterMulExpr(self, ctx:ObfuMiniCParser.MulExprContext):
+    # Enter a parse tree produced by ObfuMiniCParser#callExpr.
+    def enterCallExpr(self, ctx:ObfuMiniCParser.CallExprContext):
         pass
 
-    # Exit a parse tree produced by ObfuMiniCParser#mulExpr.
-    def exitMulExpr(self, ctx:ObfuMiniCParser.MulExprContext):
+    # Exit a parse tree produced by ObfuMiniCParser#callExpr.
+    def exitCallExpr(self, ctx:ObfuMiniCParser.CallExprContext):
         pass
 
 
-    # Enter a parse tree produced by ObfuMiniCParser#unaryExpr.
-    def enterUnaryExpr(self, ctx:ObfuMiniCParser.UnaryExprContext):
+    # Enter a parse tree produced by ObfuMiniCParser#assignExpr.
+    def enterAssignExpr(self, ctx:ObfuMiniCParser.AssignExprContext):
         pass
 
-    # Exit a parse tree produced by ObfuMiniCParser#unaryExpr.
-    def exitUnaryExpr(self, ctx:ObfuMiniCParser.UnaryExprContext):
+    # Exit a parse tree produced by ObfuMiniCParser#assignExpr.
+    def exitAssignExpr(self, ctx:ObfuMiniCParser.AssignExprContext):
         pass
 
 
-    # Enter a parse tree produced by ObfuMiniCParser#primaryExpr.
-    def enterPrimaryExpr(self, ctx:ObfuMiniCParser.PrimaryExprContext):
+    # Enter a parse tree produced by ObfuMiniCParser#parenExpr.
+    def enterParenExpr(self, ctx:ObfuMiniCParser.ParenExprContext):
         pass
 
-    # Exit a parse tree produced by ObfuMiniCParser#primaryExpr.
-    def exitPrimaryExpr(self, ctx:ObfuMiniCParser.PrimaryExprContext):
+    # Exit a parse tree produced by ObfuMiniCParser#parenExpr.
+    def exitParenExpr(self, ctx:ObfuMiniCParser.ParenExprContext):
         pass
 
 
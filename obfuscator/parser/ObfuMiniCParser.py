@@ -10,106 +10,104 @@ else:
 
 def serializedATN():
     return [
-        4,1,41,280,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,44,271,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
         2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
-        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,1,0,1,0,5,
-        0,55,8,0,10,0,12,0,58,9,0,1,0,1,0,1,1,1,1,1,1,1,1,3,1,66,8,1,1,1,
-        1,1,1,1,1,2,1,2,1,2,5,2,74,8,2,10,2,12,2,77,9,2,1,3,1,3,1,3,1,4,
-        1,4,1,4,1,4,1,5,1,5,1,5,5,5,89,8,5,10,5,12,5,92,9,5,1,6,1,6,1,6,
-        3,6,97,8,6,1,7,1,7,1,8,1,8,1,8,5,8,104,8,8,10,8,12,8,107,9,8,1,8,
-        1,8,1,9,1,9,1,9,1,9,1,9,1,9,3,9,117,8,9,1,10,3,10,120,8,10,1,10,
-        1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,11,3,11,131,8,11,1,12,1,12,
-        1,12,1,12,1,12,1,12,1,12,1,12,1,12,3,12,142,8,12,1,12,1,12,3,12,
-        146,8,12,1,12,1,12,3,12,150,8,12,1,12,1,12,3,12,154,8,12,1,13,1,
-        13,3,13,158,8,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,5,14,167,8,14,
-        10,14,12,14,170,9,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,179,
-        8,14,1,14,5,14,182,8,14,10,14,12,14,185,9,14,1,14,1,14,3,14,189,
-        8,14,1,15,1,15,1,16,1,16,1,16,3,16,196,8,16,1,17,1,17,1,17,5,17,
-        201,8,17,10,17,12,17,204,9,17,1,18,1,18,1,18,5,18,209,8,18,10,18,
-        12,18,212,9,18,1,19,1,19,1,19,5,19,217,8,19,10,19,12,19,220,9,19,
-        1,20,1,20,1,20,5,20,225,8,20,10,20,12,20,228,9,20,1,21,1,21,1,21,
-        5,21,233,8,21,10,21,12,21,236,9,21,1,22,1,22,1,22,5,22,241,8,22,
-        10,22,12,22,244,9,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,3,23,253,
-        8,23,1,24,1,24,1,24,3,24,258,8,24,1,24,1,24,1,24,1,24,1,24,1,24,
-        1,24,1,24,1,24,1,24,3,24,270,8,24,1,25,1,25,1,25,5,25,275,8,25,10,
-        25,12,25,278,9,25,1,25,0,0,26,0,2,4,6,8,10,12,14,16,18,20,22,24,
-        26,28,30,32,34,36,38,40,42,44,46,48,50,0,7,1,0,20,22,1,0,5,6,1,0,
-        7,10,1,0,11,12,1,0,13,15,2,0,11,12,16,16,1,0,40,41,295,0,56,1,0,
-        0,0,2,61,1,0,0,0,4,70,1,0,0,0,6,78,1,0,0,0,8,81,1,0,0,0,10,85,1,
-        0,0,0,12,93,1,0,0,0,14,98,1,0,0,0,16,100,1,0,0,0,18,116,1,0,0,0,
-        20,119,1,0,0,0,22,123,1,0,0,0,24,153,1,0,0,0,26,155,1,0,0,0,28,188,
-        1,0,0,0,30,190,1,0,0,0,32,192,1,0,0,0,34,197,1,0,0,0,36,205,1,0,
-        0,0,38,213,1,0,0,0,40,221,1,0,0,0,42,229,1,0,0,0,44,237,1,0,0,0,
-        46,252,1,0,0,0,48,269,1,0,0,0,50,271,1,0,0,0,52,55,3,2,1,0,53,55,
-        3,8,4,0,54,52,1,0,0,0,54,53,1,0,0,0,55,58,1,0,0,0,56,54,1,0,0,0,
-        56,57,1,0,0,0,57,59,1,0,0,0,58,56,1,0,0,0,59,60,5,0,0,1,60,1,1,0,
-        0,0,61,62,3,14,7,0,62,63,5,37,0,0,63,65,5,30,0,0,64,66,3,4,2,0,65,
-        64,1,0,0,0,65,66,1,0,0,0,66,67,1,0,0,0,67,68,5,31,0,0,68,69,3,16,
-        8,0,69,3,1,0,0,0,70,75,3,6,3,0,71,72,5,35,0,0,72,74,3,6,3,0,73,71,
-        1,0,0,0,74,77,1,0,0,0,75,73,1,0,0,0,75,76,1,0,0,0,76,5,1,0,0,0,77,
-        75,1,0,0,0,78,79,3,14,7,0,79,80,5,37,0,0,80,7,1,0,0,0,81,82,3,14,
-        7,0,82,83,3,10,5,0,83,84,5,34,0,0,84,9,1,0,0,0,85,90,3,12,6,0,86,
-        87,5,35,0,0,87,89,3,12,6,0,88,86,1,0,0,0,89,92,1,0,0,0,90,88,1,0,
-        0,0,90,91,1,0,0,0,91,11,1,0,0,0,92,90,1,0,0,0,93,96,5,37,0,0,94,
-        95,5,1,0,0,95,97,3,30,15,0,96,94,1,0,0,0,96,97,1,0,0,0,97,13,1,0,
-        0,0,98,99,7,0,0,0,99,15,1,0,0,0,100,105,5,32,0,0,101,104,3,8,4,0,
-        102,104,3,18,9,0,103,101,1,0,0,0,103,102,1,0,0,0,104,107,1,0,0,0,
-        105,103,1,0,0,0,105,106,1,0,0,0,106,108,1,0,0,0,107,105,1,0,0,0,
-        108,109,5,33,0,0,109,17,1,0,0,0,110,117,3,20,10,0,111,117,3,16,8,
-        0,112,117,3,22,11,0,113,117,3,24,12,0,114,117,3,26,13,0,115,117,
-        3,28,14,0,116,110,1,0,0,0,116,111,1,0,0,0,116,112,1,0,0,0,116,113,
-        1,0,0,0,116,114,1,0,0,0,116,115,1,0,0,0,117,19,1,0,0,0,118,120,3,
-        30,15,0,119,118,1,0,0,0,119,120,1,0,0,0,120,121,1,0,0,0,121,122,
-        5,34,0,0,122,21,1,0,0,0,123,124,5,27,0,0,124,125,5,30,0,0,125,126,
-        3,30,15,0,126,127,5,31,0,0,127,130,3,18,9,0,128,129,5,28,0,0,129,
-        131,3,18,9,0,130,128,1,0,0,0,130,131,1,0,0,0,131,23,1,0,0,0,132,
-        133,5,25,0,0,133,134,5,30,0,0,134,135,3,30,15,0,135,136,5,31,0,0,
-        136,137,3,18,9,0,137,154,1,0,0,0,138,139,5,26,0,0,139,141,5,30,0,
-        0,140,142,3,30,15,0,141,140,1,0,0,0,141,142,1,0,0,0,142,143,1,0,
-        0,0,143,145,5,34,0,0,144,146,3,30,15,0,145,144,1,0,0,0,145,146,1,
-        0,0,0,146,147,1,0,0,0,147,149,5,34,0,0,148,150,3,30,15,0,149,148,
-        1,0,0,0,149,150,1,0,0,0,150,151,1,0,0,0,151,152,5,31,0,0,152,154,
-        3,18,9,0,153,132,1,0,0,0,153,138,1,0,0,0,154,25,1,0,0,0,155,157,
-        5,29,0,0,156,158,3,30,15,0,157,156,1,0,0,0,157,158,1,0,0,0,158,159,
-        1,0,0,0,159,160,5,34,0,0,160,27,1,0,0,0,161,162,5,23,0,0,162,163,
-        5,30,0,0,163,168,5,19,0,0,164,165,5,35,0,0,165,167,3,30,15,0,166,
-        164,1,0,0,0,167,170,1,0,0,0,168,166,1,0,0,0,168,169,1,0,0,0,169,
-        171,1,0,0,0,170,168,1,0,0,0,171,172,5,31,0,0,172,189,5,34,0,0,173,
-        174,5,24,0,0,174,175,5,30,0,0,175,183,5,19,0,0,176,178,5,35,0,0,
-        177,179,5,2,0,0,178,177,1,0,0,0,178,179,1,0,0,0,179,180,1,0,0,0,
-        180,182,5,37,0,0,181,176,1,0,0,0,182,185,1,0,0,0,183,181,1,0,0,0,
-        183,184,1,0,0,0,184,186,1,0,0,0,185,183,1,0,0,0,186,187,5,31,0,0,
-        187,189,5,34,0,0,188,161,1,0,0,0,188,173,1,0,0,0,189,29,1,0,0,0,
-        190,191,3,32,16,0,191,31,1,0,0,0,192,195,3,34,17,0,193,194,5,1,0,
-        0,194,196,3,32,16,0,195,193,1,0,0,0,195,196,1,0,0,0,196,33,1,0,0,
-        0,197,202,3,36,18,0,198,199,5,3,0,0,199,201,3,36,18,0,200,198,1,
-        0,0,0,201,204,1,0,0,0,202,200,1,0,0,0,202,203,1,0,0,0,203,35,1,0,
-        0,0,204,202,1,0,0,0,205,210,3,38,19,0,206,207,5,4,0,0,207,209,3,
-        38,19,0,208,206,1,0,0,0,209,212,1,0,0,0,210,208,1,0,0,0,210,211,
-        1,0,0,0,211,37,1,0,0,0,212,210,1,0,0,0,213,218,3,40,20,0,214,215,
-        7,1,0,0,215,217,3,40,20,0,216,214,1,0,0,0,217,220,1,0,0,0,218,216,
-        1,0,0,0,218,219,1,0,0,0,219,39,1,0,0,0,220,218,1,0,0,0,221,226,3,
-        42,21,0,222,223,7,2,0,0,223,225,3,42,21,0,224,222,1,0,0,0,225,228,
-        1,0,0,0,226,224,1,0,0,0,226,227,1,0,0,0,227,41,1,0,0,0,228,226,1,
-        0,0,0,229,234,3,44,22,0,230,231,7,3,0,0,231,233,3,44,22,0,232,230,
-        1,0,0,0,233,236,1,0,0,0,234,232,1,0,0,0,234,235,1,0,0,0,235,43,1,
-        0,0,0,236,234,1,0,0,0,237,242,3,46,23,0,238,239,7,4,0,0,239,241,
-        3,46,23,0,240,238,1,0,0,0,241,244,1,0,0,0,242,240,1,0,0,0,242,243,
-        1,0,0,0,243,45,1,0,0,0,244,242,1,0,0,0,245,246,7,5,0,0,246,253,3,
-        46,23,0,247,253,3,48,24,0,248,249,5,37,0,0,249,253,7,6,0,0,250,251,
-        7,6,0,0,251,253,5,37,0,0,252,245,1,0,0,0,252,247,1,0,0,0,252,248,
-        1,0,0,0,252,250,1,0,0,0,253,47,1,0,0,0,254,255,5,37,0,0,255,257,
-        5,30,0,0,256,258,3,50,25,0,257,256,1,0,0,0,257,258,1,0,0,0,258,259,
-        1,0,0,0,259,270,5,31,0,0,260,270,5,37,0,0,261,270,5,36,0,0,262,270,
-        5,18,0,0,263,270,5,17,0,0,264,270,5,19,0,0,265,266,5,30,0,0,266,
-        267,3,30,15,0,267,268,5,31,0,0,268,270,1,0,0,0,269,254,1,0,0,0,269,
-        260,1,0,0,0,269,261,1,0,0,0,269,262,1,0,0,0,269,263,1,0,0,0,269,
-        264,1,0,0,0,269,265,1,0,0,0,270,49,1,0,0,0,271,276,3,30,15,0,272,
-        273,5,35,0,0,273,275,3,30,15,0,274,272,1,0,0,0,275,278,1,0,0,0,276,
-        274,1,0,0,0,276,277,1,0,0,0,277,51,1,0,0,0,278,276,1,0,0,0,31,54,
-        56,65,75,90,96,103,105,116,119,130,141,145,149,153,157,168,178,183,
-        188,195,202,210,218,226,234,242,252,257,269,276
+        7,20,2,21,7,21,1,0,1,0,5,0,47,8,0,10,0,12,0,50,9,0,1,0,1,0,1,1,1,
+        1,1,1,1,1,3,1,58,8,1,1,1,1,1,1,1,1,2,1,2,1,2,5,2,66,8,2,10,2,12,
+        2,69,9,2,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,5,1,5,1,5,5,5,81,8,5,10,5,
+        12,5,84,9,5,1,6,1,6,1,6,3,6,89,8,6,1,7,1,7,1,8,1,8,1,8,5,8,96,8,
+        8,10,8,12,8,99,9,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,3,9,110,8,
+        9,1,10,1,10,1,10,1,10,1,10,1,10,5,10,118,8,10,10,10,12,10,121,9,
+        10,1,10,1,10,1,11,1,11,3,11,127,8,11,1,12,1,12,1,12,1,12,5,12,133,
+        8,12,10,12,12,12,136,9,12,1,13,1,13,1,13,5,13,141,8,13,10,13,12,
+        13,144,9,13,1,14,1,14,1,15,3,15,149,8,15,1,15,1,15,1,16,1,16,1,16,
+        1,16,1,16,1,16,1,16,3,16,160,8,16,1,17,1,17,1,17,1,17,1,17,1,17,
+        1,17,1,17,1,17,3,17,171,8,17,1,17,1,17,3,17,175,8,17,1,17,1,17,3,
+        17,179,8,17,1,17,1,17,3,17,183,8,17,1,18,1,18,3,18,187,8,18,1,18,
+        1,18,1,19,1,19,1,19,1,19,1,19,5,19,196,8,19,10,19,12,19,199,9,19,
+        1,19,1,19,1,19,1,19,1,19,1,19,1,19,3,19,208,8,19,1,19,5,19,211,8,
+        19,10,19,12,19,214,9,19,1,19,1,19,3,19,218,8,19,1,20,1,20,1,20,1,
+        20,3,20,224,8,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,3,
+        20,235,8,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,
+        20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,5,20,258,8,
+        20,10,20,12,20,261,9,20,1,21,1,21,1,21,5,21,266,8,21,10,21,12,21,
+        269,9,21,1,21,0,1,40,22,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,
+        30,32,34,36,38,40,42,0,8,1,0,24,26,2,0,21,22,40,40,2,0,21,23,40,
+        40,1,0,7,9,1,0,10,12,1,0,7,8,1,0,13,16,1,0,17,18,290,0,48,1,0,0,
+        0,2,53,1,0,0,0,4,62,1,0,0,0,6,70,1,0,0,0,8,73,1,0,0,0,10,77,1,0,
+        0,0,12,85,1,0,0,0,14,90,1,0,0,0,16,92,1,0,0,0,18,109,1,0,0,0,20,
+        111,1,0,0,0,22,126,1,0,0,0,24,128,1,0,0,0,26,137,1,0,0,0,28,145,
+        1,0,0,0,30,148,1,0,0,0,32,152,1,0,0,0,34,182,1,0,0,0,36,184,1,0,
+        0,0,38,217,1,0,0,0,40,234,1,0,0,0,42,262,1,0,0,0,44,47,3,2,1,0,45,
+        47,3,8,4,0,46,44,1,0,0,0,46,45,1,0,0,0,47,50,1,0,0,0,48,46,1,0,0,
+        0,48,49,1,0,0,0,49,51,1,0,0,0,50,48,1,0,0,0,51,52,5,0,0,1,52,1,1,
+        0,0,0,53,54,3,14,7,0,54,55,5,41,0,0,55,57,5,34,0,0,56,58,3,4,2,0,
+        57,56,1,0,0,0,57,58,1,0,0,0,58,59,1,0,0,0,59,60,5,35,0,0,60,61,3,
+        16,8,0,61,3,1,0,0,0,62,67,3,6,3,0,63,64,5,39,0,0,64,66,3,6,3,0,65,
+        63,1,0,0,0,66,69,1,0,0,0,67,65,1,0,0,0,67,68,1,0,0,0,68,5,1,0,0,
+        0,69,67,1,0,0,0,70,71,3,14,7,0,71,72,5,41,0,0,72,7,1,0,0,0,73,74,
+        3,14,7,0,74,75,3,10,5,0,75,76,5,38,0,0,76,9,1,0,0,0,77,82,3,12,6,
+        0,78,79,5,39,0,0,79,81,3,12,6,0,80,78,1,0,0,0,81,84,1,0,0,0,82,80,
+        1,0,0,0,82,83,1,0,0,0,83,11,1,0,0,0,84,82,1,0,0,0,85,88,5,41,0,0,
+        86,87,5,1,0,0,87,89,3,40,20,0,88,86,1,0,0,0,88,89,1,0,0,0,89,13,
+        1,0,0,0,90,91,7,0,0,0,91,15,1,0,0,0,92,97,5,36,0,0,93,96,3,8,4,0,
+        94,96,3,18,9,0,95,93,1,0,0,0,95,94,1,0,0,0,96,99,1,0,0,0,97,95,1,
+        0,0,0,97,98,1,0,0,0,98,100,1,0,0,0,99,97,1,0,0,0,100,101,5,37,0,
+        0,101,17,1,0,0,0,102,110,3,30,15,0,103,110,3,16,8,0,104,110,3,32,
+        16,0,105,110,3,34,17,0,106,110,3,36,18,0,107,110,3,38,19,0,108,110,
+        3,20,10,0,109,102,1,0,0,0,109,103,1,0,0,0,109,104,1,0,0,0,109,105,
+        1,0,0,0,109,106,1,0,0,0,109,107,1,0,0,0,109,108,1,0,0,0,110,19,1,
+        0,0,0,111,112,5,2,0,0,112,113,5,34,0,0,113,114,3,40,20,0,114,115,
+        5,35,0,0,115,119,5,36,0,0,116,118,3,22,11,0,117,116,1,0,0,0,118,
+        121,1,0,0,0,119,117,1,0,0,0,119,120,1,0,0,0,120,122,1,0,0,0,121,
+        119,1,0,0,0,122,123,5,37,0,0,123,21,1,0,0,0,124,127,3,24,12,0,125,
+        127,3,26,13,0,126,124,1,0,0,0,126,125,1,0,0,0,127,23,1,0,0,0,128,
+        129,5,3,0,0,129,130,3,28,14,0,130,134,5,4,0,0,131,133,3,18,9,0,132,
+        131,1,0,0,0,133,136,1,0,0,0,134,132,1,0,0,0,134,135,1,0,0,0,135,
+        25,1,0,0,0,136,134,1,0,0,0,137,138,5,5,0,0,138,142,5,4,0,0,139,141,
+        3,18,9,0,140,139,1,0,0,0,141,144,1,0,0,0,142,140,1,0,0,0,142,143,
+        1,0,0,0,143,27,1,0,0,0,144,142,1,0,0,0,145,146,7,1,0,0,146,29,1,
+        0,0,0,147,149,3,40,20,0,148,147,1,0,0,0,148,149,1,0,0,0,149,150,
+        1,0,0,0,150,151,5,38,0,0,151,31,1,0,0,0,152,153,5,31,0,0,153,154,
+        5,34,0,0,154,155,3,40,20,0,155,156,5,35,0,0,156,159,3,18,9,0,157,
+        158,5,32,0,0,158,160,3,18,9,0,159,157,1,0,0,0,159,160,1,0,0,0,160,
+        33,1,0,0,0,161,162,5,29,0,0,162,163,5,34,0,0,163,164,3,40,20,0,164,
+        165,5,35,0,0,165,166,3,18,9,0,166,183,1,0,0,0,167,168,5,30,0,0,168,
+        170,5,34,0,0,169,171,3,40,20,0,170,169,1,0,0,0,170,171,1,0,0,0,171,
+        172,1,0,0,0,172,174,5,38,0,0,173,175,3,40,20,0,174,173,1,0,0,0,174,
+        175,1,0,0,0,175,176,1,0,0,0,176,178,5,38,0,0,177,179,3,40,20,0,178,
+        177,1,0,0,0,178,179,1,0,0,0,179,180,1,0,0,0,180,181,5,35,0,0,181,
+        183,3,18,9,0,182,161,1,0,0,0,182,167,1,0,0,0,183,35,1,0,0,0,184,
+        186,5,33,0,0,185,187,3,40,20,0,186,185,1,0,0,0,186,187,1,0,0,0,187,
+        188,1,0,0,0,188,189,5,38,0,0,189,37,1,0,0,0,190,191,5,27,0,0,191,
+        192,5,34,0,0,192,197,5,23,0,0,193,194,5,39,0,0,194,196,3,40,20,0,
+        195,193,1,0,0,0,196,199,1,0,0,0,197,195,1,0,0,0,197,198,1,0,0,0,
+        198,200,1,0,0,0,199,197,1,0,0,0,200,201,5,35,0,0,201,218,5,38,0,
+        0,202,203,5,28,0,0,203,204,5,34,0,0,204,212,5,23,0,0,205,207,5,39,
+        0,0,206,208,5,6,0,0,207,206,1,0,0,0,207,208,1,0,0,0,208,209,1,0,
+        0,0,209,211,5,41,0,0,210,205,1,0,0,0,211,214,1,0,0,0,212,210,1,0,
+        0,0,212,213,1,0,0,0,213,215,1,0,0,0,214,212,1,0,0,0,215,216,5,35,
+        0,0,216,218,5,38,0,0,217,190,1,0,0,0,217,202,1,0,0,0,218,39,1,0,
+        0,0,219,220,6,20,-1,0,220,221,5,41,0,0,221,223,5,34,0,0,222,224,
+        3,42,21,0,223,222,1,0,0,0,223,224,1,0,0,0,224,225,1,0,0,0,225,235,
+        5,35,0,0,226,235,5,41,0,0,227,235,7,2,0,0,228,229,5,34,0,0,229,230,
+        3,40,20,0,230,231,5,35,0,0,231,235,1,0,0,0,232,233,7,3,0,0,233,235,
+        3,40,20,8,234,219,1,0,0,0,234,226,1,0,0,0,234,227,1,0,0,0,234,228,
+        1,0,0,0,234,232,1,0,0,0,235,259,1,0,0,0,236,237,10,7,0,0,237,238,
+        7,4,0,0,238,258,3,40,20,8,239,240,10,6,0,0,240,241,7,5,0,0,241,258,
+        3,40,20,7,242,243,10,5,0,0,243,244,7,6,0,0,244,258,3,40,20,6,245,
+        246,10,4,0,0,246,247,7,7,0,0,247,258,3,40,20,5,248,249,10,3,0,0,
+        249,250,5,19,0,0,250,258,3,40,20,4,251,252,10,2,0,0,252,253,5,20,
+        0,0,253,258,3,40,20,3,254,255,10,1,0,0,255,256,5,1,0,0,256,258,3,
+        40,20,1,257,236,1,0,0,0,257,239,1,0,0,0,257,242,1,0,0,0,257,245,
+        1,0,0,0,257,248,1,0,0,0,257,251,1,0,0,0,257,254,1,0,0,0,258,261,
+        1,0,0,0,259,257,1,0,0,0,259,260,1,0,0,0,260,41,1,0,0,0,261,259,1,
+        0,0,0,262,267,3,40,20,0,263,264,5,39,0,0,264,266,3,40,20,0,265,263,
+        1,0,0,0,266,269,1,0,0,0,267,265,1,0,0,0,267,268,1,0,0,0,268,43,1,
+        0,0,0,269,267,1,0,0,0,29,46,48,57,67,82,88,95,97,109,119,126,134,
+        142,148,159,170,174,178,182,186,197,207,212,217,223,234,257,259,
+        267
     ]
 
 class ObfuMiniCParser ( Parser ):
@@ -122,23 +120,24 @@ class ObfuMiniCParser ( Parser ):
 
     sharedContextCache = PredictionContextCache()
 
-    literalNames = [ "<INVALID>", "'='", "'&'", "'||'", "'&&'", "'=='", 
-                     "'!='", "'<'", "'<='", "'>'", "'>='", "'+'", "'-'", 
-                     "'*'", "'/'", "'%'", "'!'", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "'int'", "'char'", "'bool'", "'printf'", 
-                     "'scanf'", "'while'", "'for'", "'if'", "'else'", "'return'", 
-                     "'('", "')'", "'{'", "'}'", "';'", "','", "<INVALID>", 
-                     "<INVALID>", "<INVALID>", "<INVALID>", "'++'", "'--'" ]
+    literalNames = [ "<INVALID>", "'='", "'switch'", "'case'", "':'", "'default'", 
+                     "'&'", "'+'", "'-'", "'!'", "'*'", "'/'", "'%'", "'<'", 
+                     "'<='", "'>'", "'>='", "'=='", "'!='", "'&&'", "'||'", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "'int'", "'char'", 
+                     "'bool'", "'printf'", "'scanf'", "'while'", "'for'", 
+                     "'if'", "'else'", "'return'", "'('", "')'", "'{'", 
+                     "'}'", "';'", "','" ]
 
     symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "BOOL", "CHAR", "STRING", "INT", "CHAR_TOK", 
                       "BOOL_TOK", "PRINTF", "SCANF", "WHILE", "FOR", "IF", 
                       "ELSE", "RETURN", "LPAREN", "RPAREN", "LBRACE", "RBRACE", 
                       "SEMI", "COMMA", "NUMBER", "ID", "WS", "LINE_COMMENT", 
-                      "INCR", "DECR" ]
+                      "BLOCK_COMMENT" ]
 
     RULE_compilationUnit = 0
     RULE_funcDef = 1
@@ -150,29 +149,24 @@ class ObfuMiniCParser ( Parser ):
     RULE_type = 7
     RULE_blockStmt = 8
     RULE_stmt = 9
-    RULE_exprStmt = 10
-    RULE_ifStmt = 11
-    RULE_loopStmt = 12
-    RULE_returnStmt = 13
-    RULE_ioStmt = 14
-    RULE_expr = 15
-    RULE_assignExpr = 16
-    RULE_logicOrExpr = 17
-    RULE_logicAndExpr = 18
-    RULE_equalityExpr = 19
-    RULE_relationalExpr = 20
-    RULE_addExpr = 21
-    RULE_mulExpr = 22
-    RULE_unaryExpr = 23
-    RULE_primaryExpr = 24
-    RULE_argList = 25
+    RULE_switchStmt = 10
+    RULE_switchBlock = 11
+    RULE_caseBlock = 12
+    RULE_defaultBlock = 13
+    RULE_literal = 14
+    RULE_exprStmt = 15
+    RULE_ifStmt = 16
+    RULE_loopStmt = 17
+    RULE_returnStmt = 18
+    RULE_ioStmt = 19
+    RULE_expr = 20
+    RULE_argList = 21
 
     ruleNames =  [ "compilationUnit", "funcDef", "paramList", "param", "varDecl", 
-                   "initList", "init", "type", "blockStmt", "stmt", "exprStmt", 
-                   "ifStmt", "loopStmt", "returnStmt", "ioStmt", "expr", 
-                   "assignExpr", "logicOrExpr", "logicAndExpr", "equalityExpr", 
-                   "relationalExpr", "addExpr", "mulExpr", "unaryExpr", 
-                   "primaryExpr", "argList" ]
+                   "initList", "init", "type", "blockStmt", "stmt", "switchStmt", 
+                   "switchBlock", "caseBlock", "defaultBlock", "literal", 
+                   "exprStmt", "ifStmt", "loopStmt", "returnStmt", "ioStmt", 
+                   "expr", "argList" ]
 
     EOF = Token.EOF
     T__0=1
@@ -191,31 +185,34 @@ class ObfuMiniCParser ( Parser ):
     T__13=14
     T__14=15
     T__15=16
-    BOOL=17
-    CHAR=18
-    STRING=19
-    INT=20
-    CHAR_TOK=21
-    BOOL_TOK=22
-    PRINTF=23
-    SCANF=24
-    WHILE=25
-    FOR=26
-    IF=27
-    ELSE=28
-    RETURN=29
-    LPAREN=30
-    RPAREN=31
-    LBRACE=32
-    RBRACE=33
-    SEMI=34
-    COMMA=35
-    NUMBER=36
-    ID=37
-    WS=38
-    LINE_COMMENT=39
-    INCR=40
-    DECR=41
+    T__16=17
+    T__17=18
+    T__18=19
+    T__19=20
+    BOOL=21
+    CHAR=22
+    STRING=23
+    INT=24
+    CHAR_TOK=25
+    BOOL_TOK=26
+    PRINTF=27
+    SCANF=28
+    WHILE=29
+    FOR=30
+    IF=31
+    ELSE=32
+    RETURN=33
+    LPAREN=34
+    RPAREN=35
+    LBRACE=36
+    RBRACE=37
+    SEMI=38
+    COMMA=39
+    NUMBER=40
+    ID=41
+    WS=42
+    LINE_COMMENT=43
+    BLOCK_COMMENT=44
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -277,29 +274,29 @@ class ObfuMiniCParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 56
+            self.state = 48
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 7340032) != 0):
-                self.state = 54
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 117440512) != 0):
+                self.state = 46
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,0,self._ctx)
                 if la_ == 1:
-                    self.state = 52
+                    self.state = 44
                     self.funcDef()
                     pass
 
                 elif la_ == 2:
-                    self.state = 53
+                    self.state = 45
                     self.varDecl()
                     pass
 
 
-                self.state = 58
+                self.state = 50
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 59
+            self.state = 51
             self.match(ObfuMiniCParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -365,23 +362,23 @@ class ObfuMiniCParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 61
+            self.state = 53
             self.type_()
-            self.state = 62
+            self.state = 54
             self.match(ObfuMiniCParser.ID)
-            self.state = 63
+            self.state = 55
             self.match(ObfuMiniCParser.LPAREN)
-            self.state = 65
+            self.state = 57
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 7340032) != 0):
-                self.state = 64
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 117440512) != 0):
+                self.state = 56
                 self.paramList()
 
 
-            self.state = 67
+            self.state = 59
             self.match(ObfuMiniCParser.RPAREN)
-            self.state = 68
+            self.state = 60
             self.blockStmt()
         except RecognitionException as re:
             localctx.exception = re
@@ -439,17 +436,17 @@ class ObfuMiniCParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 70
+            self.state = 62
             self.param()
-            self.state = 75
+            self.state = 67
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==35:
-                self.state = 71
+            while _la==39:
+                self.state = 63
                 self.match(ObfuMiniCParser.COMMA)
-                self.state = 72
+                self.state = 64
                 self.param()
-                self.state = 77
+                self.state = 69
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -502,9 +499,9 @@ class ObfuMiniCParser ( Parser ):
         self.enterRule(localctx, 6, self.RULE_param)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 78
+            self.state = 70
             self.type_()
-            self.state = 79
+            self.state = 71
             self.match(ObfuMiniCParser.ID)
         except RecognitionException as re:
             localctx.exception = re
@@ -559,11 +556,11 @@ class ObfuMiniCParser ( Parser ):
         self.enterRule(localctx, 8, self.RULE_varDecl)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 81
+            self.state = 73
             self.type_()
-            self.state = 82
+            self.state = 74
             self.initList()
-            self.state = 83
+            self.state = 75
             self.match(ObfuMiniCParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
@@ -621,17 +618,17 @@ class ObfuMiniCParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 85
+            self.state = 77
             self.init()
-            self.state = 90
+            self.state = 82
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==35:
-                self.state = 86
+            while _la==39:
+                self.state = 78
                 self.match(ObfuMiniCParser.COMMA)
-                self.state = 87
+                self.state = 79
                 self.init()
-                self.state = 92
+                self.state = 84
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -685,16 +682,16 @@ class ObfuMiniCParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 93
+            self.state = 85
             self.match(ObfuMiniCParser.ID)
-            self.state = 96
+            self.state = 88
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==1:
-                self.state = 94
+                self.state = 86
                 self.match(ObfuMiniCParser.T__0)
-                self.state = 95
-                self.expr()
+                self.state = 87
+                self.expr(0)
 
 
         except RecognitionException as re:
@@ -749,9 +746,9 @@ class ObfuMiniCParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 98
+            self.state = 90
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 7340032) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 117440512) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -819,31 +816,31 @@ class ObfuMiniCParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 100
+            self.state = 92
             self.match(ObfuMiniCParser.LBRACE)
-            self.state = 105
+            self.state = 97
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 3528047138816) != 0):
-                self.state = 103
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 3672194941828) != 0):
+                self.state = 95
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
-                if token in [20, 21, 22]:
-                    self.state = 101
+                if token in [24, 25, 26]:
+                    self.state = 93
                     self.varDecl()
                     pass
-                elif token in [11, 12, 16, 17, 18, 19, 23, 24, 25, 26, 27, 29, 30, 32, 34, 36, 37, 40, 41]:
-                    self.state = 102
+                elif token in [2, 7, 8, 9, 21, 22, 23, 27, 28, 29, 30, 31, 33, 34, 36, 38, 40, 41]:
+                    self.state = 94
                     self.stmt()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 107
+                self.state = 99
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 108
+            self.state = 100
             self.match(ObfuMiniCParser.RBRACE)
         except RecognitionException as re:
             localctx.exception = re
@@ -885,6 +882,10 @@ class ObfuMiniCParser ( Parser ):
             return self.getTypedRuleContext(ObfuMiniCParser.IoStmtContext,0)
 
 
+        def switchStmt(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.SwitchStmtContext,0)
+
+
         def getRuleIndex(self):
             return ObfuMiniCParser.RULE_stmt
 
@@ -910,39 +911,44 @@ class ObfuMiniCParser ( Parser ):
         localctx = ObfuMiniCParser.StmtContext(self, self._ctx, self.state)
         self.enterRule(localctx, 18, self.RULE_stmt)
         try:
-            self.state = 116
+            self.state = 109
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [11, 12, 16, 17, 18, 19, 30, 34, 36, 37, 40, 41]:
+            if token in [7, 8, 9, 21, 22, 23, 34, 38, 40, 41]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 110
+                self.state = 102
                 self.exprStmt()
                 pass
-            elif token in [32]:
+            elif token in [36]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 111
+                self.state = 103
                 self.blockStmt()
                 pass
-            elif token in [27]:
+            elif token in [31]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 112
+                self.state = 104
                 self.ifStmt()
                 pass
-            elif token in [25, 26]:
+            elif token in [29, 30]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 113
+                self.state = 105
                 self.loopStmt()
                 pass
-            elif token in [29]:
+            elif token in [33]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 114
+                self.state = 106
                 self.returnStmt()
                 pass
-            elif token in [23, 24]:
+            elif token in [27, 28]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 115
+                self.state = 107
                 self.ioStmt()
                 pass
+            elif token in [2]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 108
+                self.switchStmt()
+                pass
             else:
                 raise NoViableAltException(self)
 
@@ -955,57 +961,85 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class ExprStmtContext(ParserRuleContext):
+    class SwitchStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def SEMI(self):
-            return self.getToken(ObfuMiniCParser.SEMI, 0)
+        def LPAREN(self):
+            return self.getToken(ObfuMiniCParser.LPAREN, 0)
 
         def expr(self):
             return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
 
 
+        def RPAREN(self):
+            return self.getToken(ObfuMiniCParser.RPAREN, 0)
+
+        def LBRACE(self):
+            return self.getToken(ObfuMiniCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(ObfuMiniCParser.RBRACE, 0)
+
+        def switchBlock(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ObfuMiniCParser.SwitchBlockContext)
+            else:
+                return self.getTypedRuleContext(ObfuMiniCParser.SwitchBlockContext,i)
+
+
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_exprStmt
+            return ObfuMiniCParser.RULE_switchStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterExprStmt" ):
-                listener.enterExprStmt(self)
+            if hasattr( listener, "enterSwitchStmt" ):
+                listener.enterSwitchStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitExprStmt" ):
-                listener.exitExprStmt(self)
+            if hasattr( listener, "exitSwitchStmt" ):
+                listener.exitSwitchStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitExprStmt" ):
-                return visitor.visitExprStmt(self)
+            if hasattr( visitor, "visitSwitchStmt" ):
+                return visitor.visitSwitchStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def exprStmt(self):
+    def switchStmt(self):
 
-        localctx = ObfuMiniCParser.ExprStmtContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_exprStmt)
+        localctx = ObfuMiniCParser.SwitchStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_switchStmt)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
+            self.state = 111
+            self.match(ObfuMiniCParser.T__1)
+            self.state = 112
+            self.match(ObfuMiniCParser.LPAREN)
+            self.state = 113
+            self.expr(0)
+            self.state = 114
+            self.match(ObfuMiniCParser.RPAREN)
+            self.state = 115
+            self.match(ObfuMiniCParser.LBRACE)
             self.state = 119
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3505768044544) != 0):
-                self.state = 118
-                self.expr()
-
+            while _la==3 or _la==5:
+                self.state = 116
+                self.switchBlock()
+                self.state = 121
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
 
-            self.state = 121
-            self.match(ObfuMiniCParser.SEMI)
+            self.state = 122
+            self.match(ObfuMiniCParser.RBRACE)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1015,81 +1049,61 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class IfStmtContext(ParserRuleContext):
+    class SwitchBlockContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IF(self):
-            return self.getToken(ObfuMiniCParser.IF, 0)
-
-        def LPAREN(self):
-            return self.getToken(ObfuMiniCParser.LPAREN, 0)
-
-        def expr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
-
+        def caseBlock(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.CaseBlockContext,0)
 
-        def RPAREN(self):
-            return self.getToken(ObfuMiniCParser.RPAREN, 0)
-
-        def stmt(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.StmtContext)
-            else:
-                return self.getTypedRuleContext(ObfuMiniCParser.StmtContext,i)
 
+        def defaultBlock(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.DefaultBlockContext,0)
 
-        def ELSE(self):
-            return self.getToken(ObfuMiniCParser.ELSE, 0)
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_ifStmt
+            return ObfuMiniCParser.RULE_switchBlock
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterIfStmt" ):
-                listener.enterIfStmt(self)
+            if hasattr( listener, "enterSwitchBlock" ):
+                listener.enterSwitchBlock(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitIfStmt" ):
-                listener.exitIfStmt(self)
+            if hasattr( listener, "exitSwitchBlock" ):
+                listener.exitSwitchBlock(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitIfStmt" ):
-                return visitor.visitIfStmt(self)
+            if hasattr( visitor, "visitSwitchBlock" ):
+                return visitor.visitSwitchBlock(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def ifStmt(self):
+    def switchBlock(self):
 
-        localctx = ObfuMiniCParser.IfStmtContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 22, self.RULE_ifStmt)
+        localctx = ObfuMiniCParser.SwitchBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_switchBlock)
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 123
-            self.match(ObfuMiniCParser.IF)
-            self.state = 124
-            self.match(ObfuMiniCParser.LPAREN)
-            self.state = 125
-            self.expr()
             self.state = 126
-            self.match(ObfuMiniCParser.RPAREN)
-            self.state = 127
-            self.stmt()
-            self.state = 130
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
-            if la_ == 1:
-                self.state = 128
-                self.match(ObfuMiniCParser.ELSE)
-                self.state = 129
-                self.stmt()
-
+            token = self._input.LA(1)
+            if token in [3]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 124
+                self.caseBlock()
+                pass
+            elif token in [5]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 125
+                self.defaultBlock()
+                pass
+            else:
+                raise NoViableAltException(self)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -1100,125 +1114,66 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class LoopStmtContext(ParserRuleContext):
+    class CaseBlockContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def WHILE(self):
-            return self.getToken(ObfuMiniCParser.WHILE, 0)
+        def literal(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.LiteralContext,0)
 
-        def LPAREN(self):
-            return self.getToken(ObfuMiniCParser.LPAREN, 0)
 
-        def expr(self, i:int=None):
+        def stmt(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.ExprContext)
+                return self.getTypedRuleContexts(ObfuMiniCParser.StmtContext)
             else:
-                return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,i)
-
-
-        def RPAREN(self):
-            return self.getToken(ObfuMiniCParser.RPAREN, 0)
-
-        def stmt(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.StmtContext,0)
-
-
-        def FOR(self):
-            return self.getToken(ObfuMiniCParser.FOR, 0)
+                return self.getTypedRuleContext(ObfuMiniCParser.StmtContext,i)
 
-        def SEMI(self, i:int=None):
-            if i is None:
-                return self.getTokens(ObfuMiniCParser.SEMI)
-            else:
-                return self.getToken(ObfuMiniCParser.SEMI, i)
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_loopStmt
+            return ObfuMiniCParser.RULE_caseBlock
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterLoopStmt" ):
-                listener.enterLoopStmt(self)
+            if hasattr( listener, "enterCaseBlock" ):
+                listener.enterCaseBlock(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitLoopStmt" ):
-                listener.exitLoopStmt(self)
+            if hasattr( listener, "exitCaseBlock" ):
+                listener.exitCaseBlock(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitLoopStmt" ):
-                return visitor.visitLoopStmt(self)
+            if hasattr( visitor, "visitCaseBlock" ):
+                return visitor.visitCaseBlock(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def loopStmt(self):
+    def caseBlock(self):
 
-        localctx = ObfuMiniCParser.LoopStmtContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 24, self.RULE_loopStmt)
+        localctx = ObfuMiniCParser.CaseBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_caseBlock)
         self._la = 0 # Token type
         try:
-            self.state = 153
+            self.enterOuterAlt(localctx, 1)
+            self.state = 128
+            self.match(ObfuMiniCParser.T__2)
+            self.state = 129
+            self.literal()
+            self.state = 130
+            self.match(ObfuMiniCParser.T__3)
+            self.state = 134
             self._errHandler.sync(self)
-            token = self._input.LA(1)
-            if token in [25]:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 132
-                self.match(ObfuMiniCParser.WHILE)
-                self.state = 133
-                self.match(ObfuMiniCParser.LPAREN)
-                self.state = 134
-                self.expr()
-                self.state = 135
-                self.match(ObfuMiniCParser.RPAREN)
-                self.state = 136
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 3672077501316) != 0):
+                self.state = 131
                 self.stmt()
-                pass
-            elif token in [26]:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 138
-                self.match(ObfuMiniCParser.FOR)
-                self.state = 139
-                self.match(ObfuMiniCParser.LPAREN)
-                self.state = 141
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3505768044544) != 0):
-                    self.state = 140
-                    self.expr()
-
-
-                self.state = 143
-                self.match(ObfuMiniCParser.SEMI)
-                self.state = 145
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3505768044544) != 0):
-                    self.state = 144
-                    self.expr()
-
-
-                self.state = 147
-                self.match(ObfuMiniCParser.SEMI)
-                self.state = 149
+                self.state = 136
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3505768044544) != 0):
-                    self.state = 148
-                    self.expr()
-
-
-                self.state = 151
-                self.match(ObfuMiniCParser.RPAREN)
-                self.state = 152
-                self.stmt()
-                pass
-            else:
-                raise NoViableAltException(self)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -1229,62 +1184,61 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class ReturnStmtContext(ParserRuleContext):
+    class DefaultBlockContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def RETURN(self):
-            return self.getToken(ObfuMiniCParser.RETURN, 0)
-
-        def SEMI(self):
-            return self.getToken(ObfuMiniCParser.SEMI, 0)
-
-        def expr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ObfuMiniCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(ObfuMiniCParser.StmtContext,i)
 
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_returnStmt
+            return ObfuMiniCParser.RULE_defaultBlock
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterReturnStmt" ):
-                listener.enterReturnStmt(self)
+            if hasattr( listener, "enterDefaultBlock" ):
+                listener.enterDefaultBlock(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitReturnStmt" ):
-                listener.exitReturnStmt(self)
+            if hasattr( listener, "exitDefaultBlock" ):
+                listener.exitDefaultBlock(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitReturnStmt" ):
-                return visitor.visitReturnStmt(self)
+            if hasattr( visitor, "visitDefaultBlock" ):
+                return visitor.visitDefaultBlock(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def returnStmt(self):
+    def defaultBlock(self):
 
-        localctx = ObfuMiniCParser.ReturnStmtContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 26, self.RULE_returnStmt)
+        localctx = ObfuMiniCParser.DefaultBlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_defaultBlock)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 155
-            self.match(ObfuMiniCParser.RETURN)
-            self.state = 157
+            self.state = 137
+            self.match(ObfuMiniCParser.T__4)
+            self.state = 138
+            self.match(ObfuMiniCParser.T__3)
+            self.state = 142
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3505768044544) != 0):
-                self.state = 156
-                self.expr()
-
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 3672077501316) != 0):
+                self.state = 139
+                self.stmt()
+                self.state = 144
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
 
-            self.state = 159
-            self.match(ObfuMiniCParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1294,140 +1248,56 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class IoStmtContext(ParserRuleContext):
+    class LiteralContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def PRINTF(self):
-            return self.getToken(ObfuMiniCParser.PRINTF, 0)
+        def NUMBER(self):
+            return self.getToken(ObfuMiniCParser.NUMBER, 0)
 
-        def LPAREN(self):
-            return self.getToken(ObfuMiniCParser.LPAREN, 0)
+        def CHAR(self):
+            return self.getToken(ObfuMiniCParser.CHAR, 0)
 
-        def STRING(self):
-            return self.getToken(ObfuMiniCParser.STRING, 0)
+        def BOOL(self):
+            return self.getToken(ObfuMiniCParser.BOOL, 0)
 
-        def RPAREN(self):
-            return self.getToken(ObfuMiniCParser.RPAREN, 0)
+        def getRuleIndex(self):
+            return ObfuMiniCParser.RULE_literal
 
-        def SEMI(self):
-            return self.getToken(ObfuMiniCParser.SEMI, 0)
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLiteral" ):
+                listener.enterLiteral(self)
 
-        def COMMA(self, i:int=None):
-            if i is None:
-                return self.getTokens(ObfuMiniCParser.COMMA)
-            else:
-                return self.getToken(ObfuMiniCParser.COMMA, i)
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLiteral" ):
+                listener.exitLiteral(self)
 
-        def expr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.ExprContext)
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLiteral" ):
+                return visitor.visitLiteral(self)
             else:
-                return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,i)
+                return visitor.visitChildren(self)
 
 
-        def SCANF(self):
-            return self.getToken(ObfuMiniCParser.SCANF, 0)
 
-        def ID(self, i:int=None):
-            if i is None:
-                return self.getTokens(ObfuMiniCParser.ID)
-            else:
-                return self.getToken(ObfuMiniCParser.ID, i)
-
-        def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_ioStmt
-
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterIoStmt" ):
-                listener.enterIoStmt(self)
-
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitIoStmt" ):
-                listener.exitIoStmt(self)
-
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitIoStmt" ):
-                return visitor.visitIoStmt(self)
-            else:
-                return visitor.visitChildren(self)
 
+    def literal(self):
 
-
-
-    def ioStmt(self):
-
-        localctx = ObfuMiniCParser.IoStmtContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 28, self.RULE_ioStmt)
+        localctx = ObfuMiniCParser.LiteralContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_literal)
         self._la = 0 # Token type
         try:
-            self.state = 188
-            self._errHandler.sync(self)
-            token = self._input.LA(1)
-            if token in [23]:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 161
-                self.match(ObfuMiniCParser.PRINTF)
-                self.state = 162
-                self.match(ObfuMiniCParser.LPAREN)
-                self.state = 163
-                self.match(ObfuMiniCParser.STRING)
-                self.state = 168
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                while _la==35:
-                    self.state = 164
-                    self.match(ObfuMiniCParser.COMMA)
-                    self.state = 165
-                    self.expr()
-                    self.state = 170
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-
-                self.state = 171
-                self.match(ObfuMiniCParser.RPAREN)
-                self.state = 172
-                self.match(ObfuMiniCParser.SEMI)
-                pass
-            elif token in [24]:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 173
-                self.match(ObfuMiniCParser.SCANF)
-                self.state = 174
-                self.match(ObfuMiniCParser.LPAREN)
-                self.state = 175
-                self.match(ObfuMiniCParser.STRING)
-                self.state = 183
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                while _la==35:
-                    self.state = 176
-                    self.match(ObfuMiniCParser.COMMA)
-                    self.state = 178
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-                    if _la==2:
-                        self.state = 177
-                        self.match(ObfuMiniCParser.T__1)
-
-
-                    self.state = 180
-                    self.match(ObfuMiniCParser.ID)
-                    self.state = 185
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-
-                self.state = 186
-                self.match(ObfuMiniCParser.RPAREN)
-                self.state = 187
-                self.match(ObfuMiniCParser.SEMI)
-                pass
+            self.enterOuterAlt(localctx, 1)
+            self.state = 145
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1099517919232) != 0)):
+                self._errHandler.recoverInline(self)
             else:
-                raise NoViableAltException(self)
-
+                self._errHandler.reportMatch(self)
+                self.consume()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1437,45 +1307,57 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class ExprContext(ParserRuleContext):
+    class ExprStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def assignExpr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.AssignExprContext,0)
+        def SEMI(self):
+            return self.getToken(ObfuMiniCParser.SEMI, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
 
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_expr
+            return ObfuMiniCParser.RULE_exprStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterExpr" ):
-                listener.enterExpr(self)
+            if hasattr( listener, "enterExprStmt" ):
+                listener.enterExprStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitExpr" ):
-                listener.exitExpr(self)
+            if hasattr( listener, "exitExprStmt" ):
+                listener.exitExprStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitExpr" ):
-                return visitor.visitExpr(self)
+            if hasattr( visitor, "visitExprStmt" ):
+                return visitor.visitExprStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def expr(self):
+    def exprStmt(self):
 
-        localctx = ObfuMiniCParser.ExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_expr)
+        localctx = ObfuMiniCParser.ExprStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_exprStmt)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 190
-            self.assignExpr()
+            self.state = 148
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315729433472) != 0):
+                self.state = 147
+                self.expr(0)
+
+
+            self.state = 150
+            self.match(ObfuMiniCParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1485,58 +1367,80 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class AssignExprContext(ParserRuleContext):
+    class IfStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def logicOrExpr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.LogicOrExprContext,0)
+        def IF(self):
+            return self.getToken(ObfuMiniCParser.IF, 0)
+
+        def LPAREN(self):
+            return self.getToken(ObfuMiniCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
+
 
+        def RPAREN(self):
+            return self.getToken(ObfuMiniCParser.RPAREN, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ObfuMiniCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(ObfuMiniCParser.StmtContext,i)
 
-        def assignExpr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.AssignExprContext,0)
 
+        def ELSE(self):
+            return self.getToken(ObfuMiniCParser.ELSE, 0)
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_assignExpr
+            return ObfuMiniCParser.RULE_ifStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterAssignExpr" ):
-                listener.enterAssignExpr(self)
+            if hasattr( listener, "enterIfStmt" ):
+                listener.enterIfStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitAssignExpr" ):
-                listener.exitAssignExpr(self)
+            if hasattr( listener, "exitIfStmt" ):
+                listener.exitIfStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitAssignExpr" ):
-                return visitor.visitAssignExpr(self)
+            if hasattr( visitor, "visitIfStmt" ):
+                return visitor.visitIfStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def assignExpr(self):
+    def ifStmt(self):
 
-        localctx = ObfuMiniCParser.AssignExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_assignExpr)
-        self._la = 0 # Token type
+        localctx = ObfuMiniCParser.IfStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_ifStmt)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 192
-            self.logicOrExpr()
-            self.state = 195
+            self.state = 152
+            self.match(ObfuMiniCParser.IF)
+            self.state = 153
+            self.match(ObfuMiniCParser.LPAREN)
+            self.state = 154
+            self.expr(0)
+            self.state = 155
+            self.match(ObfuMiniCParser.RPAREN)
+            self.state = 156
+            self.stmt()
+            self.state = 159
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if _la==1:
-                self.state = 193
-                self.match(ObfuMiniCParser.T__0)
-                self.state = 194
-                self.assignExpr()
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            if la_ == 1:
+                self.state = 157
+                self.match(ObfuMiniCParser.ELSE)
+                self.state = 158
+                self.stmt()
 
 
         except RecognitionException as re:
@@ -1548,193 +1452,125 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class LogicOrExprContext(ParserRuleContext):
+    class LoopStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def logicAndExpr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.LogicAndExprContext)
-            else:
-                return self.getTypedRuleContext(ObfuMiniCParser.LogicAndExprContext,i)
-
-
-        def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_logicOrExpr
-
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterLogicOrExpr" ):
-                listener.enterLogicOrExpr(self)
+        def WHILE(self):
+            return self.getToken(ObfuMiniCParser.WHILE, 0)
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitLogicOrExpr" ):
-                listener.exitLogicOrExpr(self)
+        def LPAREN(self):
+            return self.getToken(ObfuMiniCParser.LPAREN, 0)
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitLogicOrExpr" ):
-                return visitor.visitLogicOrExpr(self)
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ObfuMiniCParser.ExprContext)
             else:
-                return visitor.visitChildren(self)
-
-
-
-
-    def logicOrExpr(self):
+                return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,i)
 
-        localctx = ObfuMiniCParser.LogicOrExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_logicOrExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 197
-            self.logicAndExpr()
-            self.state = 202
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==3:
-                self.state = 198
-                self.match(ObfuMiniCParser.T__2)
-                self.state = 199
-                self.logicAndExpr()
-                self.state = 204
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
 
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
+        def RPAREN(self):
+            return self.getToken(ObfuMiniCParser.RPAREN, 0)
 
+        def stmt(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.StmtContext,0)
 
-    class LogicAndExprContext(ParserRuleContext):
-        __slots__ = 'parser'
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+        def FOR(self):
+            return self.getToken(ObfuMiniCParser.FOR, 0)
 
-        def equalityExpr(self, i:int=None):
+        def SEMI(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.EqualityExprContext)
+                return self.getTokens(ObfuMiniCParser.SEMI)
             else:
-                return self.getTypedRuleContext(ObfuMiniCParser.EqualityExprContext,i)
-
+                return self.getToken(ObfuMiniCParser.SEMI, i)
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_logicAndExpr
+            return ObfuMiniCParser.RULE_loopStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterLogicAndExpr" ):
-                listener.enterLogicAndExpr(self)
+            if hasattr( listener, "enterLoopStmt" ):
+                listener.enterLoopStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitLogicAndExpr" ):
-                listener.exitLogicAndExpr(self)
+            if hasattr( listener, "exitLoopStmt" ):
+                listener.exitLoopStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitLogicAndExpr" ):
-                return visitor.visitLogicAndExpr(self)
+            if hasattr( visitor, "visitLoopStmt" ):
+                return visitor.visitLoopStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def logicAndExpr(self):
+    def loopStmt(self):
 
-        localctx = ObfuMiniCParser.LogicAndExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 36, self.RULE_logicAndExpr)
+        localctx = ObfuMiniCParser.LoopStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_loopStmt)
         self._la = 0 # Token type
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 205
-            self.equalityExpr()
-            self.state = 210
+            self.state = 182
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==4:
-                self.state = 206
-                self.match(ObfuMiniCParser.T__3)
-                self.state = 207
-                self.equalityExpr()
-                self.state = 212
+            token = self._input.LA(1)
+            if token in [29]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 161
+                self.match(ObfuMiniCParser.WHILE)
+                self.state = 162
+                self.match(ObfuMiniCParser.LPAREN)
+                self.state = 163
+                self.expr(0)
+                self.state = 164
+                self.match(ObfuMiniCParser.RPAREN)
+                self.state = 165
+                self.stmt()
+                pass
+            elif token in [30]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 167
+                self.match(ObfuMiniCParser.FOR)
+                self.state = 168
+                self.match(ObfuMiniCParser.LPAREN)
+                self.state = 170
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315729433472) != 0):
+                    self.state = 169
+                    self.expr(0)
 
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
-    class EqualityExprContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def relationalExpr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.RelationalExprContext)
-            else:
-                return self.getTypedRuleContext(ObfuMiniCParser.RelationalExprContext,i)
 
+                self.state = 172
+                self.match(ObfuMiniCParser.SEMI)
+                self.state = 174
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315729433472) != 0):
+                    self.state = 173
+                    self.expr(0)
 
-        def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_equalityExpr
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterEqualityExpr" ):
-                listener.enterEqualityExpr(self)
+                self.state = 176
+                self.match(ObfuMiniCParser.SEMI)
+                self.state = 178
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315729433472) != 0):
+                    self.state = 177
+                    self.expr(0)
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitEqualityExpr" ):
-                listener.exitEqualityExpr(self)
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitEqualityExpr" ):
-                return visitor.visitEqualityExpr(self)
+                self.state = 180
+                self.match(ObfuMiniCParser.RPAREN)
+                self.state = 181
+                self.stmt()
+                pass
             else:
-                return visitor.visitChildren(self)
-
-
-
-
-    def equalityExpr(self):
-
-        localctx = ObfuMiniCParser.EqualityExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 38, self.RULE_equalityExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 213
-            self.relationalExpr()
-            self.state = 218
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==5 or _la==6:
-                self.state = 214
-                _la = self._input.LA(1)
-                if not(_la==5 or _la==6):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 215
-                self.relationalExpr()
-                self.state = 220
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
+                raise NoViableAltException(self)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -1745,66 +1581,62 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class RelationalExprContext(ParserRuleContext):
+    class ReturnStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def addExpr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.AddExprContext)
-            else:
-                return self.getTypedRuleContext(ObfuMiniCParser.AddExprContext,i)
+        def RETURN(self):
+            return self.getToken(ObfuMiniCParser.RETURN, 0)
+
+        def SEMI(self):
+            return self.getToken(ObfuMiniCParser.SEMI, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
 
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_relationalExpr
+            return ObfuMiniCParser.RULE_returnStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterRelationalExpr" ):
-                listener.enterRelationalExpr(self)
+            if hasattr( listener, "enterReturnStmt" ):
+                listener.enterReturnStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitRelationalExpr" ):
-                listener.exitRelationalExpr(self)
+            if hasattr( listener, "exitReturnStmt" ):
+                listener.exitReturnStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitRelationalExpr" ):
-                return visitor.visitRelationalExpr(self)
+            if hasattr( visitor, "visitReturnStmt" ):
+                return visitor.visitReturnStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def relationalExpr(self):
+    def returnStmt(self):
 
-        localctx = ObfuMiniCParser.RelationalExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 40, self.RULE_relationalExpr)
+        localctx = ObfuMiniCParser.ReturnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_returnStmt)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 221
-            self.addExpr()
-            self.state = 226
+            self.state = 184
+            self.match(ObfuMiniCParser.RETURN)
+            self.state = 186
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1920) != 0):
-                self.state = 222
-                _la = self._input.LA(1)
-                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1920) != 0)):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 223
-                self.addExpr()
-                self.state = 228
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315729433472) != 0):
+                self.state = 185
+                self.expr(0)
 
+
+            self.state = 188
+            self.match(ObfuMiniCParser.SEMI)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1814,134 +1646,139 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class AddExprContext(ParserRuleContext):
+    class IoStmtContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def mulExpr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.MulExprContext)
-            else:
-                return self.getTypedRuleContext(ObfuMiniCParser.MulExprContext,i)
-
-
-        def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_addExpr
-
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterAddExpr" ):
-                listener.enterAddExpr(self)
-
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitAddExpr" ):
-                listener.exitAddExpr(self)
-
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitAddExpr" ):
-                return visitor.visitAddExpr(self)
-            else:
-                return visitor.visitChildren(self)
-
+        def PRINTF(self):
+            return self.getToken(ObfuMiniCParser.PRINTF, 0)
 
+        def LPAREN(self):
+            return self.getToken(ObfuMiniCParser.LPAREN, 0)
 
+        def STRING(self):
+            return self.getToken(ObfuMiniCParser.STRING, 0)
 
-    def addExpr(self):
+        def RPAREN(self):
+            return self.getToken(ObfuMiniCParser.RPAREN, 0)
 
-        localctx = ObfuMiniCParser.AddExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 42, self.RULE_addExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 229
-            self.mulExpr()
-            self.state = 234
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==11 or _la==12:
-                self.state = 230
-                _la = self._input.LA(1)
-                if not(_la==11 or _la==12):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 231
-                self.mulExpr()
-                self.state = 236
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
+        def SEMI(self):
+            return self.getToken(ObfuMiniCParser.SEMI, 0)
 
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(ObfuMiniCParser.COMMA)
+            else:
+                return self.getToken(ObfuMiniCParser.COMMA, i)
 
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ObfuMiniCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,i)
 
-    class MulExprContext(ParserRuleContext):
-        __slots__ = 'parser'
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+        def SCANF(self):
+            return self.getToken(ObfuMiniCParser.SCANF, 0)
 
-        def unaryExpr(self, i:int=None):
+        def ID(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(ObfuMiniCParser.UnaryExprContext)
+                return self.getTokens(ObfuMiniCParser.ID)
             else:
-                return self.getTypedRuleContext(ObfuMiniCParser.UnaryExprContext,i)
-
+                return self.getToken(ObfuMiniCParser.ID, i)
 
         def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_mulExpr
+            return ObfuMiniCParser.RULE_ioStmt
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterMulExpr" ):
-                listener.enterMulExpr(self)
+            if hasattr( listener, "enterIoStmt" ):
+                listener.enterIoStmt(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitMulExpr" ):
-                listener.exitMulExpr(self)
+            if hasattr( listener, "exitIoStmt" ):
+                listener.exitIoStmt(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitMulExpr" ):
-                return visitor.visitMulExpr(self)
+            if hasattr( visitor, "visitIoStmt" ):
+                return visitor.visitIoStmt(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def mulExpr(self):
+    def ioStmt(self):
 
-        localctx = ObfuMiniCParser.MulExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 44, self.RULE_mulExpr)
+        localctx = ObfuMiniCParser.IoStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_ioStmt)
         self._la = 0 # Token type
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 237
-            self.unaryExpr()
-            self.state = 242
+            self.state = 217
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 57344) != 0):
-                self.state = 238
+            token = self._input.LA(1)
+            if token in [27]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 190
+                self.match(ObfuMiniCParser.PRINTF)
+                self.state = 191
+                self.match(ObfuMiniCParser.LPAREN)
+                self.state = 192
+                self.match(ObfuMiniCParser.STRING)
+                self.state = 197
+                self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 57344) != 0)):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 239
-                self.unaryExpr()
-                self.state = 244
+                while _la==39:
+                    self.state = 193
+                    self.match(ObfuMiniCParser.COMMA)
+                    self.state = 194
+                    self.expr(0)
+                    self.state = 199
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 200
+                self.match(ObfuMiniCParser.RPAREN)
+                self.state = 201
+                self.match(ObfuMiniCParser.SEMI)
+                pass
+            elif token in [28]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 202
+                self.match(ObfuMiniCParser.SCANF)
+                self.state = 203
+                self.match(ObfuMiniCParser.LPAREN)
+                self.state = 204
+                self.match(ObfuMiniCParser.STRING)
+                self.state = 212
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
+                while _la==39:
+                    self.state = 205
+                    self.match(ObfuMiniCParser.COMMA)
+                    self.state = 207
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    if _la==6:
+                        self.state = 206
+                        self.match(ObfuMiniCParser.T__5)
+
+
+                    self.state = 209
+                    self.match(ObfuMiniCParser.ID)
+                    self.state = 214
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 215
+                self.match(ObfuMiniCParser.RPAREN)
+                self.state = 216
+                self.match(ObfuMiniCParser.SEMI)
+                pass
+            else:
+                raise NoViableAltException(self)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -1952,32 +1789,56 @@ class ObfuMiniCParser ( Parser ):
         return localctx
 
 
-    class UnaryExprContext(ParserRuleContext):
+    class ExprContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def unaryExpr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.UnaryExprContext,0)
+
+        def getRuleIndex(self):
+            return ObfuMiniCParser.RULE_expr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
 
 
-        def primaryExpr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.PrimaryExprContext,0)
+    class VarExprContext(ExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a ObfuMiniCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
         def ID(self):
             return self.getToken(ObfuMiniCParser.ID, 0)
 
-        def INCR(self):
-            return self.getToken(ObfuMiniCParser.INCR, 0)
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterVarExpr" ):
+                listener.enterVarExpr(self)
 
-        def DECR(self):
-            return self.getToken(ObfuMiniCParser.DECR, 0)
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitVarExpr" ):
+                listener.exitVarExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarExpr" ):
+                return visitor.visitVarExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class UnaryExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a ObfuMiniCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
 
-        def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_unaryExpr
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterUnaryExpr" ):
@@ -1994,202 +1855,376 @@ class ObfuMiniCParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
+    class LiteralExprContext(ExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a ObfuMiniCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
-    def unaryExpr(self):
+        def NUMBER(self):
+            return self.getToken(ObfuMiniCParser.NUMBER, 0)
+        def CHAR(self):
+            return self.getToken(ObfuMiniCParser.CHAR, 0)
+        def BOOL(self):
+            return self.getToken(ObfuMiniCParser.BOOL, 0)
+        def STRING(self):
+            return self.getToken(ObfuMiniCParser.STRING, 0)
 
-        localctx = ObfuMiniCParser.UnaryExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 46, self.RULE_unaryExpr)
-        self._la = 0 # Token type
-        try:
-            self.state = 252
-            self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,27,self._ctx)
-            if la_ == 1:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 245
-                _la = self._input.LA(1)
-                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 71680) != 0)):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 246
-                self.unaryExpr()
-                pass
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLiteralExpr" ):
+                listener.enterLiteralExpr(self)
 
-            elif la_ == 2:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 247
-                self.primaryExpr()
-                pass
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLiteralExpr" ):
+                listener.exitLiteralExpr(self)
 
-            elif la_ == 3:
-                self.enterOuterAlt(localctx, 3)
-                self.state = 248
-                self.match(ObfuMiniCParser.ID)
-                self.state = 249
-                _la = self._input.LA(1)
-                if not(_la==40 or _la==41):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                pass
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLiteralExpr" ):
+                return visitor.visitLiteralExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
-            elif la_ == 4:
-                self.enterOuterAlt(localctx, 4)
-                self.state = 250
-                _la = self._input.LA(1)
-                if not(_la==40 or _la==41):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 251
-                self.match(ObfuMiniCParser.ID)
-                pass
 
+    class BinaryExprContext(ExprContext):
 
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a ObfuMiniCParser.ExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ObfuMiniCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,i)
 
 
-    class PrimaryExprContext(ParserRuleContext):
-        __slots__ = 'parser'
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBinaryExpr" ):
+                listener.enterBinaryExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBinaryExpr" ):
+                listener.exitBinaryExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBinaryExpr" ):
+                return visitor.visitBinaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+
+    class CallExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a ObfuMiniCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
         def ID(self):
             return self.getToken(ObfuMiniCParser.ID, 0)
-
         def LPAREN(self):
             return self.getToken(ObfuMiniCParser.LPAREN, 0)
-
         def RPAREN(self):
             return self.getToken(ObfuMiniCParser.RPAREN, 0)
-
         def argList(self):
             return self.getTypedRuleContext(ObfuMiniCParser.ArgListContext,0)
 
 
-        def NUMBER(self):
-            return self.getToken(ObfuMiniCParser.NUMBER, 0)
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCallExpr" ):
+                listener.enterCallExpr(self)
 
-        def CHAR(self):
-            return self.getToken(ObfuMiniCParser.CHAR, 0)
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCallExpr" ):
+                listener.exitCallExpr(self)
 
-        def BOOL(self):
-            return self.getToken(ObfuMiniCParser.BOOL, 0)
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCallExpr" ):
+                return visitor.visitCallExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
-        def STRING(self):
-            return self.getToken(ObfuMiniCParser.STRING, 0)
 
-        def expr(self):
-            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
+    class AssignExprContext(ExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a ObfuMiniCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ObfuMiniCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,i)
 
-        def getRuleIndex(self):
-            return ObfuMiniCParser.RULE_primaryExpr
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterPrimaryExpr" ):
-                listener.enterPrimaryExpr(self)
+            if hasattr( listener, "enterAssignExpr" ):
+                listener.enterAssignExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitPrimaryExpr" ):
-                listener.exitPrimaryExpr(self)
+            if hasattr( listener, "exitAssignExpr" ):
+                listener.exitAssignExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitPrimaryExpr" ):
-                return visitor.visitPrimaryExpr(self)
+            if hasattr( visitor, "visitAssignExpr" ):
+                return visitor.visitAssignExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
+    class ParenExprContext(ExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a ObfuMiniCParser.ExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def LPAREN(self):
+            return self.getToken(ObfuMiniCParser.LPAREN, 0)
+        def expr(self):
+            return self.getTypedRuleContext(ObfuMiniCParser.ExprContext,0)
+
+        def RPAREN(self):
+            return self.getToken(ObfuMiniCParser.RPAREN, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterParenExpr" ):
+                listener.enterParenExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitParenExpr" ):
+                listener.exitParenExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParenExpr" ):
+                return visitor.visitParenExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
 
-    def primaryExpr(self):
 
-        localctx = ObfuMiniCParser.PrimaryExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 48, self.RULE_primaryExpr)
+    def expr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = ObfuMiniCParser.ExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 40
+        self.enterRecursionRule(localctx, 40, self.RULE_expr, _p)
         self._la = 0 # Token type
         try:
-            self.state = 269
+            self.enterOuterAlt(localctx, 1)
+            self.state = 234
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,29,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,25,self._ctx)
             if la_ == 1:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 254
+                localctx = ObfuMiniCParser.CallExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 220
                 self.match(ObfuMiniCParser.ID)
-                self.state = 255
+                self.state = 221
                 self.match(ObfuMiniCParser.LPAREN)
-                self.state = 257
+                self.state = 223
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3505768044544) != 0):
-                    self.state = 256
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315729433472) != 0):
+                    self.state = 222
                     self.argList()
 
 
-                self.state = 259
+                self.state = 225
                 self.match(ObfuMiniCParser.RPAREN)
                 pass
 
             elif la_ == 2:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 260
+                localctx = ObfuMiniCParser.VarExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 226
                 self.match(ObfuMiniCParser.ID)
                 pass
 
             elif la_ == 3:
-                self.enterOuterAlt(localctx, 3)
-                self.state = 261
-                self.match(ObfuMiniCParser.NUMBER)
+                localctx = ObfuMiniCParser.LiteralExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 227
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1099526307840) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
                 pass
 
             elif la_ == 4:
-                self.enterOuterAlt(localctx, 4)
-                self.state = 262
-                self.match(ObfuMiniCParser.CHAR)
+                localctx = ObfuMiniCParser.ParenExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 228
+                self.match(ObfuMiniCParser.LPAREN)
+                self.state = 229
+                self.expr(0)
+                self.state = 230
+                self.match(ObfuMiniCParser.RPAREN)
                 pass
 
             elif la_ == 5:
-                self.enterOuterAlt(localctx, 5)
-                self.state = 263
-                self.match(ObfuMiniCParser.BOOL)
-                pass
-
-            elif la_ == 6:
-                self.enterOuterAlt(localctx, 6)
-                self.state = 264
-                self.match(ObfuMiniCParser.STRING)
+                localctx = ObfuMiniCParser.UnaryExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 232
+                localctx.op = self._input.LT(1)
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 896) != 0)):
+                    localctx.op = self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 233
+                self.expr(8)
                 pass
 
-            elif la_ == 7:
-                self.enterOuterAlt(localctx, 7)
-                self.state = 265
-                self.match(ObfuMiniCParser.LPAREN)
-                self.state = 266
-                self.expr()
-                self.state = 267
-                self.match(ObfuMiniCParser.RPAREN)
-                pass
 
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 259
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 257
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
+                    if la_ == 1:
+                        localctx = ObfuMiniCParser.BinaryExprContext(self, ObfuMiniCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 236
+                        if not self.precpred(self._ctx, 7):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 237
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 7168) != 0)):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 238
+                        self.expr(8)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = ObfuMiniCParser.BinaryExprContext(self, ObfuMiniCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 239
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 240
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not(_la==7 or _la==8):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 241
+                        self.expr(7)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = ObfuMiniCParser.BinaryExprContext(self, ObfuMiniCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 242
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 243
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 122880) != 0)):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 244
+                        self.expr(6)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = ObfuMiniCParser.BinaryExprContext(self, ObfuMiniCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 245
+                        if not self.precpred(self._ctx, 4):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
+                        self.state = 246
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not(_la==17 or _la==18):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 247
+                        self.expr(5)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = ObfuMiniCParser.BinaryExprContext(self, ObfuMiniCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 248
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 249
+                        localctx.op = self.match(ObfuMiniCParser.T__18)
+                        self.state = 250
+                        self.expr(4)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = ObfuMiniCParser.BinaryExprContext(self, ObfuMiniCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 251
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 252
+                        localctx.op = self.match(ObfuMiniCParser.T__19)
+                        self.state = 253
+                        self.expr(3)
+                        pass
+
+                    elif la_ == 7:
+                        localctx = ObfuMiniCParser.AssignExprContext(self, ObfuMiniCParser.ExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 254
+                        if not self.precpred(self._ctx, 1):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                        self.state = 255
+                        self.match(ObfuMiniCParser.T__0)
+                        self.state = 256
+                        self.expr(1)
+                        pass
+
+             
+                self.state = 261
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
             self._errHandler.recover(self, re)
         finally:
-            self.exitRule()
+            self.unrollRecursionContexts(_parentctx)
         return localctx
 
 
@@ -2236,21 +2271,21 @@ class ObfuMiniCParser ( Parser ):
     def argList(self):
 
         localctx = ObfuMiniCParser.ArgListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 50, self.RULE_argList)
+        self.enterRule(localctx, 42, self.RULE_argList)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 271
-            self.expr()
-            self.state = 276
+            self.state = 262
+            self.expr(0)
+            self.state = 267
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==35:
-                self.state = 272
+            while _la==39:
+                self.state = 263
                 self.match(ObfuMiniCParser.COMMA)
-                self.state = 273
-                self.expr()
-                self.state = 278
+                self.state = 264
+                self.expr(0)
+                self.state = 269
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2264,5 +2299,45 @@ class ObfuMiniCParser ( Parser ):
 
 
 
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[20] = self.expr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def expr_sempred(self, localctx:ExprContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 7)
+         
+
+            if predIndex == 1:
+                return self.precpred(self._ctx, 6)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 5)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 4)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 3)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 2)
+         
+
+            if predIndex == 6:
+                return self.precpred(self._ctx, 1)
+         
+
+
 
 
@@ -59,6 +59,31 @@ class ObfuMiniCVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by ObfuMiniCParser#switchStmt.
+    def visitSwitchStmt(self, ctx:ObfuMiniCParser.SwitchStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by ObfuMiniCParser#switchBlock.
+    def visitSwitchBlock(self, ctx:ObfuMiniCParser.SwitchBlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by ObfuMiniCParser#caseBlock.
+    def visitCaseBlock(self, ctx:ObfuMiniCParser.CaseBlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by ObfuMiniCParser#defaultBlock.
+    def visitDefaultBlock(self, ctx:ObfuMiniCParser.DefaultBlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by ObfuMiniCParser#literal.
+    def visitLiteral(self, ctx:ObfuMiniCParser.LiteralContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by ObfuMiniCParser#exprStmt.
     def visitExprStmt(self, ctx:ObfuMiniCParser.ExprStmtContext):
         return self.visitChildren(ctx)
@@ -84,53 +109,38 @@ class ObfuMiniCVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by ObfuMiniCParser#expr.
-    def visitExpr(self, ctx:ObfuMiniCParser.ExprContext):
-        return self.visitChildren(ctx)
-
-
-    # Visit a parse tree produced by ObfuMiniCParser#assignExpr.
-    def visitAssignExpr(self, ctx:ObfuMiniCParser.AssignExprContext):
-        return self.visitChildren(ctx)
-
-
-    # Visit a parse tree produced by ObfuMiniCParser#logicOrExpr.
-    def visitLogicOrExpr(self, ctx:ObfuMiniCParser.LogicOrExprContext):
-        return self.visitChildren(ctx)
-
-
-    # Visit a parse tree produced by ObfuMiniCParser#logicAndExpr.
-    def visitLogicAndExpr(self, ctx:ObfuMiniCParser.LogicAndExprContext):
+    # Visit a parse tree produced by ObfuMiniCParser#varExpr.
+    def visitVarExpr(self, ctx:ObfuMiniCParser.VarExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by ObfuMiniCParser#equalityExpr.
-    def visitEqualityExpr(self, ctx:ObfuMiniCParser.EqualityExprContext):
+    # Visit a parse tree produced by ObfuMiniCParser#unaryExpr.
+    def visitUnaryExpr(self, ctx:ObfuMiniCParser.UnaryExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by ObfuMiniCParser#relationalExpr.
-    def visitRelationalExpr(self, ctx:ObfuMiniCParser.RelationalExprContext):
+    # Visit a parse tree produced by ObfuMiniCParser#literalExpr.
+    def visitLiteralExpr(self, ctx:ObfuMiniCParser.LiteralExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by ObfuMiniCParser#addExpr.
-    def visitAddExpr(self, ctx:ObfuMiniCParser.AddExprContext):
+    # Visit a parse tree produced by ObfuMiniCParser#binaryExpr.
+    def visitBinaryExpr(self, ctx:ObfuMiniCParser.BinaryExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by ObfuMiniCParser#mulExpr.
-    def visitMulExpr(self, ctx:ObfuMiniCParser.MulExprContext):
+    # Visit a parse tree produced by ObfuMiniCParser#callExpr.
+    def visitCallExpr(self, ctx:ObfuMiniCParser.CallExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by ObfuMiniCParser#unaryExpr.
-    def visitUnaryExpr(self, ctx:ObfuMiniCParser.UnaryExprContext):
+    # Visit a parse tree produced by ObfuMiniCParser#assignExpr.
+    def visitAssignExpr(self, ctx:ObfuMiniCParser.AssignExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by ObfuMiniCParser#primaryExpr.
-    def visitPrimaryExpr(self, ctx:ObfuMiniCParser.PrimaryExprContext):
+    # Visit a parse tree produced by ObfuMiniCParser#parenExpr.
+    def visitParenExpr(self, ctx:ObfuMiniCParser.ParenExprContext):
         return self.visitChildren(ctx)
 
 
@@ -0,0 +1,75 @@
+from obfuscator.ast import Function, Program
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.deadcode import DeadCodeInserter
+from obfuscator.expression_transform import ExpressionTransformer
+from obfuscator.incremental import parse_span, prescan_calls, split_definitions
+from obfuscator.inliner import FunctionInliner
+from obfuscator.name_obfuscator import NameObfuscator
+
+
+class StreamingPipeline:
+    """Runs the obfuscation stages one top-level definition at a time.
+
+    Each definition is parsed, transformed, generated and written out before
+    the next one is read, so memory holds a single Function plus whatever
+    whole-program state the stages carry: the NameObfuscator's name_map and
+    the inliner's function table. The table only retains functions the
+    pre-scan saw being called.
+
+    A call can only be inlined once its callee has been processed, so only
+    callees defined before their caller are inlined; calls to a function
+    defined later are left as calls, where run_pipeline would inline them
+    too. ObfuMiniC has no prototypes, and callees usually come first, as
+    C without implicit declarations requires. Each stage keeps a single
+    instance across definitions, so the counters that name labels and
+    temporaries keep advancing as before. Random choices in rename/dead
+    are drawn in a different order, so those outputs differ from a
+    run_pipeline run with the same seed.
+    """
+
+    def __init__(self, stages):
+        self.renamer = NameObfuscator() if "rename" in stages else None
+        self.dead = DeadCodeInserter() if "dead" in stages else None
+        self.expr = ExpressionTransformer() if "expr" in stages else None
+        self.flattener = ControlFlowFlattener() if "flatten" in stages else None
+        self.inliner = FunctionInliner(Program([])) if "inline" in stages else None
+        self.called = set()
+        self.functions = 0
+
+    def run(self, text: str, out) -> None:
+        self.called = prescan_calls(text) if self.inliner else set()
+        first = True
+        for start, end in split_definitions(text):
+            for func in parse_span(text, start, end).functions:
+                code = self.process(func)
+                out.write(code if first else "\n" + code)
+                first = False
+                self.functions += 1
+
+    def process(self, func: Function) -> str:
+        original_name = func.name
+        program = Program([func])
+        if self.renamer:
+            self.renamer.obfuscate(program)
+        if self.dead:
+            self.dead.insert(program)
+        if self.expr:
+            self.expr.transform(program)
+        if self.flattener:
+            self.flattener.flatten(program)
+        func = program.functions[0]
+        if self.inliner:
+            if original_name in self.called:
+                self.inliner.function_map[func.name] = func
+            self.inliner.inline_function(func)
+        return CodeGenerator().generate(program)
+
+
+def run_streaming(input_path: str, output_path: str, stages) -> StreamingPipeline:
+    pipeline = StreamingPipeline(stages)
+    with open(input_path, encoding="utf-8") as f:
+        text = f.read()
+    with open(output_path, "w") as out:
+        pipeline.run(text, out)
+    return pipeline
@@ -0,0 +1,166 @@
+"""Per-function index of where each identifier occurs.
+
+symbol_index(func) walks a function once and records, for every name:
+
+    declarations  the Function, Parameter and VariableDecl nodes naming it
+    variables     its Variable nodes, as (holder, key) slots: the parent
+                  node and field name, or the list and index, holding it
+    targets       the Assignments whose target is the name as a string
+    calls         the FuncCall nodes calling it
+    scans         its Scan arguments, as (args list, index) slots
+    returns       the Return nodes returning it directly
+
+Each dict is ordered by first occurrence in a preorder walk of the
+statements, so declarations come in the order a renamer meets them.
+Variables are shared between parents (see LeafInterner), which is why
+they are indexed by the slot holding them rather than by node.
+
+The index is memoized on the Function and dropped by
+obfuscator.ast.invalidate(func), which every pass calls before changing
+a function, so it is rebuilt the next time it is asked for. rename()
+keeps it current, so renaming names through it costs time in the number
+of their occurrences, not in the size of the function.
+"""
+
+from obfuscator.ast import *
+
+
+class _Sites(dict):
+    """Maps names to the list of their sites, made on first use."""
+
+    def __missing__(self, name):
+        sites = self[name] = []
+        return sites
+
+
+class SymbolIndex:
+    def __init__(self):
+        self.declarations = _Sites()
+        self.variables = _Sites()
+        self.targets = _Sites()
+        self.calls = _Sites()
+        self.scans = _Sites()
+        self.returns = _Sites()
+
+    @classmethod
+    def build(cls, func: Function) -> "SymbolIndex":
+        index = cls()
+        declarations = index.declarations
+        variables = index.variables
+        fields = CHILD_FIELDS
+        stack = [func]
+        while stack:
+            node = stack.pop()
+            node_class = type(node)
+            if node_class is FuncCall:
+                index.calls[node.name].append(node)
+            elif node_class is VariableDecl or node_class is Parameter:
+                declarations[node.name].append(node)
+            elif node_class is Assignment:
+                if type(node.target) is str:
+                    index.targets[node.target].append(node)
+            elif node_class is Scan:
+                for i, arg in enumerate(node.args):
+                    if type(arg) is str:
+                        index.scans[arg].append((node.args, i))
+            elif node_class is Return:
+                if type(node.value) is Variable:
+                    index.returns[node.value.name].append(node)
+            elif isinstance(node, Function):
+                declarations[node.name].append(node)
+
+            # Children are pushed last first, so they are popped in order
+            children = []
+            for name in fields[node_class]:
+                value = getattr(node, name)
+                if type(value) is Variable:
+                    variables[value.name].append((node, name))
+                elif type(value) is list:
+                    for i, item in enumerate(value):
+                        if type(item) is Variable:
+                            variables[item.name].append((value, i))
+                        elif fields[type(item)] is not None:
+                            children.append(item)
+                elif fields[type(value)] is not None:
+                    children.append(value)
+            children.reverse()
+            stack += children
+        return index
+
+    def names(self):
+        """Every name in the index."""
+        return (
+            self.declarations.keys()
+            | self.variables.keys()
+            | self.targets.keys()
+            | self.calls.keys()
+            | self.scans.keys()
+        )
+
+    def local_names(self):
+        """Names of the function's local variables: those declared in its
+        body, and any other name used as a variable."""
+        declared = {
+            name
+            for name, nodes in self.declarations.items()
+            if any(type(node) is VariableDecl for node in nodes)
+        }
+        return declared | self.variables.keys()
+
+    def rename(self, name_map, leaves=None) -> None:
+        """Renames every occurrence of each name in name_map to its value,
+        and moves the sites to the new names. Variables are replaced, not
+        modified, with ones from leaves (a LeafInterner) if given.
+
+        Sites are taken out before any is renamed, so a name that another
+        is renamed to is not renamed again.
+        """
+        tables = (
+            self.declarations,
+            self.variables,
+            self.targets,
+            self.calls,
+            self.scans,
+            self.returns,
+        )
+        moves = []
+        for old in self.names():
+            new = name_map.get(old, old)
+            if new != old:
+                moves.append((new, [table.pop(old, None) for table in tables]))
+        for new, (declarations, variables, targets, calls, scans, returns) in moves:
+            if declarations:
+                for node in declarations:
+                    node.name = new
+                self.declarations[new] += declarations
+            if variables:
+                variable = leaves.variable(new) if leaves else Variable(new)
+                for holder, key in variables:
+                    if type(holder) is list:
+                        holder[key] = variable
+                    else:
+                        setattr(holder, key, variable)
+                self.variables[new] += variables
+            if targets:
+                for assignment in targets:
+                    assignment.target = new
+                self.targets[new] += targets
+            if calls:
+                for call in calls:
+                    call.name = new
+                self.calls[new] += calls
+            if scans:
+                for args, i in scans:
+                    args[i] = new
+                self.scans[new] += scans
+            if returns:
+                self.returns[new] += returns
+
+
+def symbol_index(func: Function) -> SymbolIndex:
+    """func's symbol index, built on first use and memoized until
+    obfuscator.ast.invalidate(func)."""
+    index = getattr(func, "_symbols", None)
+    if index is None:
+        index = func._symbols = SymbolIndex.build(func)
+    return index
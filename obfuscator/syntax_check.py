@@ -0,0 +1,91 @@
+from antlr4 import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from obfuscator.fast_lexer import ParseError
+from obfuscator.fast_parser import FastParser
+from obfuscator.frontend import LEXERS
+from obfuscator.input_stream import MappedFileStream
+from obfuscator.parser.ObfuMiniCParser import ObfuMiniCParser
+
+# Parsers that can check syntax without building an AST first
+SYNTAX_PARSERS = ("antlr", "fast")
+
+
+class Diagnostic:
+    def __init__(self, path: str, line: int, column: int, message: str):
+        self.path = path
+        self.line = line
+        self.column = column
+        self.message = message
+
+    def __str__(self):
+        return f"{self.path}:{self.line}:{self.column}: {self.message}"
+
+
+class DiagnosticCollector(ErrorListener):
+    """Error listener that records syntax errors instead of printing them."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.diagnostics = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.diagnostics.append(Diagnostic(self.path, line, column, msg))
+
+
+def _check_antlr(input_path: str, lexer: str):
+    collector = DiagnosticCollector(input_path)
+    with MappedFileStream(input_path) as input_stream:
+        token_source = LEXERS[lexer](input_stream)
+        token_source.removeErrorListeners()
+        token_source.addErrorListener(collector)
+        stream = CommonTokenStream(token_source)
+        stream.fill()
+
+        parser = ObfuMiniCParser(stream)
+        parser.removeErrorListeners()
+        parser.buildParseTrees = False
+        parser._errHandler = BailErrorStrategy()
+        # SLL is exact for valid input; a failure there is confirmed with LL
+        for mode in (PredictionMode.SLL, PredictionMode.LL):
+            parser._interp.predictionMode = mode
+            try:
+                parser.compilationUnit()
+                return collector.diagnostics
+            except ParseCancellationException as e:
+                cause = e.args[0]
+            parser.reset()
+        # Bail-out skips reporting, so describe the error the usual way
+        parser.addErrorListener(collector)
+        DefaultErrorStrategy().reportError(parser, cause)
+    return collector.diagnostics
+
+
+def _check_fast(input_path: str):
+    with open(input_path, encoding="utf-8") as f:
+        text = f.read()
+    try:
+        FastParser(text).parse()
+    except ParseError as e:
+        return [Diagnostic(input_path, e.line, e.column, e.message)]
+    return []
+
+
+def check_syntax(input_path: str, parser: str = "antlr", lexer: str = "antlr"):
+    """Lexes and parses a file, stopping at the first syntax error.
+
+    The antlr parser runs with parse tree construction switched off and no
+    AST is built; the fast parser has no such mode and builds its AST in
+    passing. Returns the Diagnostics, which with the antlr parser also
+    include every lexer error; an empty list means the file is valid.
+    """
+    if parser not in SYNTAX_PARSERS:
+        raise ValueError(f"Syntax-only checks are not supported by {parser}")
+    try:
+        if parser == "antlr":
+            return _check_antlr(input_path, lexer)
+        return _check_fast(input_path)
+    except UnicodeDecodeError as e:
+        return [Diagnostic(input_path, 0, 0, f"not valid UTF-8 at byte {e.start}")]
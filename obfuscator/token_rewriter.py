@@ -0,0 +1,339 @@
+from obfuscator.fast_lexer import ParseError, tokenize, ID, CHAR, STRING, EOF
+from obfuscator.name_obfuscator import NameObfuscator
+
+TYPE_NAMES = {"int", "char", "bool"}
+
+# Adjacent characters that would lex as one token or start a comment, here
+# or in C (the output is also compiled by gcc)
+_GLUED = {"||", "&&", "==", "!=", "<=", ">=", "//", "/*", "++", "--"}
+
+
+def _word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+class TokenRewriter:
+    """Edits a token stream in place, in the manner of ANTLR's
+    TokenStreamRewriter: tokens are replaced by index and the text is
+    rebuilt from the original source around them.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.replacements = {}
+
+    def replace(self, index: int, text: str) -> None:
+        self.replacements[index] = text
+
+    def get_text(self) -> str:
+        """The source with replacements applied; layout and comments kept."""
+        pieces = []
+        pos = 0
+        for index in sorted(self.replacements):
+            _, text, _, _, start = self.tokens[index]
+            pieces.append(self.text[pos:start])
+            pieces.append(self.replacements[index])
+            pos = start + len(text)
+        pieces.append(self.text[pos:])
+        return "".join(pieces)
+
+    def get_minified_text(self) -> str:
+        """The tokens with replacements applied, without whitespace and
+        comments; a space is kept only where two tokens would merge."""
+        pieces = []
+        prev = ""
+        replacements = self.replacements
+        for index, tok in enumerate(self.tokens):
+            if tok[0] == EOF:
+                break
+            text = replacements.get(index, tok[1])
+            if prev and (
+                _word_char(prev[-1])
+                and _word_char(text[0])
+                or prev[-1] + text[0] in _GLUED
+            ):
+                pieces.append(" ")
+            pieces.append(text)
+            prev = text
+        return "".join(pieces)
+
+
+class TokenRenamer:
+    """Renames identifiers by rewriting ID tokens, without building an AST.
+
+    A recursive-descent walk over the tokens follows NameObfuscator's
+    rules, drawing names from a NameObfuscator so the same random state
+    gives the same names. Each function is walked once to find the names
+    it declares (its own name unless it is main, its parameters and its
+    variables, in source order), which get new names unless the file-wide
+    name map already has them. Then every identifier in the function whose
+    name is in the map is renamed, as NameObfuscator renames every site in
+    its symbol index. The one exception is an assignment target of more
+    than one token, which the AST keeps as text. Top-level variable
+    declarations are dropped by the AST frontends and left alone here.
+    Regenerating the rewritten source from its AST therefore gives the AST
+    path's output byte for byte.
+    """
+
+    def __init__(self, rewriter: TokenRewriter, obfuscator: NameObfuscator = None):
+        self.rewriter = rewriter
+        self.tokens = rewriter.tokens
+        self.obfuscator = obfuscator or NameObfuscator()
+        self.closing = self._match_parens()
+        self.pos = 0
+        # Per function: indexes of declared names, and of identifiers that
+        # are not renamed
+        self.declared = []
+        self.kept = set()
+
+    def rename(self) -> None:
+        tokens = self.tokens
+        while tokens[self.pos][0] != EOF:
+            if self.pos + 2 < len(tokens) and tokens[self.pos + 2][1] == "(":
+                self._function()
+            else:
+                # Dropped by the AST frontends, so never renamed there
+                self.pos = self._expression_end({";"})
+                self._expect(";")
+
+    def _match_parens(self):
+        closing = {}
+        stack = []
+        for i, tok in enumerate(self.tokens):
+            if tok[1] == "(":
+                stack.append(i)
+            elif tok[1] == ")":
+                if not stack:
+                    self._error("unbalanced ')'", tok)
+                closing[stack.pop()] = i
+        if stack:
+            self._error("unclosed '('", self.tokens[stack[-1]])
+        return closing
+
+    def _expect(self, text):
+        tok = self.tokens[self.pos]
+        if tok[1] != text or tok[0] == STRING or tok[0] == CHAR:
+            self._error(f"expected '{text}'", tok)
+        self.pos += 1
+        return tok
+
+    def _error(self, message, tok):
+        raise ParseError(f"{message} at '{tok[1]}'", tok[2], tok[3])
+
+    # === Declarations and statements ===
+
+    def _function(self):
+        start = self.pos
+        self.declared = []
+        self.kept = set()
+        self.pos += 1
+        name = self.tokens[self.pos][1]
+        self.declared.append(self.pos)
+        self.pos += 1
+        self._expect("(")
+        while self.tokens[self.pos][1] in TYPE_NAMES:
+            self.declared.append(self.pos + 1)
+            self.pos += 2
+            if self.tokens[self.pos][1] != ",":
+                break
+            self.pos += 1
+        self._expect(")")
+        self._block()
+
+        obfuscator = self.obfuscator
+        name_map = obfuscator.name_map
+        for index in self.declared:
+            declared = self.tokens[index][1]
+            if declared not in name_map and not (declared == "main" == name):
+                name_map[declared] = obfuscator.generate_name()
+        for i in range(start, self.pos):
+            tok = self.tokens[i]
+            if tok[0] == ID and i not in self.kept:
+                new_name = name_map.get(tok[1])
+                if new_name is not None and new_name != tok[1]:
+                    self.rewriter.replace(i, new_name)
+
+    def _block(self):
+        self._expect("{")
+        while self.tokens[self.pos][1] != "}":
+            if self.tokens[self.pos][0] == EOF:
+                self._error("expected '}'", self.tokens[self.pos])
+            if self.tokens[self.pos][1] in TYPE_NAMES:
+                self._var_decl()
+            else:
+                self._statement()
+        self.pos += 1
+
+    def _var_decl(self):
+        self.pos += 1
+        while True:
+            self.declared.append(self.pos)
+            self.pos += 1
+            if self.tokens[self.pos][1] == "=":
+                self.pos += 1
+                self._expression({",", ";"})
+            if self.tokens[self.pos][1] != ",":
+                break
+            self.pos += 1
+        self._expect(";")
+
+    def _statement(self):
+        word = self.tokens[self.pos][1]
+        if word == "{":
+            self._block()
+        elif word == "if":
+            self.pos += 1
+            self._condition()
+            self._statement()
+            if self.tokens[self.pos][1] == "else":
+                self.pos += 1
+                self._statement()
+        elif word == "while":
+            self.pos += 1
+            self._condition()
+            self._statement()
+        elif word == "for":
+            self.pos += 1
+            self._expect("(")
+            self._expression({";"})
+            self._expect(";")
+            self._expression({";"})
+            self._expect(";")
+            self._expression({")"})
+            self._expect(")")
+            self._statement()
+        elif word == "return":
+            self.pos += 1
+            self._expression({";"})
+            self._expect(";")
+        elif word == "printf":
+            self.pos += 1
+            self._expect("(")
+            self.pos += 1  # format string
+            while self.tokens[self.pos][1] == ",":
+                self.pos += 1
+                self._expression({",", ")"})
+            self._expect(")")
+            self._expect(";")
+        elif word == "scanf":
+            self.pos += 1
+            self._expect("(")
+            self.pos += 1  # format string
+            while self.tokens[self.pos][1] == ",":
+                self.pos += 1
+                if self.tokens[self.pos][1] == "&":
+                    self.pos += 1
+                self.pos += 1
+            self._expect(")")
+            self._expect(";")
+        elif word == "switch":
+            self.pos += 1
+            self._condition()
+            self._switch_body()
+        else:
+            self._expression({";"})
+            self._expect(";")
+
+    def _condition(self):
+        self._expect("(")
+        self._expression({")"})
+        self._expect(")")
+
+    def _switch_body(self):
+        self._expect("{")
+        while self.tokens[self.pos][1] != "}":
+            tok = self.tokens[self.pos]
+            if tok[0] == EOF:
+                self._error("expected '}'", tok)
+            if tok[1] == "case":
+                self.pos += 2  # the literal
+            else:
+                self._expect("default")
+            self._expect(":")
+            while self.tokens[self.pos][1] not in ("case", "default", "}"):
+                self._statement()
+        self.pos += 1
+
+    # === Expressions ===
+
+    def _expression(self, stops):
+        end = self._expression_end(stops)
+        self._keep_targets(self.pos, end)
+        self.pos = end
+
+    def _expression_end(self, stops) -> int:
+        i = self.pos
+        tokens = self.tokens
+        while True:
+            tok = tokens[i]
+            if tok[1] in stops:
+                return i
+            if tok[1] == "(":
+                i = self.closing[i]
+            elif tok[0] == EOF or tok[1] in ("{", "}", ";", ")"):
+                self._error("unexpected token", tok)
+            i += 1
+
+    def _assignments(self, start: int, end: int):
+        """Indexes of the '=' tokens outside parentheses in [start, end)."""
+        found = []
+        i = start
+        while i < end:
+            text = self.tokens[i][1]
+            if text == "(":
+                i = self.closing[i]
+            elif text == "=":
+                found.append(i)
+            i += 1
+        return found
+
+    def _keep_targets(self, start: int, end: int) -> None:
+        # '=' is right-associative and binds loosest, so every operand but
+        # the last is an assignment target, which the AST keeps as text:
+        # renamed if it is one identifier, kept as it is otherwise
+        for eq in self._assignments(start, end):
+            if eq - start != 1:
+                self.kept.update(range(start, eq))
+            start = eq + 1
+        tokens = self.tokens
+        i = start
+        while i < end:
+            if tokens[i][1] == "(":
+                close = self.closing[i]
+                # Call arguments, or one parenthesized expression
+                arg_start = i + 1
+                j = arg_start
+                while j < close:
+                    text = tokens[j][1]
+                    if text == "(":
+                        j = self.closing[j]
+                    elif text == ",":
+                        self._keep_targets(arg_start, j)
+                        arg_start = j + 1
+                    j += 1
+                self._keep_targets(arg_start, close)
+                i = close
+            i += 1
+
+
+def rewrite_tokens(
+    text: str, rename: bool = True, minify: bool = False, reserved=()
+) -> str:
+    """Renames and/or minifies source text at the token level.
+
+    The fast path for runs whose only stage is renaming: no AST is built
+    and no code is regenerated, so the source keeps its layout and
+    comments unless minify drops them.
+    """
+    rewriter = TokenRewriter(text)
+    if rename:
+        TokenRenamer(rewriter, NameObfuscator(reserved)).rename()
+    if minify:
+        return rewriter.get_minified_text()
+    return rewriter.get_text()
+
+
+def minify(code: str) -> str:
+    """Drops whitespace and comments from generated code."""
+    return TokenRewriter(code).get_minified_text()
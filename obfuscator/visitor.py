@@ -0,0 +1,167 @@
+from obfuscator.ast import CHILD_FIELDS, iter_children
+
+
+def dispatch(prefix: str, fallback: str):
+    """Makes a method that calls self.<prefix><ClassName>(node, *args).
+
+    The handler is the one named after the class of node or, failing that,
+    the nearest base class in its MRO (so RawFunction uses a Function
+    handler unless it has its own); self.<fallback> is called when there is
+    none. The handler found for each (visitor class, node class) pair is
+    cached, so a dispatch costs two dict lookups whatever the class, where
+    an isinstance chain pays one check per earlier branch.
+    """
+    tables = _HandlerTables(prefix, fallback)
+
+    def method(self, node, *args):
+        return tables[type(self)][type(node)](self, node, *args)
+
+    method.__doc__ = f"Calls self.{prefix}<ClassName>(node, ...) or self.{fallback}."
+    return method
+
+
+def walk(prefix: str, fallback: str):
+    """Like dispatch, but for handlers that return the nodes to visit next.
+
+    A handler returns an iterable of child nodes (a list, a tuple or, when
+    it has work to do between or after them, a generator), or None when
+    there is nothing below it. The children are dispatched in order with
+    the same extra args, each one's own children before the next. Pending
+    iterators are kept on an explicit stack instead of Python frames, so
+    the depth of a tree is not limited by the recursion limit.
+    """
+    tables = _HandlerTables(prefix, fallback)
+
+    def method(self, node, *args):
+        table = tables[type(self)]
+        children = table[type(node)](self, node, *args)
+        if children is None:
+            return
+        stack = [iter(children)]
+        while stack:
+            for child in stack[-1]:
+                children = table[type(child)](self, child, *args)
+                if children is not None:
+                    stack.append(iter(children))
+                    break
+            else:
+                stack.pop()
+
+    method.__doc__ = f"Walks node with self.{prefix}<ClassName>(node, ...)."
+    return method
+
+
+def rewrite(prefix: str, fallback: str):
+    """Like walk, but for handlers that return the node to put in place of
+    the one they are given (that node itself to keep it).
+
+    The tree is rewritten bottom-up, left to right: a handler sees its
+    node's child fields already holding their replacements, and the method
+    returns what replaces the root. Nodes are found through the child
+    fields declared in obfuscator.ast, and a node held in several fields
+    (a shared leaf, a SwitchCase's label) is handled once in each. Every
+    node is listed, with an explicit stack, before any handler runs, so
+    the nodes a handler returns are not rewritten again, and the depth of
+    a tree is not limited by the recursion limit.
+    """
+    tables = _HandlerTables(prefix, fallback)
+
+    def method(self, node, *args):
+        table = tables[type(self)]
+        fields = CHILD_FIELDS
+        # (node, holder, key) in preorder, last child first: reversed, it
+        # has every node after its children and the children in order
+        order = []
+        stack = [(node, None, None)]
+        while stack:
+            item = stack.pop()
+            order.append(item)
+            parent = item[0]
+            for name in fields[type(parent)] or ():
+                value = getattr(parent, name)
+                if type(value) is list:
+                    for i, child in enumerate(value):
+                        if fields[type(child)] is not None:
+                            stack.append((child, value, i))
+                elif fields[type(value)] is not None:
+                    stack.append((value, parent, name))
+        for child, holder, key in reversed(order):
+            new = table[type(child)](self, child, *args)
+            if new is child:
+                continue
+            if holder is None:
+                node = new
+            elif type(holder) is list:
+                holder[key] = new
+            else:
+                setattr(holder, key, new)
+        return node
+
+    method.__doc__ = f"Rewrites node with self.{prefix}<ClassName>(node, ...)."
+    return method
+
+
+class _HandlerTables(dict):
+    """Maps visitor classes to their _HandlerTable, made on first use."""
+
+    def __init__(self, prefix: str, fallback: str):
+        self.prefix = prefix
+        self.fallback = fallback
+
+    def __missing__(self, visitor_class):
+        table = self[visitor_class] = _HandlerTable(
+            visitor_class, self.prefix, self.fallback
+        )
+        return table
+
+
+class _HandlerTable(dict):
+    """Maps node classes to a visitor class's handlers, found on first use."""
+
+    def __init__(self, visitor_class, prefix: str, fallback: str):
+        self.visitor_class = visitor_class
+        self.prefix = prefix
+        self.fallback = fallback
+
+    def __missing__(self, node_class):
+        handler = self[node_class] = _find_handler(
+            self.visitor_class, node_class, self.prefix, self.fallback
+        )
+        return handler
+
+
+def _find_handler(visitor_class, node_class, prefix: str, fallback: str):
+    for cls in node_class.__mro__:
+        handler = getattr(visitor_class, prefix + cls.__name__, None)
+        if handler is not None:
+            return handler
+    return getattr(visitor_class, fallback)
+
+
+class NodeVisitor:
+    """Walks a tree, calling visit_<ClassName>(node) for each node.
+
+    Nodes without a handler go to generic_visit, which visits their
+    children. A handler that should descend further returns the children
+    to visit (see walk), e.g. self.generic_visit(node).
+    """
+
+    visit = walk("visit_", "generic_visit")
+
+    def generic_visit(self, node):
+        return iter_children(node)
+
+
+class NodeTransformer:
+    """Rewrites a tree, replacing each node with what visit_<ClassName>(node)
+    returns (see rewrite); visit(tree) returns the new root.
+
+    Nodes without a handler go to generic_visit, which keeps them.
+    Replacing a node, rather than changing it, is what leaves and other
+    shared nodes need (see obfuscator.leaves).
+    """
+
+    visit = rewrite("visit_", "generic_visit")
+
+    def generic_visit(self, node):
+        return node
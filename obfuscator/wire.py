@@ -0,0 +1,397 @@
+"""A compact binary encoding of Programs for shipping between processes.
+
+Layout, with every integer in the header an unsigned LEB128 varint:
+
+    magic b"OMCW", version byte
+    string table: count, each string's length in characters, the byte
+        length of their UTF-8 concatenation, then the concatenation
+    class table: count, then each class's name (its length and ASCII
+        bytes) and field count
+    constant table: count, then each entry: 0 and a zigzag-encoded int,
+        1 for the next string of the string table, or 2 + a class index
+        and that node's fields
+    function table: count, then each function's name (a constant index),
+        the width of its codes and the byte length of its segment
+    the segments, in order
+
+A segment is an array of signed little-endian codes, all 1, 2 or 4 bytes
+wide as the function table says. It holds one Function's nodes other than
+the constants in postorder, each a class index followed by its fields in
+__slots__ order, and before each node the lists in its fields, each a -1,
+its item count and the items. Decoding appends every node and list to the
+constant table in turn, so each field is one index into it: n >= 0 is the
+nth constant and -n the node or list n places back.
+
+The constant table starts with None, False and True, and holds the
+strings, the ints and the Variable and Literal leaves, each written once
+for the whole program, so decoded functions share the leaves as they
+would after a parse with LeafInterner. Nodes are written once however
+often they are referenced, so shared subtrees stay shared. References
+only point back within a segment, so each function can be decoded on its
+own: WireProgram reads a buffer in place and only decodes the functions
+asked for.
+
+Class names are stored in the data, so adding node classes does not
+change the encoding; WIRE_VERSION is bumped when these rules change.
+"""
+
+import sys
+from array import array
+from itertools import islice
+
+from obfuscator import ast
+from obfuscator.ast import Function, Literal, Program, Variable
+
+MAGIC = b"OMCW"
+WIRE_VERSION = 2
+
+_PRESET_VALUES = (None, False, True)
+_LIST = -1
+
+# Array typecodes of each code width
+_CODE_TYPES = {1: "b", 2: "h", 4: "i"}
+
+# Every class in obfuscator.ast that has fields, by name
+_NODE_CLASSES = {
+    cls.__name__: cls
+    for cls in vars(ast).values()
+    if isinstance(cls, type)
+    and cls.__module__ == ast.__name__
+    and "__init__" in vars(cls)
+    and vars(cls).get("__slots__")
+}
+
+
+class _FieldTable(dict):
+    """Maps classes to the obfuscator.ast class they are encoded as (the
+    nearest in the MRO, so RawFunction is written as a Function) and its
+    fields, or None for values that are not nodes."""
+
+    def __missing__(self, cls):
+        entry = None
+        for base in cls.__mro__:
+            if _NODE_CLASSES.get(base.__name__) is base:
+                entry = base, base.__slots__
+                break
+        self[cls] = entry
+        return entry
+
+
+_FIELDS = _FieldTable()
+
+
+class _Table(dict):
+    """Numbers keys in order of first use."""
+
+    def __missing__(self, key):
+        index = self[key] = len(self)
+        return index
+
+
+def _varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf, pos: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _pack(codes):
+    """The narrowest width that holds every code, and the codes packed."""
+    low = min(codes, default=0)
+    high = max(codes, default=0)
+    width = 1 if -0x80 <= low and high < 0x80 else 2
+    if not (-0x8000 <= low and high < 0x8000):
+        width = 4
+    packed = array(_CODE_TYPES[width], codes)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return width, packed.tobytes()
+
+
+class _Encoder:
+    def __init__(self):
+        self.strings = []
+        self.classes = _Table()
+        self.constants = _Table()  # Keys of constant table entries
+        self.entries = bytearray()
+        # id(value) -> code, for the strings, leaves and ints already seen
+        # (all held by the tree being encoded, so their ids stay theirs)
+        self.codes = {}
+        for value in _PRESET_VALUES:
+            self.codes[id(value)] = self.constants[type(value), value]
+
+    def value_code(self, value) -> int:
+        """The code of a leaf or constant, adding it to the constant table."""
+        cls = type(value)
+        if cls is Variable or cls is Literal:
+            field = value.name if cls is Variable else value.value
+            field_code = self.codes.get(id(field))
+            if field_code is None:
+                field_code = self.value_code(field)
+            key = (cls, field_code)
+        elif cls is str or cls is int:
+            key = (cls, value)
+        else:
+            raise TypeError(f"cannot encode {cls.__name__} values")
+        code = self.constants.get(key)
+        if code is None:
+            code = self.constants[key]
+            if cls is str:
+                self.strings.append(value)
+                self.entries.append(1)
+            elif cls is int:
+                self.entries.append(0)
+                _varint(self.entries, value << 1 if value >= 0 else ~value << 1 | 1)
+            else:
+                _varint(self.entries, 2 + self.classes[cls])
+                _varint(self.entries, key[1])
+        self.codes[id(value)] = code
+        return code
+
+    def function(self, func) -> list:
+        fields = _FIELDS
+        classes = self.classes
+        codes = self.codes
+
+        # Nodes other than leaves in preorder, with their class and field
+        # values, so in reverse every node comes after its children
+        order = []
+        stack = [func]
+        while stack:
+            node = stack.pop()
+            cls = type(node)
+            if cls is Variable or cls is Literal:
+                continue
+            entry = fields[cls]
+            if entry is None:
+                raise TypeError(f"cannot encode {cls.__name__} nodes")
+            values = [getattr(node, name) for name in entry[1]]
+            order.append((node, entry[0], values))
+            for value in values:
+                if type(value) is list:
+                    stack.extend(v for v in value if fields[type(v)] is not None)
+                elif fields[type(value)] is not None:
+                    stack.append(value)
+
+        out = []
+        append = out.append
+        index = {}  # id(node or list) -> position in the segment
+        for node, cls, values in reversed(order):
+            if id(node) in index:
+                continue  # Shared, and reached more than once
+            for value in values:
+                if type(value) is list:
+                    append(_LIST)
+                    append(len(value))
+                    for item in value:
+                        code = codes.get(id(item))
+                        if code is None:
+                            code = index.get(id(item))
+                            if code is None:
+                                code = self.value_code(item)
+                            else:
+                                code -= len(index)
+                        append(code)
+                    index[id(value)] = len(index)
+            append(classes[cls])
+            for value in values:
+                code = codes.get(id(value))
+                if code is None:
+                    code = index.get(id(value))
+                    if code is None:
+                        code = self.value_code(value)
+                    else:
+                        code -= len(index)
+                append(code)
+            index[id(node)] = len(index)
+        return out
+
+
+def dumps(program: Program) -> bytes:
+    """Encodes program; see the module docstring for the layout."""
+    encoder = _Encoder()
+    segments = [_pack(encoder.function(func)) for func in program.functions]
+    # Names used by the function table go into the constant table before
+    # it is written
+    function_names = [encoder.value_code(func.name) for func in program.functions]
+
+    out = bytearray(MAGIC)
+    out.append(WIRE_VERSION)
+    strings = encoder.strings
+    _varint(out, len(strings))
+    for s in strings:
+        _varint(out, len(s))
+    blob = "".join(strings).encode("utf-8", "surrogatepass")
+    _varint(out, len(blob))
+    out += blob
+    _varint(out, len(encoder.classes))
+    for cls in encoder.classes:
+        _varint(out, len(cls.__name__))
+        out += cls.__name__.encode("ascii")
+        _varint(out, len(cls.__slots__))
+    _varint(out, len(encoder.constants) - len(_PRESET_VALUES))
+    out += encoder.entries
+    _varint(out, len(segments))
+    for name, (width, segment) in zip(function_names, segments):
+        _varint(out, name)
+        out.append(width)
+        _varint(out, len(segment))
+    for _, segment in segments:
+        out += segment
+    return bytes(out)
+
+
+class WireProgram:
+    """A Program encoded by dumps, decoded one function at a time.
+
+    data may be any bytes-like object; it is read through a memoryview
+    rather than copied. Only the tables are read up front, and each access
+    to a function decodes a new tree (sharing the leaves in the constant
+    table with every other function decoded from this object). Decoding
+    appends to the constant table for the time it takes, so one object
+    must not decode in two threads at once.
+    """
+
+    def __init__(self, data):
+        buf = memoryview(data).cast("B")
+        if bytes(buf[: len(MAGIC)]) != MAGIC:
+            raise ValueError("not an encoded program")
+        if buf[len(MAGIC)] != WIRE_VERSION:
+            raise ValueError(f"unsupported wire format version {buf[len(MAGIC)]}")
+        try:
+            self._read_tables(buf, len(MAGIC) + 1)
+        except IndexError:
+            raise ValueError("truncated encoded program") from None
+        if self._spans and self._spans[-1][2] > len(buf):
+            raise ValueError("truncated encoded program")
+        self._buf = buf
+
+    def _read_tables(self, buf, pos):
+        count, pos = _read_varint(buf, pos)
+        lengths = []
+        for _ in range(count):
+            length, pos = _read_varint(buf, pos)
+            lengths.append(length)
+        size, pos = _read_varint(buf, pos)
+        text = str(buf[pos : pos + size], "utf-8", "surrogatepass")
+        pos += size
+        strings = []
+        start = 0
+        for length in lengths:
+            strings.append(text[start : start + length])
+            start += length
+
+        count, pos = _read_varint(buf, pos)
+        self._classes = []
+        for _ in range(count):
+            size, pos = _read_varint(buf, pos)
+            name = str(buf[pos : pos + size], "ascii")
+            pos += size
+            n_fields, pos = _read_varint(buf, pos)
+            cls = _NODE_CLASSES.get(name)
+            if cls is None or len(cls.__slots__) != n_fields:
+                raise ValueError(f"unknown node class {name}")
+            self._classes.append((cls, n_fields))
+
+        count, pos = _read_varint(buf, pos)
+        table = self._table = list(_PRESET_VALUES)
+        next_string = iter(strings).__next__
+        for _ in range(count):
+            kind, pos = _read_varint(buf, pos)
+            if kind == 0:
+                n, pos = _read_varint(buf, pos)
+                table.append(~(n >> 1) if n & 1 else n >> 1)
+                continue
+            if kind == 1:
+                table.append(next_string())
+                continue
+            cls, n_fields = self._classes[kind - 2]
+            args = []
+            for _ in range(n_fields):
+                code, pos = _read_varint(buf, pos)
+                args.append(table[code])
+            table.append(cls(*args))
+        self._base = len(table)
+
+        count, pos = _read_varint(buf, pos)
+        self.names = []
+        layout = []
+        for _ in range(count):
+            name, pos = _read_varint(buf, pos)
+            width = buf[pos]
+            size, pos = _read_varint(buf, pos + 1)
+            if width not in _CODE_TYPES or size % width:
+                raise ValueError("corrupt function table")
+            self.names.append(table[name])
+            layout.append((_CODE_TYPES[width], size))
+        self._spans = []
+        for code_type, size in layout:
+            self._spans.append((code_type, pos, pos + size))
+            pos += size
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __getitem__(self, i: int) -> Function:
+        code_type, start, end = self._spans[i]
+        codes = array(code_type)
+        codes.frombytes(self._buf[start:end])
+        if sys.byteorder == "big":
+            codes.byteswap()
+        try:
+            return self._decode_function(codes)
+        except (IndexError, StopIteration, TypeError):
+            raise ValueError("corrupt encoded program") from None
+        finally:
+            del self._table[self._base :]
+
+    def function(self, name: str) -> Function:
+        """Decodes the first function called name."""
+        return self[self.names.index(name)]
+
+    def program(self) -> Program:
+        return Program([self[i] for i in range(len(self))])
+
+    def _decode_function(self, codes) -> Function:
+        # Lists come last in the class table, so a -1 finds them there
+        classes = self._classes + [(list, None)]
+        table = self._table
+        append = table.append
+        data = iter(codes)
+        next_code = data.__next__
+        # Most nodes have three fields or fewer: passing those one by one
+        # is far cheaper than building an argument tuple
+        for kind in data:
+            cls, n_fields = classes[kind]
+            if n_fields == 3:
+                append(cls(table[next_code()], table[next_code()], table[next_code()]))
+            elif n_fields == 2:
+                append(cls(table[next_code()], table[next_code()]))
+            elif n_fields == 1:
+                append(cls(table[next_code()]))
+            elif n_fields is None:
+                if kind != _LIST:
+                    raise ValueError("corrupt encoded program")
+                append([table[code] for code in islice(data, next_code())])
+            else:
+                append(cls(*[table[code] for code in islice(data, n_fields)]))
+        if len(table) == self._base or not isinstance(table[-1], Function):
+            raise ValueError("corrupt encoded program")
+        return table[-1]
+
+
+def loads(data) -> Program:
+    """Decodes a whole Program encoded by dumps."""
+    return WireProgram(data).program()
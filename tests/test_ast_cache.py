@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from obfuscator.ast_cache import ASTCache, dumps, loads
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.fast_parser import parse
+from benchmarks.bench_deep_nesting import chain_program
+from benchmarks.common import generate_program
+
+
+class ASTCacheTest(unittest.TestCase):
+    def assertSameCode(self, a, b):
+        self.assertEqual(CodeGenerator().generate(a), CodeGenerator().generate(b))
+
+    def test_round_trip(self):
+        program = parse(generate_program(20))
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ASTCache(directory)
+            key = cache.key(b"source", "fast")
+            self.assertIsNone(cache.get(key))
+            cache.put(key, program)
+            self.assertSameCode(cache.get(key), program)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_deep_expression(self):
+        program = parse(chain_program(3000))
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ASTCache(directory)
+            key = cache.key(b"source", "fast")
+            cache.put(key, program)
+            self.assertSameCode(cache.get(key), program)
+
+    def test_entries(self):
+        program = parse(generate_program(5))
+        ControlFlowFlattener().flatten(program)
+        data = dumps(program)
+        self.assertSameCode(loads(data), program)
+        self.assertSameCode(loads(data), loads(dumps(loads(data))))
+
+    def test_unreadable_entry_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ASTCache(directory)
+            key = cache.key(b"source", "fast")
+            cache.put(key, parse(generate_program(3)))
+            (name,) = os.listdir(directory)
+            path = os.path.join(directory, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            with open(path, "wb") as f:
+                f.write(data[: len(data) // 2])
+            self.assertIsNone(cache.get(key))
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_cli(*args):
+    return subprocess.run(
+        [sys.executable, "cli.py", *args], cwd=ROOT, capture_output=True, text=True
+    )
+
+
+class ParseErrorTest(unittest.TestCase):
+    def test_reported_as_diagnostic(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bad.mc")
+            with open(path, "w") as f:
+                f.write("int main() { int x = ; }\n")
+            output = os.path.join(directory, "out", "out.mc")
+            for options in (
+                ["--parser", "fast"],
+                ["--parser", "incremental"],
+                ["--stream"],
+            ):
+                with self.subTest(options=options):
+                    result = run_cli(*options, path, "-o", output)
+                    self.assertEqual(result.returncode, 1)
+                    self.assertEqual(
+                        result.stderr, f"{path}:1:21: expected expression at ';'\n"
+                    )
+
+    def test_antlr_reported_as_diagnostic(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bad.mc")
+            with open(path, "w") as f:
+                f.write("int main() { int x = ; }\n")
+            output = os.path.join(directory, "out", "out.mc")
+            for options in (
+                [],
+                ["--parser", "antlr-listener"],
+                ["--lexer", "fast"],
+                ["--jobs", "2"],
+            ):
+                with self.subTest(options=options):
+                    result = run_cli(*options, path, "-o", output)
+                    self.assertEqual(result.returncode, 1)
+                    self.assertTrue(result.stderr.startswith(f"{path}:1:21: "))
+            self.assertFalse(os.path.exists(output))
+
+    def test_unsupported_parser_is_a_usage_error(self):
+        for options in (["--syntax-only"], ["--jobs", "2"]):
+            with self.subTest(options=options):
+                result = run_cli(*options, "--parser", "incremental", "input/input.mc")
+                self.assertEqual(result.returncode, 2)
+                self.assertIn("not supported by the incremental parser", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import itertools
+import random
+import sys
+import unittest
+
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.fast_parser import parse
+from obfuscator.frontend import parse_antlr
+from obfuscator.inliner import FunctionInliner
+from benchmarks.bench_deep_nesting import PASSES, chain_program, nested_loops
+from benchmarks.common import generated_file
+
+# Deeper than the recursion limit, so a walk that recurses once per level
+# fails
+DEPTH = sys.getrecursionlimit() * 3
+
+
+class DeepNestingTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        ControlFlowFlattener.id_counter = itertools.count()
+
+    def test_frontends_agree(self):
+        program = parse(chain_program(DEPTH))
+        with generated_file(DEPTH, chain_program) as path:
+            reference = parse_antlr(path)
+        code = CodeGenerator().generate(program)
+        self.assertEqual(code, CodeGenerator().generate(reference))
+        nested = "(" * (DEPTH - 1) + "a" + " + a)" * (DEPTH - 1)
+        self.assertIn(f"    return {nested};", code.splitlines())
+
+    def test_passes_on_a_chain(self):
+        program = parse(chain_program(DEPTH))
+        for label, run in PASSES:
+            with self.subTest(label):
+                run(program)
+        CodeGenerator().generate(program)
+
+    def test_passes_on_nested_loops(self):
+        program = nested_loops(DEPTH)
+        for label, run in PASSES:
+            with self.subTest(label):
+                run(program)
+        CodeGenerator().generate(program)
+
+    def test_inline_a_deep_callee(self):
+        program = parse(chain_program(DEPTH))
+        FunctionInliner(program).inline()
+        main = program.functions[-1]
+        self.assertFalse(
+            any(
+                isinstance(stmt, VariableDecl) and isinstance(stmt.init_expr, FuncCall)
+                for stmt in main.body
+            )
+        )
+        CodeGenerator().generate(program)
+
+    def test_clone(self):
+        program = nested_loops(DEPTH)
+        copy = program.clone()
+        self.assertEqual(
+            CodeGenerator().generate(copy), CodeGenerator().generate(program)
+        )
+        loop, original = copy.functions[0].body[1], program.functions[0].body[1]
+        while isinstance(loop, WhileStmt):
+            self.assertIsNot(loop, original)
+            self.assertIs(loop.condition.left, original.condition.left)
+            loop, original = loop.body.items[0], original.body.items[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
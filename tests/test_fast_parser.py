@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from obfuscator.fast_lexer import ParseError
+from obfuscator.frontend import parse_antlr, parse_fast
+from benchmarks.common import generated_file, input_files
+
+# Invalid sources, with where and why the fast parser stops
+SYNTAX_ERRORS = [
+    ("int main() { int x = ; }\n", 1, 21, "expected expression at ';'"),
+    ("int main() { return 1 }\n", 1, 22, "expected ';' at '}'"),
+    ("int main() {\n  x = (1 + 2;\n}\n", 2, 12, "expected ')' at ';'"),
+    ("int f(int a, ) { return a; }\n", 1, 13, "expected type at ')'"),
+    ("int main() { if x { } }\n", 1, 16, "expected '(' at 'x'"),
+    ('int main() { printf("%d", ); }\n', 1, 26, "expected expression at ')'"),
+    ("int main() { while (1) { }\n", 2, 0, "expected '}' at '<EOF>'"),
+    ("int main() {\n    int y = 1 # 2;\n}\n", 2, 14, "token recognition error at: '#'"),
+]
+
+
+class ConformanceTest(unittest.TestCase):
+    def assertSameAST(self, path):
+        self.assertEqual(repr(parse_fast(path)), repr(parse_antlr(path)))
+
+    def test_inputs(self):
+        for path in input_files():
+            with self.subTest(path=path):
+                self.assertSameAST(path)
+
+    def test_generated_program(self):
+        with generated_file(50) as path:
+            self.assertSameAST(path)
+
+    def test_syntax_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bad.mc")
+            for text, line, column, message in SYNTAX_ERRORS:
+                with self.subTest(text=text):
+                    with open(path, "w") as f:
+                        f.write(text)
+                    with self.assertRaises(ParseError) as fast:
+                        parse_fast(path)
+                    self.assertEqual(
+                        (fast.exception.line, fast.exception.column), (line, column)
+                    )
+                    self.assertEqual(fast.exception.message, message)
+                    # Same position as the reference; its wording differs
+                    with self.assertRaises(ParseError) as antlr:
+                        parse_antlr(path)
+                    self.assertEqual(
+                        (antlr.exception.line, antlr.exception.column), (line, column)
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import itertools
+import random
+import unittest
+
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.fast_parser import parse
+from obfuscator.fingerprint import fingerprint
+from benchmarks.bench_children import PASSES
+from benchmarks.common import generate_program
+
+
+def snapshot(program):
+    """The fingerprint and generated code of each function."""
+    return [
+        (fingerprint(f), CodeGenerator().generate(Program([f])))
+        for f in program.functions
+    ]
+
+
+class FingerprintTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        ControlFlowFlattener.id_counter = itertools.count()
+
+    def test_passes_invalidate(self):
+        program = parse(generate_program(10))
+        # The inliner first: nothing is simple enough to inline once flattened
+        for i, run in enumerate([PASSES[4], *PASSES[:4]]):
+            with self.subTest(i):
+                before = snapshot(program)  # Memoizes every fingerprint
+                run(program)
+                after = snapshot(program)
+                self.assertEqual(
+                    [fp for fp, _ in after],
+                    [fingerprint(f) for f in program.clone().functions],
+                )
+                self.assertNotEqual(before, after)
+                for (old_fp, old_code), (new_fp, new_code) in zip(before, after):
+                    self.assertEqual(old_fp == new_fp, old_code == new_code)
+
+    def test_edit_by_hand(self):
+        program = parse(generate_program(3))
+        func = program.functions[0]
+        before = fingerprint(func)
+        self.assertEqual(fingerprint(func), before)
+        invalidate(func)
+        func.body.insert(0, VariableDecl("int", "extra", Literal(1)))
+        self.assertNotEqual(fingerprint(func), before)
+        self.assertEqual(fingerprint(func), fingerprint(func.clone()))
+
+    def test_same_structure(self):
+        a, b = parse(generate_program(3)), parse(generate_program(3))
+        self.assertEqual(
+            [fingerprint(f) for f in a.functions], [fingerprint(f) for f in b.functions]
+        )
+        self.assertEqual(len({fingerprint(f) for f in a.functions}), len(a.functions))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from obfuscator.ast import Program
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.fast_parser import parse
+from obfuscator.flat_ast import FlatAST
+from obfuscator.function_filter import RawFunction
+from benchmarks.bench_deep_nesting import chain_program
+from benchmarks.common import generate_program
+
+
+class FlatASTTest(unittest.TestCase):
+    def assertRoundTrips(self, program):
+        flat = FlatAST.from_tree(program)
+        self.assertEqual(
+            CodeGenerator().generate(flat.to_tree()), CodeGenerator().generate(program)
+        )
+        return flat
+
+    def test_round_trip(self):
+        program = parse(generate_program(20))
+        ControlFlowFlattener().flatten(program)
+        flat = self.assertRoundTrips(program)
+        self.assertEqual(list(flat.walk()), list(range(len(flat))))
+
+    def test_deep_expression(self):
+        self.assertRoundTrips(parse(chain_program(3000)))
+
+    def test_unknown_values_are_rejected(self):
+        raw = RawFunction("f", "int f() { return 0; }", 0, 21)
+        with self.assertRaises(TypeError):
+            FlatAST.from_tree(Program([raw]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.fast_parser import parse
+from obfuscator.incremental import IncrementalParser
+from obfuscator.name_obfuscator import NameObfuscator
+from benchmarks.bench_deep_nesting import chain_program
+from benchmarks.common import generate_program
+
+
+class IncrementalParserTest(unittest.TestCase):
+    def assertSameCode(self, a, b):
+        self.assertEqual(CodeGenerator().generate(a), CodeGenerator().generate(b))
+
+    def test_matches_full_parse(self):
+        text = generate_program(20)
+        incremental = IncrementalParser()
+        self.assertSameCode(incremental.parse(text), parse(text))
+        edited = text.replace(
+            "int f10(int a, int b) {", "int f10(int a, int b) {\n    a = a + 1;", 1
+        )
+        self.assertSameCode(incremental.parse(edited), parse(edited))
+        self.assertEqual(incremental.parsed, 1)
+
+    def test_unchanged_definitions_are_shared(self):
+        text = generate_program(5)
+        incremental = IncrementalParser()
+        first = incremental.parse(text)
+        second = incremental.parse(text)
+        self.assertEqual(incremental.reused, len(second.functions))
+        for a, b in zip(first.functions, second.functions):
+            self.assertIs(a, b)
+
+    def test_changed_definitions_are_copies(self):
+        text = generate_program(5)
+        incremental = IncrementalParser()
+        first = incremental.parse(text)
+        NameObfuscator().obfuscate(first)
+        second = incremental.parse(text)
+        self.assertSameCode(second, parse(text))
+        for a, b in zip(first.functions, second.functions):
+            self.assertIsNot(a, b)
+            self.assertIsNot(a.body, b.body)
+
+    def test_repeated_definition_is_copied(self):
+        text = "int f() { return 1; }\n" * 2
+        incremental = IncrementalParser()
+        for _ in range(2):
+            a, b = incremental.parse(text).functions
+            self.assertIsNot(a, b)
+            self.assertIsNot(a.body, b.body)
+
+    def test_deep_expression(self):
+        text = chain_program(3000)
+        incremental = IncrementalParser()
+        incremental.parse(text)
+        self.assertSameCode(incremental.parse(text), parse(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.fast_parser import FastParser
+from obfuscator.name_obfuscator import NameObfuscator
+from obfuscator.token_rewriter import minify, rewrite_tokens
+from benchmarks.common import generate_program, input_files
+
+EDGE_CASES = """int g;
+
+int f(int a, int b) {
+    int i;
+    for (i = 0; i < b; i = i + 1) a = a + i;
+    while (a > 10) a = a - b;
+    if (a) b = (a = b) + 1; else { int c = a; b = c; }
+    switch (a) {
+    case 1:
+        b = f(a = 2, b);
+    case 2: {
+        int d = b;
+        b = d + g;
+    }
+    default:
+        b = 0;
+    }
+    scanf("%d", &b);
+    return b;
+}
+
+int main() {
+    int x = f(1, 2);
+    printf("%d\\n", x);
+    return 0;
+}
+"""
+
+
+def rename_ast(text: str, minified: bool = False) -> str:
+    random.seed(0)
+    program = FastParser(text).parse()
+    NameObfuscator().obfuscate(program)
+    code = CodeGenerator().generate(program)
+    return minify(code) if minified else code
+
+
+def rename_tokens(text: str, minified: bool = False) -> str:
+    random.seed(0)
+    return rewrite_tokens(text, minify=minified)
+
+
+class TokenRenamerTest(unittest.TestCase):
+    """The token path must rename exactly like NameObfuscator: its output,
+    parsed and regenerated, equals the AST path's output."""
+
+    def assertConforms(self, text):
+        reference = rename_ast(text)
+        for minified in (False, True):
+            with self.subTest(minified=minified):
+                program = FastParser(rename_tokens(text, minified)).parse()
+                self.assertEqual(CodeGenerator().generate(program), reference)
+
+    def test_inputs(self):
+        for path in input_files():
+            with self.subTest(path=path), open(path, encoding="utf-8") as f:
+                self.assertConforms(f.read())
+
+    def test_generated_program(self):
+        random.seed(0)
+        self.assertConforms(generate_program(50))
+
+    def test_edge_cases(self):
+        self.assertConforms(EDGE_CASES)
+
+    def test_assignment_targets_are_renamed(self):
+        text = "int main() {\n    int i = 0;\n    i = i + 1;\n    return i;\n}\n"
+        renamed = rename_tokens(text)
+        self.assertNotIn("i =", renamed)
+        self.assertNotIn(" i;", renamed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import itertools
+import random
+import sys
+import unittest
+from collections import Counter
+
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.fast_parser import parse
+from benchmarks.bench_children import (
+    PASSES,
+    BinaryOpCopier,
+    Collector,
+    declarations_ok,
+    postorder_ok,
+)
+from benchmarks.bench_deep_nesting import chain_program
+from benchmarks.common import generate_program
+
+
+def transformed_program():
+    random.seed(0)
+    ControlFlowFlattener.id_counter = itertools.count()
+    program = parse(generate_program(5))
+    for run in PASSES:
+        run(program)
+    return program
+
+
+class VisitorTest(unittest.TestCase):
+    def test_generic_visit_reaches_every_node(self):
+        program = transformed_program()
+        collector = Collector()
+        collector.visit(program)
+        expected = []
+        stack = [program]
+        while stack:
+            node = stack.pop()
+            expected.append(node)
+            stack.extend(reversed(list(iter_children(node))))
+        self.assertEqual(collector.seen, expected)
+        kinds = Counter(type(node) for node in collector.seen)
+        for cls in (Switch, SwitchCase, Label, Goto):
+            self.assertTrue(kinds[cls], cls.__name__)
+
+    def test_child_fields_are_declared(self):
+        self.assertTrue(declarations_ok([transformed_program()]))
+
+    def test_rewrite_order(self):
+        self.assertTrue(postorder_ok(transformed_program()))
+
+    def test_rewrite_a_deep_chain(self):
+        program = parse(chain_program(sys.getrecursionlimit() * 3))
+        before = CodeGenerator().generate(program)
+        old = program.functions[0].body[-1].value
+        rewritten = BinaryOpCopier().visit(program)
+        self.assertIs(rewritten, program)
+        new = rewritten.functions[0].body[-1].value
+        self.assertIsInstance(new, BinaryOp)
+        self.assertIsNot(new, old)
+        self.assertEqual(CodeGenerator().generate(rewritten), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import itertools
+import unittest
+
+from obfuscator import wire
+from obfuscator.ast import *
+from obfuscator.code_generator import CodeGenerator
+from obfuscator.control_flattening import ControlFlowFlattener
+from obfuscator.fast_parser import parse
+from obfuscator.fingerprint import fingerprint
+from benchmarks.bench_deep_nesting import chain_program
+from benchmarks.common import generate_program, input_files
+
+
+class WireTest(unittest.TestCase):
+    def assertRoundTrips(self, program):
+        decoded = wire.loads(wire.dumps(program))
+        self.assertEqual(
+            CodeGenerator().generate(decoded), CodeGenerator().generate(program)
+        )
+        self.assertEqual(
+            [fingerprint(f) for f in decoded.functions],
+            [fingerprint(f) for f in program.functions],
+        )
+        return decoded
+
+    def test_inputs(self):
+        for path in input_files():
+            with self.subTest(path=path):
+                with open(path) as f:
+                    program = parse(f.read())
+                self.assertRoundTrips(program)
+                ControlFlowFlattener.id_counter = itertools.count()
+                ControlFlowFlattener().flatten(program)
+                self.assertRoundTrips(program)
+
+    def test_deep_expression(self):
+        self.assertRoundTrips(parse(chain_program(3000)))
+
+    def test_values(self):
+        body = [
+            VariableDecl("int", "n", Literal(-(2**40))),
+            VariableDecl("bool", "t", Literal(True)),
+            VariableDecl("int", "z", None),
+            Assignment("n", BinaryOp("+", Literal(0), Literal(2**70))),
+            Print('"h\\u00e9llo %d\\n"', [Variable("n")]),
+            Scan('"%d"', ["&n"]),
+            Return(None),
+        ]
+        # Enough constants that segments need wider codes
+        functions = [Function("int", f"g{i}", [], body) for i in range(300)]
+        self.assertRoundTrips(Program(functions))
+
+    def test_lazy_function(self):
+        program = parse(generate_program(20))
+        encoded = wire.WireProgram(wire.dumps(program))
+        self.assertEqual(encoded.names, [f.name for f in program.functions])
+        function = encoded.function("f10")
+        self.assertEqual(fingerprint(function), fingerprint(program.functions[10]))
+        # Each access decodes a new tree, sharing the leaves
+        again = encoded[10]
+        self.assertIsNot(again, function)
+        self.assertIs(again.body[-1].value.args[0], function.body[-1].value.args[0])
+
+    def test_shared_nodes_stay_shared(self):
+        program = parse(generate_program(3))
+        ControlFlowFlattener().flatten(program)
+        func = wire.loads(wire.dumps(program)).functions[-1]
+        switch = next(s for s in func.body if isinstance(s, Switch))
+        labels = {id(s) for s in func.body if isinstance(s, Label)}
+        labels |= {id(s) for b in func.body if isinstance(b, Block) for s in b.items}
+        for case in switch.cases:
+            self.assertIn(id(case.label), labels)
+
+    def test_bad_data_is_rejected(self):
+        data = wire.dumps(parse(generate_program(3)))
+        newer = wire.MAGIC + bytes([wire.WIRE_VERSION + 1]) + data[5:]
+        for bad in (data[:-3], data[:20], newer, b"not wire"):
+            with self.assertRaises(ValueError):
+                wire.loads(bad)
+
+
+if __name__ == "__main__":
+    unittest.main()